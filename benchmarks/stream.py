@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import os
+import sys
+import csv
+import time
+import tempfile
+from tabulator import Stream, config
+
+
+# Prepare source
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+path = os.path.join(tempfile.mkdtemp(), 'benchmark.csv')
+with io.open(path, 'w', encoding='utf-8') as file:
+    file.write('id,name,value,comment\n')
+    for number in range(ROWS):
+        file.write('%s,name%s,%s.5,"comment, %s"\n' % (number, number, number, number))
+
+
+# Run benchmarks
+
+def benchmark(title, function, repeat=3):
+    elapsed = None
+    for _ in range(repeat):
+        start = time.time()
+        count = function()
+        elapsed = min(elapsed or float('inf'), time.time() - start)
+    assert count == ROWS
+    results.append((title, elapsed))
+    print('%-40s %8.3fs %12.0f rows/s' % (title, elapsed, count / elapsed))
+
+
+def raw_csv_reader():
+    with io.open(path, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        next(reader)
+        return sum(1 for row in reader)
+
+
+def stream_iter(**options):
+    def function():
+        with Stream(path, headers=1, **options) as stream:
+            return sum(1 for row in stream.iter())
+    return function
+
+
+def stream_iter_batches(**options):
+    def function():
+        with Stream(path, headers=1, **options) as stream:
+            return sum(len(batch) for batch in stream.iter_batches())
+    return function
+
+
+results = []
+print('Reading %s rows:' % ROWS)
+benchmark('csv.reader', raw_csv_reader)
+benchmark('Stream.iter', stream_iter())
+benchmark('Stream.iter_batches', stream_iter_batches())
+benchmark('Stream.iter (skip_fields)', stream_iter(skip_fields=['comment']))
+benchmark('Stream.iter (skip_rows)', stream_iter(skip_rows=['#']))
+benchmark('Stream.iter (limit_rows)', stream_iter(limit_rows=ROWS))
+benchmark('Stream.iter (read_ahead)', stream_iter(read_ahead=4))
+# Split the source into 8 ranges at least (it's parsed serially on a single CPU)
+config.CSV_PARALLEL_CHUNK_SIZE = min(config.CSV_PARALLEL_CHUNK_SIZE, os.path.getsize(path) // 8)
+benchmark('Stream.iter (workers=4)', stream_iter(workers=4))
+baseline = results[0][1]
+print('\nSlowdown comparing to csv.reader:')
+for title, elapsed in results[1:]:
+    print('%-40s %8.2fx' % (title, elapsed / baseline))
+os.remove(path)
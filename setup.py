@@ -26,6 +26,7 @@ INSTALL_REQUIRES = [
     'requests>=2.8',
     'chardet>=3.0',
     'boto3>=1.9',
+    'futures>=3.0; python_version < "3.0"',
     # Format: csv
     'unicodecsv>=0.14',
     # Format: json
@@ -54,6 +55,9 @@ INSTALL_PARSER_HTML_REQUIRES = [
 INSTALL_CCHARDET_REQUIRES = [
     'cchardet>=2.0',
 ]
+INSTALL_ORJSON_REQUIRES = [
+    'orjson>=3.3; python_version >= "3.6"',
+]
 TESTS_REQUIRE = [
     'mock',
     'pylama',
@@ -80,6 +84,7 @@ setup(
         'ods': INSTALL_FORMAT_ODS_REQUIRES,
         'html': INSTALL_PARSER_HTML_REQUIRES,
         'cchardet': INSTALL_CCHARDET_REQUIRES,
+        'orjson': INSTALL_ORJSON_REQUIRES,
     },
     entry_points={
         'console_scripts': [
@@ -3,28 +3,76 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+import sys
+from importlib import import_module
 from . import config
 __version__ = config.VERSION
 
 
 # Module API
 
-from .cli import cli
-from .stream import Stream
-from .loader import Loader
-from .parser import Parser
-from .writer import Writer
-from .validate import validate
-from .exceptions import TabulatorException
-from .exceptions import SourceError
-from .exceptions import SchemeError
-from .exceptions import FormatError
-from .exceptions import EncodingError
-from .exceptions import CompressionError
-
-# Deprecated
-
-from . import exceptions
-from .exceptions import IOError
-from .exceptions import LoadingError
-from .exceptions import HTTPError
+_ATTRIBUTES = {
+    'cli': 'cli',
+    'Stream': 'stream',
+    'MultiStream': 'multistream',
+    'AsyncStream': 'asyncstream',
+    'HTTPCache': 'httpcache',
+    'Loader': 'loader',
+    'Parser': 'parser',
+    'Writer': 'writer',
+    'validate': 'validate',
+    'exceptions': None,
+    'TabulatorException': 'exceptions',
+    'SourceError': 'exceptions',
+    'SchemeError': 'exceptions',
+    'FormatError': 'exceptions',
+    'EncodingError': 'exceptions',
+    'CompressionError': 'exceptions',
+    # Deprecated
+    'IOError': 'exceptions',
+    'LoadingError': 'exceptions',
+    'HTTPError': 'exceptions',
+}
+if sys.version_info < (3, 5):
+    del _ATTRIBUTES['AsyncStream']
+__all__ = sorted(_ATTRIBUTES)
+
+
+# Public names are imported on first access (PEP 562) to reduce
+# tabulator import time e.g. the CLI's click or AsyncStream's asyncio
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name not in _ATTRIBUTES:
+            message = 'module %r has no attribute %r' % (__name__, name)
+            raise AttributeError(message)
+        module = import_module('.' + (_ATTRIBUTES[name] or name), __name__)
+        value = module if _ATTRIBUTES[name] is None else getattr(module, name)
+        # Public names shadow the modules of the same name (cli/validate)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_ATTRIBUTES))
+
+else:
+    from .cli import cli
+    from .stream import Stream
+    from .multistream import MultiStream
+    if sys.version_info >= (3, 5):
+        from .asyncstream import AsyncStream
+    from .httpcache import HTTPCache
+    from .loader import Loader
+    from .parser import Parser
+    from .writer import Writer
+    from .validate import validate
+    from . import exceptions
+    from .exceptions import TabulatorException
+    from .exceptions import SourceError
+    from .exceptions import SchemeError
+    from .exceptions import FormatError
+    from .exceptions import EncodingError
+    from .exceptions import CompressionError
+    from .exceptions import IOError
+    from .exceptions import LoadingError
+    from .exceptions import HTTPError
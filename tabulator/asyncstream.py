@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from .stream import Stream
+from . import config
+
+
+# Module API
+
+class AsyncStream(object):
+    """Asyncio interface to `Stream` (Python 3.5+ only).
+
+    ```python
+    from tabulator import AsyncStream
+
+    async with AsyncStream('data.csv', headers=1) as stream:
+        async for row in stream:
+            print(row)
+    ```
+
+    All the blocking work (loading, decoding, parsing and processing) is done
+    in an executor in batches of rows so the event loop is not blocked.
+    The calls are made one by one (awaiting them concurrently is safe) and
+    by default in a single thread owned by the stream as some parsers can't
+    be used in another thread than the one which opened them (e.g. `sql`).
+
+    Loaders are not asynchronous: file, HTTP and S3 reads are blocking
+    calls made in the executor's thread together with parsing. A shared
+    executor bounds the number of streams reading at the same time
+    but it should have a single worker for the `sql` format.
+
+    # Arguments
+        source (Any): Source of data (see `Stream`).
+        executor (concurrent.futures.Executor, optional):
+            Executor to run the blocking work in.
+            Defaults to a single thread executor of the stream.
+        batch_size (int, optional):
+            Number of rows processed in the executor at once.
+            Defaults to ``config.DEFAULT_BATCH_SIZE``.
+        **options (Any, optional): Options passed to `Stream`.
+
+    """
+
+    # Public
+
+    def __init__(self, source, executor=None, batch_size=config.DEFAULT_BATCH_SIZE, **options):
+        self.__stream = Stream(source, **options)
+        self.__executor = executor
+        self.__own_executor = None
+        self.__lock = None
+        self.__batch_size = batch_size
+
+    async def __aenter__(self):
+        if self.closed:
+            await self.open()
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        if not self.closed:
+            await self.close()
+
+    def __aiter__(self):
+        return self.iter()
+
+    @property
+    def closed(self):
+        """Returns True if the underlying stream is closed, False otherwise.
+
+        # Returns
+            bool: whether closed
+
+        """
+        return self.__stream.closed
+
+    @property
+    def source(self):
+        """Source
+
+        # Returns
+            any: stream source
+
+        """
+        return self.__stream.source
+
+    @property
+    def headers(self):
+        """Headers
+
+        # Returns
+            str[]/None: headers if available
+
+        """
+        return self.__stream.headers
+
+    @property
+    def scheme(self):
+        """Path's scheme
+
+        # Returns
+            str: scheme
+
+        """
+        return self.__stream.scheme
+
+    @property
+    def format(self):
+        """Path's format
+
+        # Returns
+            str: format
+
+        """
+        return self.__stream.format
+
+    @property
+    def encoding(self):
+        """Stream's encoding
+
+        # Returns
+            str: encoding
+
+        """
+        return self.__stream.encoding
+
+    @property
+    def sample(self):
+        """Returns the stream's rows used as sample.
+
+        # Returns
+            list[]: sample
+
+        """
+        return self.__stream.sample
+
+    async def open(self):
+        """Opens the stream for reading (see `Stream.open`).
+        """
+        await self.__run(self.__stream.open)
+        return self
+
+    async def close(self):
+        """Closes the stream.
+        """
+        await self.__run(self.__stream.close)
+        if self.__own_executor is not None:
+            self.__own_executor.shutdown(wait=False)
+            self.__own_executor = None
+
+    async def reset(self):
+        """Resets the stream pointer to the beginning of the file.
+        """
+        await self.__run(self.__stream.reset)
+
+    def iter(self, keyed=False, extended=False):
+        """Iterate over the rows asynchronously.
+
+        # Arguments
+            keyed (bool, optional): See :func:`Stream.iter`.
+            extended (bool, optional): See :func:`Stream.iter`.
+
+        # Returns
+            AsyncIterator[Union[List[Any], Dict[str, Any], Tuple[int, List[str], List[Any]]]]:
+                The row itself. The format depends on the values of `keyed`
+                and `extended` arguments.
+
+        """
+        return _AsyncRows(self.iter_batches(keyed=keyed, extended=extended))
+
+    def iter_batches(self, size=None, keyed=False, extended=False):
+        """Iterate over the rows in batches asynchronously.
+
+        Every batch is read and processed in the executor.
+
+        # Arguments
+            size (int, optional):
+                Maximum number of rows in a batch.
+                Defaults to the stream's `batch_size`.
+            keyed (bool, optional): See :func:`Stream.iter`.
+            extended (bool, optional): See :func:`Stream.iter`.
+
+        # Returns
+            AsyncIterator[List[Union[List[Any], Dict[str, Any], Tuple[int, List[str], List[Any]]]]]:
+                Lists of rows.
+
+        """
+        batches = self.__stream.iter_batches(
+            size=size or self.__batch_size, keyed=keyed, extended=extended)
+        return _AsyncBatches(batches, self.__run)
+
+    async def read(self, keyed=False, extended=False, limit=None):
+        """Returns a list of rows.
+
+        # Arguments
+            keyed (bool, optional): See :func:`Stream.iter`.
+            extended (bool, optional): See :func:`Stream.iter`.
+            limit (int, optional):
+                Number of rows to return. If None, returns all rows. Defaults to None.
+
+        # Returns
+            List[Union[List[Any], Dict[str, Any], Tuple[int, List[str], List[Any]]]]:
+                The list of rows. The format depends on the values of `keyed`
+                and `extended` arguments.
+
+        """
+        result = []
+        size = min(limit, self.__batch_size) if limit else None
+        batches = self.iter_batches(size=size, keyed=keyed, extended=extended)
+        async for batch in batches:
+            result.extend(batch)
+            if limit and len(result) >= limit:
+                del result[limit:]
+                break
+        return result
+
+    async def save(self, target, format=None, encoding=None, **options):
+        """Save stream to the local filesystem (see `Stream.save`).
+
+        # Returns
+            count (int?): Written rows count if available
+
+        """
+        save = partial(self.__stream.save, target,
+            format=format, encoding=encoding, **options)
+        return await self.__run(save)
+
+    # Private
+
+    async def __run(self, function, *args):
+        # The lock is created here to be bound to the running loop
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+        executor = self.__executor
+        if executor is None:
+            if self.__own_executor is None:
+                self.__own_executor = ThreadPoolExecutor(max_workers=1)
+            executor = self.__own_executor
+        async with self.__lock:
+            loop = _get_running_loop()
+            return await loop.run_in_executor(executor, function, *args)
+
+
+# Internal
+
+# Python 3.7+ (getting the event loop inside a coroutine is deprecated)
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+class _AsyncBatches(object):
+
+    # Public
+
+    def __init__(self, batches, run):
+        self.__batches = batches
+        self.__run = run
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        batch = await self.__run(next, self.__batches, None)
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
+
+
+class _AsyncRows(object):
+
+    # Public
+
+    def __init__(self, batches):
+        self.__batches = batches
+        self.__rows = iter([])
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            try:
+                return next(self.__rows)
+            except StopIteration:
+                self.__rows = iter(await self.__batches.__anext__())
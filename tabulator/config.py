@@ -15,18 +15,53 @@ DEFAULT_SCHEME = 'file'
 DEFAULT_ENCODING = 'utf-8'
 DEFAULT_SAMPLE_SIZE = 100
 DEFAULT_BYTES_SAMPLE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 1000
+ROW_SYNCS_CACHE_SIZE = 1000
+DEFAULT_INDEX_EVERY = 10000
+DEFAULT_PREFETCH = 2
+# Seconds to wait for a consumer before checking if reading ahead is stopped
+READ_AHEAD_TIMEOUT = 0.1
+INDEX_SUFFIX = '.index.json'
 SUPPORTED_COMPRESSION = ['zip', 'gz']
+# Formats needing random access to a zip member (it's copied to a temporary file)
+ZIP_SPOOLED_FORMATS = ['xlsx']
+ZIP_SPOOL_CHUNK_SIZE = 1024 * 1024
 SUPPORTED_HASHING_ALGORITHMS = ['md5', 'sha1', 'sha256', 'sha512']
 ENCODING_CONFIDENCE = 0.5
+ENCODING_CACHE_SIZE = 1000
 HTTP_HEADERS = {
-  'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_6) ' +
-                'AppleWebKit/537.36 (KHTML, like Gecko) ' +
-                'Chrome/54.0.2840.87 Safari/537.36'
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_6) ' +
+                  'AppleWebKit/537.36 (KHTML, like Gecko) ' +
+                  'Chrome/54.0.2840.87 Safari/537.36'
 }
+HTTP_POOL_SIZE = 10
+HTTP_KEEP_ALIVE = True
+HTTP_MAX_RETRIES = 0
+HTTP_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+HTTP_CACHE_CHUNK_SIZE = 64 * 1024
+# Size of ranges downloaded concurrently (smaller files are not split)
+HTTP_PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
 CSV_SAMPLE_LINES = 100
+# Options defining a dialect completely so it's not sniffed
+CSV_DIALECT_OPTIONS = ['delimiter', 'doublequote', 'quotechar', 'skipinitialspace']
+CSV_PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024
+# Encodings where a newline byte can't be a part of another character
+CSV_PARALLEL_ENCODINGS = [
+    'ascii', 'utf-8', 'utf-8-sig', 'iso8859-1', 'iso8859-15',
+    'cp1250', 'cp1251', 'cp1252', 'cp1253', 'cp1254', 'cp1257',
+]
 # http://docs.sqlalchemy.org/en/latest/dialects/index.html
 SQL_SCHEMES = ['firebird', 'mssql', 'mysql', 'oracle', 'postgresql', 'sqlite', 'sybase']
 S3_DEFAULT_ENDPOINT_URL = 'https://s3.amazonaws.com'
+# Size of byte ranges requested from S3 (two of them are kept in memory)
+S3_CHUNK_SIZE = 8 * 1024 * 1024
+# Maximum number of connections kept by an S3 client
+# and threads making S3 requests in background
+S3_POOL_SIZE = 32
+# Size of parts uploaded to S3 by `Stream.save` (the minimum allowed by S3 is 5 MiB)
+S3_PART_SIZE = 8 * 1024 * 1024
+# Maximum number of parts uploaded concurrently (and kept in memory)
+S3_UPLOAD_WORKERS = 4
 
 # Loaders
 
@@ -64,6 +99,8 @@ PARSERS = {
 WRITERS = {
     'csv': 'tabulator.writers.csv.CSVWriter',
     'json': 'tabulator.writers.json.JSONWriter',
+    'jsonl': 'tabulator.writers.ndjson.NDJSONWriter',
+    'ndjson': 'tabulator.writers.ndjson.NDJSONWriter',
     'xlsx': 'tabulator.writers.xlsx.XLSXWriter',
     'sql': 'tabulator.writers.sql.SQLWriter',
 }
@@ -4,12 +4,22 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
 import os
 import re
 import six
+import math
 import codecs
+import decimal
+import datetime
 import hashlib
+import threading
 from copy import copy
+from contextlib import contextmanager
+from collections import OrderedDict
+from array import array
+from operator import itemgetter
+from itertools import islice
 from importlib import import_module
 from six.moves.urllib.parse import parse_qs, urlparse, urlunparse
 from . import exceptions
@@ -69,14 +79,38 @@ def detect_scheme_and_format(source):
 # TODO: consider merging cp1252/iso8859-1
 def detect_encoding(sample, encoding=None):
     """Detect encoding of a byte string sample.
+
+    A sample which is valid UTF-8 (or ASCII) is not passed to the statistical
+    detector. Results of the detector are cached by the sample's hash.
+    See `encoding_stats` for counts of the used methods.
+
     """
+
+    # Encoding is given
+    if encoding is not None:
+        _count_encoding_method('given')
+        return normalize_encoding(sample, encoding)
+
+    # UTF-8 fast path
+    if _is_utf8(sample):
+        _count_encoding_method('fast_path')
+        return normalize_encoding(sample, config.DEFAULT_ENCODING)
+
+    # Cached detection
+    key = hashlib.md5(sample).hexdigest()
+    with _ENCODING_LOCK:
+        encoding = _ENCODING_CACHE.pop(key, None)
+        if encoding is not None:
+            _ENCODING_CACHE[key] = encoding
+            _ENCODING_STATS['cache'] += 1
+            return encoding
+
     # To reduce tabulator import time
     try:
         from cchardet import detect
     except ImportError:
         from chardet import detect
-    if encoding is not None:
-        return normalize_encoding(sample, encoding)
+    _count_encoding_method('detector')
     result = detect(sample)
     confidence = result['confidence'] or 0
     encoding = result['encoding'] or 'ascii'
@@ -85,9 +119,37 @@ def detect_encoding(sample, encoding=None):
         encoding = config.DEFAULT_ENCODING
     if encoding == 'ascii':
         encoding = config.DEFAULT_ENCODING
+
+    # Cache detection
+    with _ENCODING_LOCK:
+        _ENCODING_CACHE[key] = encoding
+        while len(_ENCODING_CACHE) > config.ENCODING_CACHE_SIZE:
+            _ENCODING_CACHE.popitem(last=False)
+
     return encoding
 
 
+def encoding_stats(reset=False):
+    """Return counts of encoding detections by the used method.
+
+    Methods are `given` (an encoding is provided), `fast_path` (a sample is
+    valid UTF-8), `cache` and `detector` (chardet/cchardet is called).
+
+    # Arguments
+        reset (bool): Reset the counts after returning them.
+
+    # Returns
+        dict: Counts by method
+
+    """
+    with _ENCODING_LOCK:
+        stats = dict(_ENCODING_STATS)
+        if reset:
+            for method in _ENCODING_STATS:
+                _ENCODING_STATS[method] = 0
+    return stats
+
+
 def normalize_encoding(sample, encoding):
     """Normalize encoding including 'utf-8-sig', 'utf-16-be', utf-16-le tweaks.
     """
@@ -132,6 +194,27 @@ def reset_stream(stream):
             raise exceptions.TabulatorException(message)
 
 
+def tell_stream(stream):
+    """Return stream position or None if it's not available.
+    """
+    try:
+        return stream.tell()
+    except Exception:
+        return None
+
+
+def iter_lines(chars, positions=False):
+    """Iterate over lines of a text stream.
+
+    Iterating over a file disables its `tell` so if `positions` are needed
+    the lines are read using `readline` which is a bit slower.
+
+    """
+    if positions:
+        return iter(chars.readline, '')
+    return iter(chars)
+
+
 def ensure_dir(path):
     """Ensure path directory exists.
     """
@@ -140,6 +223,48 @@ def ensure_dir(path):
         os.makedirs(dirpath)
 
 
+@contextmanager
+def open_target(target):
+    """Open a local path for writing bytes or use a file-like target as it is.
+
+    A file-like target is flushed but not closed.
+
+    """
+    if hasattr(target, 'write'):
+        yield target
+        target.flush()
+        return
+    ensure_dir(target)
+    with io.open(target, 'wb') as file:
+        yield file
+
+
+def get_json_encoder(indent=None):
+    """Return a function encoding a value to compact UTF-8 JSON bytes.
+
+    `orjson` or `ujson` is used if installed (`pip install tabulator[orjson]`)
+    otherwise the standard `json` module. All of them write dates and times
+    in ISO 8601 format, decimals as numbers (converted to `float`) and NaN
+    or infinite numbers as `null` (not as `NaN`/`Infinity` like `json.dumps`)
+    so the output doesn't depend on the installed library.
+
+    # Arguments
+        indent (int, optional):
+            indent the output as `json.dumps(value, indent=indent)`
+            (the standard `json` module is always used)
+
+    # Returns
+        func: encoder
+
+    """
+    global _JSON_ENCODER
+    if indent is not None:
+        return _make_json_encoder(indent=indent)
+    if _JSON_ENCODER is None:
+        _JSON_ENCODER = _import_json_encoder()
+    return _JSON_ENCODER
+
+
 def requote_uri(uri):
     """Requote uri if it contains non-ascii chars, spaces etc.
     """
@@ -161,9 +286,12 @@ def requote_uri(uri):
 def import_attribute(path):
     """Import attribute by path like `package.module.attribute`
     """
-    module_name, attribute_name = path.rsplit('.', 1)
-    module = import_module(module_name)
-    attribute = getattr(module, attribute_name)
+    attribute = _IMPORTED_ATTRIBUTES.get(path)
+    if attribute is None:
+        module_name, attribute_name = path.rsplit('.', 1)
+        module = import_module(module_name)
+        attribute = getattr(module, attribute_name)
+        _IMPORTED_ATTRIBUTES[path] = attribute
     return attribute
 
 
@@ -178,6 +306,54 @@ def extract_options(options, names):
     return result
 
 
+def make_batches(iterator, size):
+    """Split an iterator into lists of at most `size` items.
+    """
+    iterator = iter(iterator)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            break
+        yield batch
+
+
+def make_getter(indexes):
+    """Return a function getting values by indexes from a row as a list.
+    """
+    if not indexes:
+        return lambda row: []
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda row: [row[index]]
+    start, stop = indexes[0], indexes[-1] + 1
+    if indexes == list(range(start, stop)):
+        # Slicing a list is the fastest but a row could be e.g. a tuple
+        return lambda row: row[start:stop] if row.__class__ is list else list(row[start:stop])
+    getter = itemgetter(*indexes)
+    return lambda row: list(getter(row))
+
+
+def make_keyed_projection(source_headers, target_headers):
+    """Return a function reordering a row from source to target headers.
+
+    Values of target headers missing in source headers are `None`.
+
+    """
+    positions = dict((header, index) for index, header in enumerate(source_headers))
+    indexes = [positions.get(header) for header in target_headers]
+    if None in indexes:
+        getter = None
+    else:
+        getter = make_getter(indexes)
+    size = len(source_headers)
+    def projection(row):
+        if getter is not None and len(row) >= size:
+            return getter(row)
+        keyed_row = dict(zip(source_headers, row))
+        return [keyed_row.get(header) for header in target_headers]
+    return projection
+
+
 def stringify_value(value):
     """Convert any value to string.
     """
@@ -217,3 +393,312 @@ class BytesStatsWrapper(object):
         self.__stats['size'] += len(chunk)
         self.__stats['hash'] = self.__hasher.hexdigest()
         return chunk
+
+
+class ColumnBuffer(object):
+    """This class is intended to be used as
+
+    buffer = ColumnBuffer()
+    buffer.extend([1, 2, 3])
+    column = buffer.finalize()
+
+    Integer and float values are stored in a compact `array.array` while
+    any other values switch the buffer to a plain list. On finalizing,
+    numeric columns are converted to NumPy arrays if NumPy is installed.
+
+    """
+
+    # Long long is not available in Python2 arrays
+    INTEGER_TYPECODE = 'q' if six.PY3 else 'l'
+
+    def __init__(self):
+        self.__values = []
+        self.__typecode = None
+
+    def __len__(self):
+        return len(self.__values)
+
+    def extend(self, values):
+        types = set(map(type, values))
+        if not types:
+            return
+        if self.__typecode != 'list':
+            typecode = 'list'
+            if types <= set([int]) and self.__typecode != 'd':
+                typecode = self.INTEGER_TYPECODE
+            elif types <= set([int, float]):
+                typecode = 'd'
+            if typecode != self.__typecode:
+                self.__convert(typecode)
+        length = len(self.__values)
+        try:
+            self.__values.extend(values)
+        except OverflowError:
+            del self.__values[length:]
+            self.__convert('list')
+            self.__values.extend(values)
+
+    def finalize(self):
+        if self.__typecode in (None, 'list'):
+            return self.__values
+        try:
+            import numpy
+        except ImportError:
+            return self.__values
+        return numpy.frombuffer(self.__values, dtype=self.__values.typecode)
+
+    # Private
+
+    def __convert(self, typecode):
+        if typecode == 'list':
+            self.__values = list(self.__values)
+        else:
+            self.__values = array(typecode, self.__values)
+        self.__typecode = typecode
+
+
+class RangedFile(object):
+    """Seekable file-like object downloading byte ranges concurrently.
+
+    Ranges of `chunk_size` bytes are downloaded in order by `workers` tasks
+    of the executor to a temporary file. Reading waits only for the bytes it needs
+    so it starts before the download is finished and seeking never downloads
+    bytes again. Closing the file cancels the not started tasks and the running
+    ones stop after the current read.
+
+    # Arguments
+        size (int): size of the file in bytes
+        open_range (func):
+            function getting `start` and `end` (exclusive) of a range
+            and returning a readable file-like object with its bytes
+        workers (int): number of concurrent downloads
+        chunk_size (int): size of ranges in bytes
+        executor (concurrent.futures.Executor): executor running the downloads
+
+    """
+
+    # Public
+
+    def __init__(self, size, open_range, workers, chunk_size, executor):
+        # To reduce tabulator import time
+        import tempfile
+        self.__size = size
+        self.__open_range = open_range
+        self.__chunk_size = chunk_size
+        self.__condition = threading.Condition()
+        self.__ends = list(range(0, size, chunk_size))
+        self.__next_index = 0
+        self.__position = 0
+        self.__error = None
+        self.__file = tempfile.TemporaryFile(prefix='tabulator-')
+        self.__closed = False
+        self.__futures = [executor.submit(self.__download)
+            for _ in range(min(workers, len(self.__ends)))]
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def seekable(self):
+        return True
+
+    @property
+    def closed(self):
+        return self.__closed
+
+    def close(self):
+        with self.__condition:
+            if not self.__closed:
+                self.__closed = True
+                self.__file.close()
+                self.__condition.notify_all()
+        for future in self.__futures:
+            future.cancel()
+
+    def tell(self):
+        return self.__position
+
+    def flush(self):
+        pass
+
+    def read(self, size=None):
+        chunks = []
+        if size is None or size < 0:
+            size = self.__size
+        while size > 0:
+            chunk = self.read1(size)
+            if not chunk:
+                break
+            size -= len(chunk)
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def read1(self, size=None):
+        if size is None or size < 0:
+            size = self.__size
+        size = min(size, self.__size - self.__position)
+        if size <= 0:
+            return b''
+        index = self.__position // self.__chunk_size
+        with self.__condition:
+            while self.__ends[index] <= self.__position:
+                if self.__error is not None:
+                    raise self.__error
+                if self.__closed:
+                    raise ValueError('I/O operation on closed file.')
+                self.__condition.wait()
+            self.__file.seek(self.__position)
+            chunk = self.__file.read(min(size, self.__ends[index] - self.__position))
+        self.__position += len(chunk)
+        return chunk
+
+    def seek(self, offset, whence=0):
+        assert whence == 0
+        self.__position = min(offset, self.__size)
+        return self.__position
+
+    # Private
+
+    def __download(self):
+        while True:
+
+            # Get next range
+            with self.__condition:
+                if self.__closed or self.__error is not None:
+                    return
+                if self.__next_index >= len(self.__ends):
+                    return
+                index = self.__next_index
+                self.__next_index += 1
+            start = index * self.__chunk_size
+            end = min(start + self.__chunk_size, self.__size)
+
+            # Download range
+            try:
+                source = self.__open_range(start, end)
+                try:
+                    position = start
+                    while position < end:
+                        chunk = source.read(min(io.DEFAULT_BUFFER_SIZE, end - position))
+                        if not chunk:
+                            raise IOError('Incomplete range %s-%s' % (start, end))
+                        with self.__condition:
+                            if self.__closed:
+                                return
+                            self.__file.seek(position)
+                            self.__file.write(chunk)
+                            position += len(chunk)
+                            self.__ends[index] = position
+                            self.__condition.notify_all()
+                finally:
+                    source.close()
+            except Exception as exception:
+                with self.__condition:
+                    self.__error = exception
+                    self.__condition.notify_all()
+                return
+
+
+# Internal
+
+_IMPORTED_ATTRIBUTES = {}
+_ENCODING_LOCK = threading.Lock()
+_ENCODING_CACHE = OrderedDict()
+_ENCODING_STATS = {'given': 0, 'fast_path': 0, 'cache': 0, 'detector': 0}
+
+
+_JSON_ENCODER = None
+
+
+def _import_json_encoder():
+
+    # To reduce tabulator import time
+    try:
+        import orjson
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return lambda value: orjson.dumps(
+            value, default=_json_default, option=option)
+    except (ImportError, AttributeError):
+        pass
+    try:
+        import ujson
+
+        def dumps(value):
+            return ujson.dumps(value,
+                ensure_ascii=False, escape_forward_slashes=False,
+                default=_json_default, allow_nan=False).encode('utf-8')
+
+        # Older versions don't support `default` and `allow_nan`
+        dumps(None)
+        return _make_finite_encoder(dumps)
+    except (ImportError, TypeError):
+        pass
+    return _make_json_encoder()
+
+
+def _make_json_encoder(indent=None):
+
+    # To reduce tabulator import time
+    import json
+    options = {'indent': indent}
+    if indent is None:
+        options = {'ensure_ascii': False, 'separators': (',', ':')}
+
+    def dumps(value):
+        text = json.dumps(value, default=_json_default, allow_nan=False, **options)
+        if isinstance(text, six.text_type):
+            text = text.encode('utf-8')
+        return text
+
+    return _make_finite_encoder(dumps)
+
+
+def _make_finite_encoder(dumps):
+
+    # Encoders raise on NaN or infinite numbers and it's rare
+    # so values are only fixed for a second attempt
+    def encode(value):
+        try:
+            return dumps(value)
+        except (ValueError, OverflowError):
+            return dumps(_replace_non_finite(value))
+
+    return encode
+
+
+def _replace_non_finite(value):
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, _replace_non_finite(item)) for key, item in value.items())
+    if isinstance(value, (float, decimal.Decimal)):
+        if math.isnan(value) or math.isinf(value):
+            return None
+    return value
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return _replace_non_finite(float(value))
+    raise TypeError('Object of type %s is not JSON serializable' % type(value).__name__)
+
+
+def _count_encoding_method(method):
+    with _ENCODING_LOCK:
+        _ENCODING_STATS[method] += 1
+
+
+def _is_utf8(sample):
+    # Sample could be cut in the middle of a multibyte character.
+    # Null bytes are common for UTF-16/32 so they are left for the detector.
+    if b'\x00' in sample:
+        return False
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, False)
+    except UnicodeDecodeError:
+        return False
+    return True
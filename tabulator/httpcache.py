@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import os
+import six
+import json
+import hashlib
+import tempfile
+import threading
+from . import config
+
+
+# Module API
+
+class HTTPCache(object):
+    """On-disk cache of remote sources revalidated with conditional requests.
+
+    ```python
+    from tabulator import Stream, HTTPCache
+
+    cache = HTTPCache('.cache/tabulator', max_size=100 * 1024 * 1024)
+    with Stream('https://example.com/data.csv', http_cache=cache) as stream:
+        stream.read()
+    ```
+
+    A response having an `ETag` or `Last-Modified` header is stored on the disk.
+    Next time the source is requested with `If-None-Match`/`If-Modified-Since`
+    headers and a `304 Not Modified` response is served from the disk.
+    A downloaded response is written to the disk while it's being read so
+    parsing starts with the first bytes. It's stored only if it's read to the end
+    (a source closed before that is not cached).
+    When the cache exceeds `max_size`, the least recently used sources are removed.
+    The cache can be shared by threads and processes.
+
+    # Arguments
+        directory (str): Directory for the cached files (created if needed).
+        max_size (int, optional):
+            Maximum size of the cached files in bytes.
+            Defaults to ``config.HTTP_CACHE_MAX_SIZE``.
+
+    """
+
+    # Public
+
+    def __init__(self, directory, max_size=config.HTTP_CACHE_MAX_SIZE):
+        self.__directory = os.path.abspath(os.path.expanduser(directory))
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.__stats = {'hits': 0, 'misses': 0}
+        if not os.path.isdir(self.__directory):
+            try:
+                os.makedirs(self.__directory)
+            except OSError:
+                if not os.path.isdir(self.__directory):
+                    raise
+
+    @property
+    def directory(self):
+        """Directory of the cached files
+
+        # Returns
+            str: directory
+
+        """
+        return self.__directory
+
+    @property
+    def stats(self):
+        """Counts of sources served from the cache (hits) or downloaded (misses)
+
+        # Returns
+            dict: stats
+
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def open(self, url, session, timeout=None):
+        """Return a byte stream of the source downloading it only if changed.
+
+        # Arguments
+            url (str): source URL
+            session (requests.Session): session to send requests
+            timeout (int, optional): requests timeout
+
+        # Raises
+            requests.RequestException: if an HTTP error
+
+        # Returns
+            BinaryIO: seekable file with the source's content
+
+        """
+        path = os.path.join(self.__directory, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+        # Prepare conditional request
+        file = None
+        headers = {}
+        metadata = _read_metadata(path + '.json')
+        if metadata.get('url') == url:
+            try:
+                file = io.open(path, 'rb')
+            except IOError:
+                pass
+            else:
+                if metadata.get('etag'):
+                    headers['If-None-Match'] = metadata['etag']
+                if metadata.get('last_modified'):
+                    headers['If-Modified-Since'] = metadata['last_modified']
+
+        # Send request
+        try:
+            response = session.get(url, headers=headers, stream=True, timeout=timeout)
+        except Exception:
+            if file is not None:
+                file.close()
+            raise
+
+        # Not modified
+        try:
+            if file is not None and response.status_code == 304:
+                response.close()
+                with self.__lock:
+                    self.__stats['hits'] += 1
+                _touch(path)
+                return file
+            if file is not None:
+                file.close()
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with self.__lock:
+                self.__stats['misses'] += 1
+        except Exception:
+            response.close()
+            raise
+
+        # Not cacheable
+        metadata = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        if not metadata['etag'] and not metadata['last_modified']:
+            file = tempfile.TemporaryFile(prefix='tabulator-')
+            return _TeeFile(response, file)
+
+        # Store when it's read to the end
+        descriptor, temp = tempfile.mkstemp(prefix='.tmp-', dir=self.__directory)
+        file = io.open(descriptor, 'w+b')
+
+        def store():
+            _replace(temp, path)
+            _write_metadata(path + '.json', metadata)
+            self.__evict()
+
+        return _TeeFile(response, file, temp=temp, store=store)
+
+    def clear(self):
+        """Remove all the cached files.
+        """
+        with self.__lock:
+            for name, _, _ in self.__list_entries():
+                _remove(os.path.join(self.__directory, name))
+
+    # Private
+
+    def __list_entries(self):
+        entries = []
+        for name in os.listdir(self.__directory):
+            if name.startswith('.') or name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.__directory, name))
+            except OSError:
+                continue
+            entries.append((name, stat.st_size, stat.st_mtime))
+        return entries
+
+    def __evict(self):
+        with self.__lock:
+            entries = sorted(self.__list_entries(), key=lambda entry: entry[2])
+            size = sum(entry[1] for entry in entries)
+            for name, entry_size, _ in entries:
+                if size <= self.__max_size:
+                    break
+                _remove(os.path.join(self.__directory, name))
+                size -= entry_size
+
+
+# Internal
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+class _TeeFile(object):
+    """Seekable file-like object writing a response to a file while it's read.
+
+    Bytes behind the downloaded ones are read from the file and seeking
+    forward continues the download. When the response is read to the end,
+    `store` is called. If it's closed before that, the `temp` path is removed.
+
+    """
+
+    # Public
+
+    def __init__(self, response, file, temp=None, store=None):
+        self.__response = response
+        self.__file = file
+        self.__temp = temp
+        self.__store = store
+        self.__size = 0
+        self.__position = 0
+        self.__finished = False
+        self.__closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def seekable(self):
+        return True
+
+    @property
+    def closed(self):
+        return self.__closed
+
+    def close(self):
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__response.close()
+        self.__file.close()
+        if not self.__finished and self.__temp is not None:
+            _remove_file(self.__temp)
+
+    def tell(self):
+        return self.__position
+
+    def flush(self):
+        pass
+
+    def read(self, size=None):
+        if size is None or size < 0:
+            self.__download()
+            size = self.__size - self.__position
+        elif self.__position + size > self.__size:
+            self.__download(self.__position + size)
+        size = min(size, self.__size - self.__position)
+        if size <= 0:
+            return b''
+        self.__file.seek(self.__position)
+        chunk = self.__file.read(size)
+        self.__position += len(chunk)
+        return chunk
+
+    def read1(self, size=None):
+        return self.read(size)
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.__position
+        elif whence == 2:
+            self.__download()
+            offset += self.__size
+        if offset > self.__size:
+            self.__download(offset)
+        self.__position = offset
+        return self.__position
+
+    # Private
+
+    def __download(self, size=None):
+        while not self.__finished and (size is None or self.__size < size):
+            chunk = self.__response.raw.read(config.HTTP_CACHE_CHUNK_SIZE)
+            if not chunk:
+                self.__finish()
+                break
+            self.__file.seek(self.__size)
+            self.__file.write(chunk)
+            self.__size += len(chunk)
+
+    def __finish(self):
+        self.__finished = True
+        self.__response.close()
+        self.__file.flush()
+        if self.__store is not None:
+            try:
+                self.__store()
+            except OSError:
+                _remove_file(self.__temp)
+
+
+def _read_metadata(path):
+    try:
+        with io.open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except (IOError, ValueError):
+        return {}
+
+
+def _write_metadata(path, metadata):
+    descriptor, temp = tempfile.mkstemp(prefix='.tmp-', dir=os.path.dirname(path))
+    with io.open(descriptor, 'w', encoding='utf-8') as file:
+        file.write(six.text_type(json.dumps(metadata)))
+    _replace(temp, path)
+
+
+def _touch(path):
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def _remove(path):
+    for path in [path, path + '.json']:
+        _remove_file(path)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
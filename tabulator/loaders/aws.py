@@ -6,7 +6,12 @@ from __future__ import unicode_literals
 
 import os
 import io
+import re
 import boto3
+import fnmatch
+import hashlib
+import threading
+from timeit import default_timer
 from six.moves.urllib.parse import urlparse
 from ..loader import Loader
 from .. import exceptions
@@ -25,18 +30,35 @@ class AWSLoader(Loader):
     remote = True
     options = [
         's3_endpoint_url',
+        's3_spool',
+        's3_parallel',
     ]
 
     def __init__(self,
                  bytes_sample_size=config.DEFAULT_BYTES_SAMPLE_SIZE,
-                 s3_endpoint_url=None):
+                 s3_endpoint_url=None,
+                 s3_spool=False,
+                 s3_parallel=None):
         self.__bytes_sample_size = bytes_sample_size
-        self.__s3_endpoint_url = (
-            s3_endpoint_url or
-            os.environ.get('S3_ENDPOINT_URL') or
-            config.S3_DEFAULT_ENDPOINT_URL)
-        self.__s3_client = boto3.client('s3', endpoint_url=self.__s3_endpoint_url)
+        self.__s3_spool = s3_spool
+        self.__s3_parallel = s3_parallel
+        self.__s3_endpoint_url = _get_endpoint_url(s3_endpoint_url)
+        self.__s3_client = get_client(self.__s3_endpoint_url)
         self.__stats = None
+        self.__signature = None
+
+    @property
+    def signature(self):
+        """Version of the last loaded object (ETag and size)
+
+        It's a part of `Stream.checkpoint` so a checkpoint of a changed
+        object is not resumed from its byte position.
+
+        # Returns
+            dict/None: signature
+
+        """
+        return self.__signature
 
     def attach_stats(self, stats):
         self.__stats = stats
@@ -46,11 +68,10 @@ class AWSLoader(Loader):
         # Prepare bytes
         try:
             parts = urlparse(source, allow_fragments=False)
-            response = self.__s3_client.get_object(Bucket=parts.netloc, Key=parts.path[1:])
-            # https://github.com/frictionlessdata/tabulator-py/issues/271
-            bytes = io.BufferedRandom(io.BytesIO())
-            bytes.write(response['Body'].read())
-            bytes.seek(0)
+            s3_object = _S3Object(self.__s3_client, parts.netloc, parts.path[1:],
+                spool=self.__s3_spool, parallel=self.__s3_parallel)
+            bytes = s3_object.open()
+            self.__signature = {'etag': s3_object.etag, 'size': s3_object.size}
             if self.__stats:
                 bytes = helpers.BytesStatsWrapper(bytes, self.__stats)
         except Exception as exception:
@@ -70,3 +91,500 @@ class AWSLoader(Loader):
         chars = io.TextIOWrapper(bytes, encoding)
 
         return chars
+
+
+def get_client(endpoint_url):
+    """Return an S3 client shared by the streams with the same endpoint.
+
+    Clients are also distinguished by credentials and settings provided
+    by the `AWS_*` environment variables.
+
+    # Arguments
+        endpoint_url (str): S3 endpoint URL
+
+    # Returns
+        botocore.client.S3: client
+
+    """
+    settings = [os.environ.get(name) or '' for name in _CLIENT_VARIABLES]
+    key = hashlib.sha256('\n'.join([endpoint_url] + settings).encode('utf-8')).hexdigest()
+    with _LOCK:
+        client = _CLIENTS.get(key)
+        if client is not None:
+            _STATS['client_hits'] += 1
+            return client
+        # To reduce tabulator import time
+        from botocore.config import Config
+        started = default_timer()
+        client = boto3.client('s3', endpoint_url=endpoint_url,
+            config=Config(max_pool_connections=config.S3_POOL_SIZE))
+        _CLIENTS[key] = client
+        _STATS['clients'] += 1
+        _STATS['client_time'] += default_timer() - started
+    return client
+
+
+def list_sources(source, s3_endpoint_url=None):
+    """List objects matching an S3 prefix or glob pattern.
+
+    A source ending with `/` is a prefix (all the objects under it are listed),
+    a source having `*`, `?` or `[` is a glob pattern and any other source is
+    a single object. Listing is paginated and doesn't include folder markers.
+
+    Glob patterns are matched by `/`-separated segments like local paths so
+    `*` doesn't match `/` and a `**` segment matches any number of segments.
+
+    ```python
+    list_sources('s3://bucket/exports/2026-10-17/part-*.csv')
+    list_sources('s3://bucket/exports/**/part-*.csv')
+    ```
+
+    # Arguments
+        source (str): S3 URL with a prefix or a glob pattern
+        s3_endpoint_url (str, optional): see the `s3_endpoint_url` loader option
+
+    # Raises
+        LoadingError: if listing fails
+
+    # Returns
+        str[]: sorted S3 URLs of the objects
+
+    """
+    parts = urlparse(source, allow_fragments=False)
+    pattern = parts.path[1:]
+    match = re.search(r'[*?\[]', pattern)
+    if not match and not pattern.endswith('/'):
+        return [source]
+    prefix = pattern[:match.start()] if match else pattern
+    segments = pattern.split('/')
+    client = get_client(_get_endpoint_url(s3_endpoint_url))
+    sources = []
+    try:
+        pages = client.get_paginator('list_objects_v2').paginate(
+            Bucket=parts.netloc, Prefix=prefix)
+        for page in pages:
+            for item in page.get('Contents', []):
+                key = item['Key']
+                if key.endswith('/'):
+                    continue
+                if match and not _match_segments(key.split('/'), segments):
+                    continue
+                sources.append('s3://%s/%s' % (parts.netloc, key))
+    except Exception as exception:
+        raise exceptions.LoadingError(str(exception))
+    return sorted(sources)
+
+
+class S3File(object):
+    """Writable file-like object uploading to S3 by a streaming multipart upload.
+
+    ```python
+    with S3File('s3://bucket/exports/table.csv') as file:
+        file.write(b'id,name\n1,english\n')
+    ```
+
+    Written bytes are buffered up to `config.S3_PART_SIZE` and every full part
+    is uploaded in background by the executor shared with reading. At most
+    `config.S3_UPLOAD_WORKERS` parts are uploaded concurrently (writing waits
+    for the oldest one) so memory usage is bounded. Closing the file completes the upload (a small file is put
+    by a single request) and leaving the `with` block by an exception aborts it.
+
+    # Arguments
+        target (str): S3 URL of the object
+        s3_endpoint_url (str, optional): see the `s3_endpoint_url` loader option
+
+    # Raises
+        IOError: if uploading fails
+
+    """
+
+    # Public
+
+    def __init__(self, target, s3_endpoint_url=None):
+        parts = urlparse(target, allow_fragments=False)
+        self.__client = get_client(_get_endpoint_url(s3_endpoint_url))
+        self.__bucket = parts.netloc
+        self.__key = parts.path[1:]
+        self.__buffer = bytearray()
+        self.__position = 0
+        self.__upload_id = None
+        self.__parts = []
+        self.__futures = []
+        self.__closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def readable(self):
+        return False
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    @property
+    def closed(self):
+        return self.__closed
+
+    def tell(self):
+        return self.__position
+
+    def seek(self, offset, whence=0):
+        raise io.UnsupportedOperation('S3 file is not seekable')
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        if self.__closed:
+            raise ValueError('I/O operation on closed file')
+        self.__buffer.extend(data)
+        self.__position += len(data)
+        while len(self.__buffer) >= config.S3_PART_SIZE:
+            part = bytes(self.__buffer[:config.S3_PART_SIZE])
+            del self.__buffer[:config.S3_PART_SIZE]
+            self.__upload_part(part)
+        return len(data)
+
+    def close(self):
+        """Upload the rest of the data and complete the upload.
+        """
+        if self.__closed:
+            return
+        try:
+            if self.__upload_id is None:
+                self.__request('put_object', Body=bytes(self.__buffer))
+            else:
+                if self.__buffer:
+                    self.__upload_part(bytes(self.__buffer))
+                while self.__futures:
+                    self.__parts.append(self.__futures.pop(0).result())
+                self.__request('complete_multipart_upload',
+                    UploadId=self.__upload_id,
+                    MultipartUpload={'Parts': self.__parts})
+        except Exception:
+            self.abort()
+            raise
+        self.__buffer = bytearray()
+        self.__closed = True
+
+    def abort(self):
+        """Abort the upload discarding the uploaded parts.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__buffer = bytearray()
+        for future in self.__futures:
+            if not future.cancel():
+                try:
+                    future.result()
+                except Exception:
+                    pass
+        self.__futures = []
+        if self.__upload_id is not None:
+            try:
+                self.__client.abort_multipart_upload(
+                    Bucket=self.__bucket, Key=self.__key, UploadId=self.__upload_id)
+            except Exception:
+                pass
+
+    # Private
+
+    def __upload_part(self, body):
+        if self.__upload_id is None:
+            response = self.__request('create_multipart_upload')
+            self.__upload_id = response['UploadId']
+        if len(self.__futures) >= config.S3_UPLOAD_WORKERS:
+            self.__parts.append(self.__futures.pop(0).result())
+        number = len(self.__parts) + len(self.__futures) + 1
+        future = _get_executor().submit(self.__send_part, number, body)
+        self.__futures.append(future)
+
+    def __send_part(self, number, body):
+        response = self.__request('upload_part',
+            UploadId=self.__upload_id, PartNumber=number, Body=body)
+        return {'PartNumber': number, 'ETag': response['ETag']}
+
+    def __request(self, name, **params):
+        try:
+            return getattr(self.__client, name)(
+                Bucket=self.__bucket, Key=self.__key, **params)
+        except Exception as exception:
+            raise exceptions.IOError(str(exception))
+
+
+def s3_stats(reset=False):
+    """Return statistics of S3 clients and transfers.
+
+    Stats are `clients` (created clients), `client_hits` (reused clients),
+    `client_time` (seconds spent creating clients), `requests` (ranged
+    `GetObject` requests), `bytes` (downloaded bytes) and `transfer_time`
+    (seconds spent requesting and downloading, summed up over threads).
+
+    # Arguments
+        reset (bool): Reset the stats after returning them.
+
+    # Returns
+        dict: stats
+
+    """
+    with _LOCK:
+        stats = dict(_STATS)
+        if reset:
+            for name in _STATS:
+                _STATS[name] = 0
+    return stats
+
+
+# Internal
+
+_CLIENT_VARIABLES = [
+    'AWS_ACCESS_KEY_ID',
+    'AWS_SECRET_ACCESS_KEY',
+    'AWS_SESSION_TOKEN',
+    'AWS_PROFILE',
+    'AWS_DEFAULT_REGION',
+]
+_CLIENTS = {}
+_EXECUTOR = None
+_LOCK = threading.Lock()
+_STATS = {
+    'clients': 0,
+    'client_hits': 0,
+    'client_time': 0,
+    'requests': 0,
+    'bytes': 0,
+    'transfer_time': 0,
+}
+
+
+def _get_endpoint_url(s3_endpoint_url=None):
+    return (
+        s3_endpoint_url or
+        os.environ.get('S3_ENDPOINT_URL') or
+        config.S3_DEFAULT_ENDPOINT_URL)
+
+
+def _match_segments(names, patterns):
+    if not patterns:
+        return not names
+    if patterns[0] == '**':
+        return any(_match_segments(names[index:], patterns[1:])
+            for index in range(len(names) + 1))
+    if not names or not fnmatch.fnmatchcase(names[0], patterns[0]):
+        return False
+    return _match_segments(names[1:], patterns[1:])
+
+
+def _get_executor():
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            # To reduce tabulator import time
+            from concurrent.futures import ThreadPoolExecutor
+            _EXECUTOR = ThreadPoolExecutor(max_workers=config.S3_POOL_SIZE)
+    return _EXECUTOR
+
+
+def _count_transfer(**counts):
+    with _LOCK:
+        for name, value in counts.items():
+            _STATS[name] += value
+
+
+class _S3Object(object):
+    """Seekable file-like object reading an S3 object by byte ranges.
+
+    The object is read by ranged `GetObject` requests of `config.S3_CHUNK_SIZE`
+    bytes and the next range is requested by the shared executor (read ahead)
+    so at most two ranges are kept in memory. If `spool` is set, the read ranges
+    are also written to a temporary file so seeking back doesn't request them again.
+    If `parallel` is set, `open` returns a `helpers.RangedFile` downloading
+    ranges of a larger object by this number of tasks of the same executor.
+
+    """
+
+    # Public
+
+    remote = True
+
+    def __init__(self, client, bucket, key, spool=False, parallel=None):
+        self.__client = client
+        self.__bucket = bucket
+        self.__key = key
+        self.__spool = spool
+        self.__parallel = parallel
+        self.__closed = True
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def seekable(self):
+        return True
+
+    @property
+    def closed(self):
+        return self.__closed
+
+    @property
+    def etag(self):
+        return self.__etag
+
+    @property
+    def size(self):
+        return self.__size
+
+    def open(self):
+        head = self.__client.head_object(Bucket=self.__bucket, Key=self.__key)
+        self.__size = head['ContentLength']
+        self.__etag = head['ETag']
+        self.__chunk_size = config.S3_CHUNK_SIZE
+        if self.__parallel and self.__size > self.__chunk_size:
+            return helpers.RangedFile(self.__size, self.__open_range,
+                workers=self.__parallel, chunk_size=self.__chunk_size,
+                executor=_get_executor())
+        self.__chunk = (None, b'')
+        self.__read_ahead = None
+        self.__spooled = set()
+        self.__file = None
+        if self.__spool:
+            # To reduce tabulator import time
+            import tempfile
+            self.__file = tempfile.TemporaryFile(prefix='tabulator-')
+        self.__position = 0
+        self.__closed = False
+        return self
+
+    def close(self):
+        self.__cancel_read_ahead()
+        if self.__file is not None:
+            self.__file.close()
+        self.__chunk = (None, b'')
+        self.__closed = True
+
+    def tell(self):
+        return self.__position
+
+    def flush(self):
+        pass
+
+    def read(self, size=None):
+        chunks = []
+        if size is None or size < 0:
+            size = self.__size
+        while size > 0:
+            chunk = self.read1(size)
+            if not chunk:
+                break
+            size -= len(chunk)
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def read1(self, size=None):
+        if size is None or size < 0:
+            size = self.__size
+        size = min(size, self.__size - self.__position)
+        if size <= 0:
+            return b''
+        index, offset = divmod(self.__position, self.__chunk_size)
+        chunk = self.__get_chunk(index)[offset:offset + size]
+        self.__position += len(chunk)
+        return chunk
+
+    def seek(self, offset, whence=0):
+        assert whence == 0
+        self.__position = min(offset, self.__size)
+        return self.__position
+
+    # Private
+
+    def __get_chunk(self, index):
+
+        # Current chunk
+        if self.__chunk[0] == index:
+            return self.__chunk[1]
+
+        # Spooled chunk
+        if index in self.__spooled:
+            self.__file.seek(index * self.__chunk_size)
+            chunk = self.__file.read(self.__chunk_size)
+
+        # Downloaded chunk
+        else:
+            if self.__read_ahead is not None and self.__read_ahead[0] == index:
+                chunk = self.__read_ahead[1].result()
+                self.__read_ahead = None
+            else:
+                chunk = self.__download_chunk(index)
+            if self.__file is not None:
+                self.__file.seek(index * self.__chunk_size)
+                self.__file.write(chunk)
+                self.__spooled.add(index)
+        self.__chunk = (index, chunk)
+
+        # Read ahead
+        index += 1
+        if index * self.__chunk_size < self.__size and index not in self.__spooled:
+            if self.__read_ahead is None or self.__read_ahead[0] != index:
+                self.__cancel_read_ahead()
+                future = _get_executor().submit(self.__download_chunk, index)
+                self.__read_ahead = (index, future)
+
+        return chunk
+
+    def __cancel_read_ahead(self):
+        # A running request is waited for so it's not left in flight
+        if self.__read_ahead is not None:
+            future = self.__read_ahead[1]
+            self.__read_ahead = None
+            if not future.cancel():
+                try:
+                    future.result()
+                except Exception:
+                    pass
+
+    def __download_chunk(self, index):
+        start = index * self.__chunk_size
+        end = min(start + self.__chunk_size, self.__size)
+        body = self.__open_range(start, end)
+        try:
+            return body.read()
+        finally:
+            body.close()
+
+    def __open_range(self, start, end):
+        started = default_timer()
+        response = self.__client.get_object(
+            Bucket=self.__bucket, Key=self.__key, IfMatch=self.__etag,
+            Range='bytes=%s-%s' % (start, end - 1))
+        _count_transfer(requests=1, transfer_time=default_timer() - started)
+        return _S3Body(response['Body'])
+
+
+class _S3Body(object):
+
+    # Public
+
+    def __init__(self, body):
+        self.__body = body
+
+    def read(self, size=None):
+        started = default_timer()
+        chunk = self.__body.read(size)
+        _count_transfer(bytes=len(chunk), transfer_time=default_timer() - started)
+        return chunk
+
+    def close(self):
+        self.__body.close()
@@ -7,7 +7,11 @@ from __future__ import unicode_literals
 import io
 import six
 import requests
+import warnings
+import threading
+from six.moves.urllib.parse import urlparse
 from ..loader import Loader
+from ..httpcache import HTTPCache
 from .. import exceptions
 from .. import helpers
 from .. import config
@@ -26,18 +30,29 @@ class RemoteLoader(Loader):
         'http_session',
         'http_stream',
         'http_timeout',
+        'http_spool',
+        'http_cache',
+        'http_parallel',
     ]
 
     def __init__(self,
                  bytes_sample_size=config.DEFAULT_BYTES_SAMPLE_SIZE,
                  http_session=None,
                  http_stream=True,
-                 http_timeout=None):
+                 http_timeout=None,
+                 http_spool=False,
+                 http_cache=None,
+                 http_parallel=None):
 
-        # Create default session
-        if not http_session:
-            http_session = requests.Session()
-            http_session.headers.update(config.HTTP_HEADERS)
+        # Create cache
+        if isinstance(http_cache, six.string_types):
+            http_cache = HTTPCache(http_cache)
+
+        # Cached sources are downloaded by a single request
+        if http_cache is not None and http_parallel:
+            message = 'Option "http_parallel" is ignored if "http_cache" is used'
+            warnings.warn(message, UserWarning)
+            http_parallel = None
 
         # No stream support
         if six.PY2:
@@ -48,6 +63,9 @@ class RemoteLoader(Loader):
         self.__http_session = http_session
         self.__http_stream = http_stream
         self.__http_timeout = http_timeout
+        self.__http_spool = http_spool
+        self.__http_cache = http_cache
+        self.__http_parallel = http_parallel
         self.__stats = None
 
     def attach_stats(self, stats):
@@ -58,10 +76,23 @@ class RemoteLoader(Loader):
         # Prepare source
         source = helpers.requote_uri(source)
 
+        # Prepare session
+        session = self.__http_session or get_session(source)
+
         # Prepare bytes
         try:
-            bytes = _RemoteStream(source, self.__http_session, self.__http_timeout).open()
-            if not self.__http_stream:
+            if self.__http_cache is not None:
+                bytes = self.__http_cache.open(source, session, self.__http_timeout)
+            else:
+                bytes = None
+                # Streaming is disabled for compressed sources
+                if self.__http_parallel and self.__http_stream:
+                    bytes = _ParallelRemoteStream(source, session,
+                        self.__http_timeout, workers=self.__http_parallel).open()
+                if bytes is None:
+                    bytes = _RemoteStream(source, session, self.__http_timeout,
+                        sample_size=self.__bytes_sample_size, spool=self.__http_spool).open()
+            if not self.__http_stream and self.__http_cache is None:
                 buffer = io.BufferedRandom(io.BytesIO())
                 buffer.write(bytes.read())
                 buffer.seek(0)
@@ -87,21 +118,164 @@ class RemoteLoader(Loader):
         return chars
 
 
+def get_session(source):
+    """Return a session shared by the sources from the same host.
+
+    Sessions are created with the settings of `configure_sessions` and
+    reuse their connections between streams. It's used by default by
+    `RemoteLoader` if the `http_session` option is not provided.
+
+    # Arguments
+        source (str): source URL
+
+    # Returns
+        requests.Session: session
+
+    """
+    parts = urlparse(source)
+    key = (parts.scheme.lower(), parts.netloc.lower())
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _create_session(**_SESSIONS_SETTINGS)
+            _SESSIONS[key] = session
+            _SESSIONS_STATS['misses'] += 1
+        else:
+            _SESSIONS_STATS['hits'] += 1
+    return session
+
+
+def configure_sessions(pool_size=None, keep_alive=None, max_retries=None):
+    """Configure shared sessions. The already created sessions are closed.
+
+    # Arguments
+        pool_size (int, optional):
+            Maximum number of connections kept per host.
+            Defaults to ``config.HTTP_POOL_SIZE``.
+        keep_alive (bool, optional):
+            Reuse connections between requests.
+            Defaults to ``config.HTTP_KEEP_ALIVE``.
+        max_retries (Union[int, urllib3.util.Retry], optional):
+            Retry policy of failed connections (see `requests.adapters.HTTPAdapter`).
+            Defaults to ``config.HTTP_MAX_RETRIES``.
+
+    """
+    settings = {
+        'pool_size': pool_size,
+        'keep_alive': keep_alive,
+        'max_retries': max_retries,
+    }
+    with _SESSIONS_LOCK:
+        for name, value in settings.items():
+            if value is not None:
+                _SESSIONS_SETTINGS[name] = value
+        for session in _SESSIONS.values():
+            for name, value in _count_requests(session).items():
+                _SESSIONS_STATS[name] += value
+            session.close()
+        _SESSIONS.clear()
+
+
+def session_stats(reset=False):
+    """Return statistics of shared sessions.
+
+    Stats are `hits` (a session is reused), `misses` (a session is created),
+    `connections` (new connections) and `requests` (sent requests).
+
+    # Arguments
+        reset (bool): Reset the stats after returning them.
+
+    # Returns
+        dict: stats
+
+    """
+    with _SESSIONS_LOCK:
+        stats = dict(_SESSIONS_STATS)
+        for session in _SESSIONS.values():
+            for name, value in _count_requests(session).items():
+                stats[name] += value
+        for name in ['connections', 'requests']:
+            stats[name] -= _SESSIONS_BASELINE[name]
+        if reset:
+            _SESSIONS_STATS.update(hits=0, misses=0)
+            for name in ['connections', 'requests']:
+                _SESSIONS_BASELINE[name] += stats[name]
+    return stats
+
+
 # Internal
 
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+_SESSIONS_SETTINGS = {
+    'pool_size': config.HTTP_POOL_SIZE,
+    'keep_alive': config.HTTP_KEEP_ALIVE,
+    'max_retries': config.HTTP_MAX_RETRIES,
+}
+_SESSIONS_STATS = {'hits': 0, 'misses': 0, 'connections': 0, 'requests': 0}
+_SESSIONS_BASELINE = {'connections': 0, 'requests': 0}
+_EXECUTOR = None
+
+
+def _get_executor():
+    global _EXECUTOR
+    with _SESSIONS_LOCK:
+        if _EXECUTOR is None:
+            # To reduce tabulator import time
+            from concurrent.futures import ThreadPoolExecutor
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_SESSIONS_SETTINGS['pool_size'])
+    return _EXECUTOR
+
+
+def _create_session(pool_size, keep_alive, max_retries):
+    session = requests.Session()
+    session.headers.update(config.HTTP_HEADERS)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    adapter = requests.adapters.HTTPAdapter(
+        pool_maxsize=pool_size, max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _count_requests(session):
+    counts = {'connections': 0, 'requests': 0}
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                counts['connections'] += pool.num_connections
+                counts['requests'] += pool.num_requests
+    return counts
+
+
 class _RemoteStream(object):
+    """Seekable file-like object reading a remote source.
 
-    # It's possible to implement cache for bytes sample
-    # size to prevent additional HTTP calls used in seek
+    The first `sample_size` bytes are cached so rewinding after sampling
+    replays them and continues the original response. If `spool` is set,
+    all the read bytes are also written to a temporary file so rewinding
+    never re-downloads the source. Otherwise, seeking behind the cached
+    bytes issues a new HTTP request.
+
+    """
 
     # Public
 
     remote = True
 
-    def __init__(self, source, session, timeout):
+    def __init__(self, source, session, timeout, sample_size=0, spool=False):
         self.__source = source
         self.__session = session
         self.__timeout = timeout
+        self.__sample_size = sample_size
+        self.__spool = spool
+        self.__response = None
+        self.__cache = None
+        self.__closed = True
 
     def readable(self):
         return True
@@ -118,27 +292,137 @@ class _RemoteStream(object):
 
     def open(self):
         self.__closed = False
-        self.seek(0)
+        self.__request()
         return self
 
     def close(self):
+        if self.__response is not None:
+            self.__response.close()
+        if self.__cache is not None:
+            self.__cache.close()
         self.__closed = True
 
     def tell(self):
-        return self.__response.raw.tell()
+        return self.__position
 
     def flush(self):
         pass
 
     def read(self, size=None):
-        return self.__response.raw.read(size)
+        if size is not None and size < 0:
+            size = None
+        chunks = []
+
+        # Replay cached bytes
+        if self.__position < self.__cached_size:
+            count = self.__cached_size - self.__position
+            if size is not None:
+                count = min(count, size)
+                size -= count
+            self.__cache.seek(self.__position)
+            chunk = self.__cache.read(count)
+            self.__position += len(chunk)
+            chunks.append(chunk)
+
+        # Continue the response
+        if size is None or size > 0:
+            chunk = self.__response.raw.read(size)
+            if self.__response_size == self.__cached_size:
+                count = len(chunk)
+                if not self.__spool:
+                    count = min(count, self.__sample_size - self.__cached_size)
+                if count > 0:
+                    self.__cache.seek(self.__cached_size)
+                    self.__cache.write(chunk[:count])
+                    self.__cached_size += count
+            self.__response_size += len(chunk)
+            self.__position += len(chunk)
+            chunks.append(chunk)
+
+        return b''.join(chunks)
 
     def read1(self, size=None):
-        return self.__response.raw.read(size)
+        return self.read(size)
 
     def seek(self, offset, whence=0):
-        assert offset == 0
         assert whence == 0
+
+        # Cached bytes followed by the response
+        if offset <= self.__cached_size == self.__response_size:
+            self.__position = offset
+            return self.__position
+
+        # Read bytes are not available
+        if offset < self.__response_size:
+            self.__request()
+
+        # Read forward
+        self.__position = self.__response_size
+        while self.__position < offset:
+            if not self.read(min(offset - self.__position, io.DEFAULT_BUFFER_SIZE)):
+                break
+        return self.__position
+
+    # Private
+
+    def __request(self):
+        if self.__response is not None:
+            self.__response.close()
+        if self.__cache is None:
+            if self.__spool:
+                # To reduce tabulator import time
+                import tempfile
+                self.__cache = tempfile.TemporaryFile(prefix='tabulator-')
+            else:
+                self.__cache = io.BytesIO()
+        self.__cache.seek(0)
+        self.__cache.truncate()
+        self.__cached_size = 0
+        self.__response_size = 0
+        self.__position = 0
         self.__response = self.__session.get(self.__source, stream=True, timeout=self.__timeout)
         self.__response.raise_for_status()
         self.__response.raw.decode_content = True
+
+
+class _ParallelRemoteStream(object):
+    """Opener of a remote source downloaded by concurrent range requests.
+    """
+
+    # Public
+
+    def __init__(self, source, session, timeout, workers):
+        self.__source = source
+        self.__session = session
+        self.__timeout = timeout
+        self.__workers = workers
+
+    def open(self):
+        """Return a `helpers.RangedFile` or None if ranges are not supported.
+        """
+        response = self.__session.head(
+            self.__source, allow_redirects=True, timeout=self.__timeout)
+        response.close()
+        size = response.headers.get('Content-Length', '')
+        if (response.status_code != 200 or
+                response.headers.get('Accept-Ranges') != 'bytes' or
+                response.headers.get('Content-Encoding', 'identity') != 'identity' or
+                not size.isdigit() or
+                int(size) <= config.HTTP_PARALLEL_CHUNK_SIZE):
+            return None
+        return helpers.RangedFile(int(size), self.__open_range,
+            workers=self.__workers, chunk_size=config.HTTP_PARALLEL_CHUNK_SIZE,
+            executor=_get_executor())
+
+    # Private
+
+    def __open_range(self, start, end):
+        headers = {'Range': 'bytes=%s-%s' % (start, end - 1)}
+        response = self.__session.get(self.__source,
+            headers=headers, stream=True, timeout=self.__timeout)
+        if response.status_code != 206:
+            response.close()
+            response.raise_for_status()
+            message = 'Server ignored the range request for "%s"'
+            raise IOError(message % self.__source)
+        return response.raw
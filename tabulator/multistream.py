@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import glob
+import six
+from collections import deque
+from .stream import Stream
+from . import exceptions
+from . import helpers
+from . import config
+
+
+# Module API
+
+class MultiStream(object):
+    """Stream of rows concatenated from many sources having the same layout.
+
+    ```python
+    from tabulator import MultiStream
+
+    with MultiStream('data/*.csv', headers=1) as stream:
+        stream.headers # ['id', 'name']
+        for source, row_number, headers, row in stream.iter(extended=True):
+            print(source, row_number, row)
+    ```
+
+    Sources are read one after another. While the current source is being
+    read, the next sources are opened (loaded, decoded and sampled) in
+    background threads to hide the opening latency.
+
+    # Arguments
+        sources (Union[str, List[Any]]):
+            List of sources supported by `Stream` or a glob pattern
+            of local paths. The glob matches are sorted by name.
+            S3 prefixes (`s3://bucket/exports/`) and glob patterns
+            (`s3://bucket/exports/part-*.csv`) are listed in the same way
+            (a `Stream` source is always a single S3 object).
+            Prefetching an S3 part downloads only the ranges needed
+            for sampling and the rest is downloaded while it's read.
+        prefetch (int, optional):
+            Number of the next sources opened in background threads.
+            Set to ``0`` to open sources only when they are needed.
+            Defaults to ``config.DEFAULT_PREFETCH``.
+        **options (Any, optional):
+            Options passed to every `Stream` e.g. `headers=1`.
+            Row options like `limit_rows` are applied to every source.
+
+    """
+
+    # Public
+
+    def __init__(self, sources, prefetch=config.DEFAULT_PREFETCH, **options):
+        self.__sources = sources
+        self.__prefetch = prefetch
+        self.__options = options
+        self.__pool = None
+        self.__pending_sources = None
+        self.__pending_streams = None
+        self.__stream = None
+        self.__headers = None
+        self.__syncs = {}
+        self.__closed = True
+
+    def __enter__(self):
+        if self.closed:
+            self.open()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if not self.closed:
+            self.close()
+
+    def __iter__(self):
+        return self.iter()
+
+    @property
+    def closed(self):
+        """Returns True if the multistream is closed, False otherwise.
+
+        # Returns
+            bool: whether closed
+
+        """
+        return self.__closed
+
+    @property
+    def sources(self):
+        """Sources
+
+        # Returns
+            any[]: list of sources (with resolved glob pattern)
+
+        """
+        if isinstance(self.__sources, six.string_types):
+            if self.__sources.startswith('s3://'):
+                # To reduce tabulator import time
+                from .loaders.aws import list_sources
+                endpoint_url = self.__options.get('s3_endpoint_url')
+                return list_sources(self.__sources, s3_endpoint_url=endpoint_url)
+            return sorted(glob.glob(self.__sources))
+        return list(self.__sources)
+
+    @property
+    def headers(self):
+        """Headers of the first source
+
+        # Returns
+            str[]/None: headers if available
+
+        """
+        return self.__headers
+
+    def open(self):
+        """Opens the multistream for reading.
+
+        The first source is opened immediately to get the headers
+        and the next sources start opening in background threads.
+
+        # Raises
+            TabulatorException: if an error
+
+        """
+        self.close()
+        sources = self.sources
+        if not sources:
+            message = 'There are no sources in "%s"' % self.__sources
+            raise exceptions.SourceError(message)
+        if self.__prefetch:
+            # To reduce tabulator import time
+            from multiprocessing.pool import ThreadPool
+            self.__pool = ThreadPool(self.__prefetch)
+        self.__pending_sources = deque(sources)
+        self.__pending_streams = deque()
+        self.__closed = False
+        self.__stream = self.__next_stream()
+        self.__headers = self.__stream.headers
+        self.__syncs = {}
+        return self
+
+    def close(self):
+        """Closes the multistream and all the opened sources.
+        """
+        if self.__stream is not None:
+            self.__stream.close()
+            self.__stream = None
+        if self.__pool is not None:
+            while self.__pending_streams:
+                try:
+                    self.__pending_streams.popleft().get().close()
+                except Exception:
+                    pass
+            self.__pool.terminate()
+            self.__pool = None
+        self.__closed = True
+
+    def reset(self):
+        """Resets the multistream pointer to the beginning of the first source.
+        """
+        self.open()
+
+    def iter(self, keyed=False, extended=False):
+        """Iterate over the rows of all the sources.
+
+        Rows are aligned to the headers of the first source by header names
+        (missing values are set to `None`). It works as `Stream.iter` but
+        extended rows also contain the source as the first item.
+
+        # Arguments
+            keyed (bool, optional): See :func:`Stream.iter`.
+            extended (bool, optional):
+                When True, returns each row as a tuple with the source,
+                the row number in the source (starts at 1), list of headers,
+                and list of row values. For example,
+                `('data.csv', 1, ['name', 'value'], ['J Smith', '10'])`.
+                Defaults to False.
+
+        # Raises
+            exceptions.TabulatorException: If the multistream is closed.
+
+        # Returns
+            Iterator[Union[List[Any], Dict[str, Any], Tuple[Any, int, List[str], List[Any]]]]:
+                The row itself. The format depends on the values of `keyed`
+                and `extended` arguments.
+
+        """
+
+        # Error if closed
+        if self.closed:
+            message = 'MultiStream is closed. Please call "multistream.open()" first.'
+            raise exceptions.TabulatorException(message)
+
+        # Yield rows from streams
+        while self.__stream is not None:
+            stream = self.__stream
+            headers = self.__headers
+            sync = self.__get_sync(stream.headers)
+            for row_number, _, row in stream.iter(extended=True):
+                if sync is not None:
+                    row = sync(row)
+                if extended:
+                    yield (stream.source, row_number, headers, row)
+                elif keyed:
+                    yield dict(zip(headers, row))
+                else:
+                    yield row
+            stream.close()
+            self.__stream = self.__next_stream()
+
+    def read(self, keyed=False, extended=False, limit=None):
+        """Returns a list of rows of all the sources.
+
+        # Arguments
+            keyed (bool, optional): See :func:`MultiStream.iter`.
+            extended (bool, optional): See :func:`MultiStream.iter`.
+            limit (int, optional):
+                Number of rows to return. If None, returns all rows. Defaults to None.
+
+        # Returns
+            List[Union[List[Any], Dict[str, Any], Tuple[Any, int, List[str], List[Any]]]]:
+                The list of rows. The format depends on the values of `keyed`
+                and `extended` arguments.
+
+        """
+        result = []
+        rows = self.iter(keyed=keyed, extended=extended)
+        for count, row in enumerate(rows, start=1):
+            result.append(row)
+            if count == limit:
+                break
+        return result
+
+    # Private
+
+    def __next_stream(self):
+
+        # Start opening the next sources
+        while self.__pending_sources and len(self.__pending_streams) <= self.__prefetch:
+            source = self.__pending_sources.popleft()
+            if self.__pool is not None:
+                stream = self.__pool.apply_async(_open_stream, (source, self.__options))
+            else:
+                stream = source
+            self.__pending_streams.append(stream)
+
+        # Get the next source opened
+        if not self.__pending_streams:
+            return None
+        stream = self.__pending_streams.popleft()
+        if self.__pool is not None:
+            return stream.get()
+        return _open_stream(stream, self.__options)
+
+    def __get_sync(self, headers):
+        key = tuple(headers or [])
+        if key not in self.__syncs:
+            sync = None
+            if headers and self.__headers and headers != self.__headers:
+                sync = helpers.make_keyed_projection(headers, self.__headers)
+            self.__syncs[key] = sync
+        return self.__syncs[key]
+
+
+# Internal
+
+def _open_stream(source, options):
+    return Stream(source, **options).open()
@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 from six import add_metaclass
 from abc import ABCMeta, abstractmethod
+from . import exceptions
+from . import helpers
 
 
 # Module API
@@ -32,6 +34,10 @@ class Parser(object):
 
     options = []
 
+    # Parsers having connections bound to the opening thread (e.g. SQLite)
+    # set it to False so rows are never read in another thread
+    thread_safe = True
+
     def __init__(self, loader, force_parse, **options):
         pass
 
@@ -111,3 +117,98 @@ class Parser(object):
 
         """
         pass  # pragma: no cover
+
+    def extended_rows_batches(self, size):
+        """Returns extended rows batches iterator.
+
+        It continues from the current position of `extended_rows` and
+        yields lists of at most `size` extended rows. Parsers able to
+        produce blocks of rows natively could override this method.
+
+        # Arguments
+            size (int): Maximum number of extended rows in a batch.
+
+        Returns:
+            Iterator[List[Tuple[int, List[str], List[Any]]]]:
+                Lists of extended rows.
+
+        """
+        return helpers.make_batches(self.extended_rows, size)
+
+    def tell(self):
+        """Returns the position of the next extended row.
+
+        The position could be used later to continue reading using `seek`.
+        Parsers not supporting it return `None`.
+
+        # Returns
+            any/None: JSON serializable position
+
+        """
+        return None
+
+    def track_positions(self, enabled=True):
+        """Makes `tell` available since the next reset or seek.
+
+        It's used by `Stream` only if positions are needed (e.g. to build
+        an index or a resumable checkpoint) as tracking them could make
+        parsing slower. Parsers supporting `tell` override this method.
+
+        # Arguments
+            enabled (bool): Track positions or not.
+
+        # Returns
+            bool: True if positions are tracked by the parser
+
+        """
+        return False
+
+    def seek(self, position, row_number):
+        """Continues `extended_rows` from the given position.
+
+        # Arguments
+            position (any): Position returned by `tell`.
+            row_number (int): Number of the row at the position.
+
+        # Raises
+            TabulatorException: If seeking is not supported.
+
+        """
+        message = 'Parser "%s" does not support seeking' % type(self).__name__
+        raise exceptions.TabulatorException(message)
+
+    def pushdown(self, skip=0, limit=None):
+        """Skips and limits the next extended rows.
+
+        It's used by `Stream` to apply `offset_rows` and `limit_rows` inside
+        the parser when it's safe. Parsers able to skip rows without fully
+        parsing them (e.g. using a database query) override this method.
+
+        # Arguments
+            skip (int): Number of the next rows to skip.
+            limit (int/None): Maximum number of rows to return after skipping.
+
+        # Returns
+            bool: True if it's applied by the parser
+
+        """
+        return False
+
+    def project(self, ignored_indexes, headers):
+        """Drops ignored columns from the next extended rows.
+
+        It's used by `Stream` to apply `pick_fields`, `skip_fields` and other
+        fields options inside the parser. Parsers able to skip reading or
+        typing of the unneeded cells override this method. After it's applied,
+        positional rows don't contain values at the ignored indexes and keyed
+        rows contain only values for the given headers.
+
+        # Arguments
+            ignored_indexes (int[]): Indexes of positional values to drop.
+            headers (str[]): Headers of keyed values to keep.
+
+        # Returns
+            bool: True if it's applied by the parser
+
+        """
+        return False
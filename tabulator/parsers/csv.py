@@ -4,10 +4,15 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
+import os
 import csv
 import six
-from itertools import chain
+import codecs
+from itertools import chain, islice
+from collections import deque
 from codecs import iterencode
+from ..loaders.local import LocalLoader
 from ..parser import Parser
 from .. import helpers
 from .. import config
@@ -28,10 +33,11 @@ class CSVParser(Parser):
         'quotechar',
         'quoting',
         'skipinitialspace',
-        'lineterminator'
+        'lineterminator',
+        'workers',
     ]
 
-    def __init__(self, loader, force_parse=False, **options):
+    def __init__(self, loader, force_parse=False, workers=None, **options):
 
         # Make bytes
         if six.PY2:
@@ -43,6 +49,12 @@ class CSVParser(Parser):
         self.__loader = loader
         self.__options = options
         self.__force_parse = force_parse
+        self.__workers = workers
+        self.__pool = None
+        self.__parallel = False
+        self.__positions = False
+        self.__sample_lines = deque()
+        self.__items = None
         self.__extended_rows = None
         self.__encoding = None
         self.__dialect = None
@@ -61,10 +73,14 @@ class CSVParser(Parser):
         self.reset()
 
     def close(self):
+        self.__close_pool()
         if not self.closed:
             self.__chars.close()
 
     def reset(self):
+        self.__close_pool()
+        self.__items = None
+        self.__sample_lines = deque()
         helpers.reset_stream(self.__chars)
         self.__extended_rows = self.__iter_extended_rows()
 
@@ -90,9 +106,33 @@ class CSVParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def tell(self):
+        if six.PY2 or not self.__positions or self.__parallel or self.__sample_lines:
+            return None
+        return helpers.tell_stream(self.__chars)
+
+    def track_positions(self, enabled=True):
+        self.__positions = enabled
+        return not six.PY2
+
+    def seek(self, position, row_number):
+        self.__close_pool()
+        self.__chars.seek(position)
+        self.__items = None
+        self.__extended_rows = self.__iter_extended_rows(row_number)
+
+    def pushdown(self, skip=0, limit=None):
+        # Skip items without building extended rows if iteration is started
+        if self.__items is not None:
+            next(islice(self.__items, skip, skip), None)
+            skip = 0
+        stop = skip + limit if limit is not None else None
+        self.__extended_rows = islice(self.__extended_rows, skip, stop)
+        return True
+
     # Private
 
-    def __iter_extended_rows(self):
+    def __iter_extended_rows(self, row_number=1):
 
         # For PY2 encode/decode
         if six.PY2:
@@ -100,7 +140,8 @@ class CSVParser(Parser):
             bytes = iterencode(self.__chars, 'utf-8')
             sample, dialect = self.__prepare_dialect(bytes)
             items = csv.reader(chain(sample, bytes), dialect=dialect)
-            for row_number, item in enumerate(items, start=1):
+            self.__items = enumerate(items, start=1)
+            for row_number, item in self.__items:
                 values = []
                 for value in item:
                     value = value.decode('utf-8')
@@ -109,33 +150,160 @@ class CSVParser(Parser):
 
         # For PY3 use chars
         else:
-            sample, dialect = self.__prepare_dialect(self.__chars)
-            items = csv.reader(chain(sample, self.__chars), dialect=dialect)
-            for row_number, item in enumerate(items, start=1):
+            lines = helpers.iter_lines(self.__chars, self.__positions)
+            if row_number > 1 and self.__dialect:
+                sample, dialect = [], self.__dialect
+            else:
+                sample, dialect = self.__prepare_dialect(lines)
+            path = self.__get_parallel_path() if row_number == 1 else None
+            self.__parallel = bool(path)
+            self.__sample_lines = deque(sample)
+            if path:
+                items = self.__iter_parallel_items(path, dialect)
+            else:
+                items = csv.reader(chain(self.__iter_sample_lines(), lines), dialect=dialect)
+            self.__items = enumerate(items, start=row_number)
+            for row_number, item in self.__items:
                 yield (row_number, None, list(item))
 
-    def __prepare_dialect(self, stream):
+    def __iter_sample_lines(self):
+        while self.__sample_lines:
+            yield self.__sample_lines.popleft()
 
-        # Get sample
-        sample = []
-        while True:
-            try:
-                sample.append(next(stream))
-            except StopIteration:
-                break
-            if len(sample) >= config.CSV_SAMPLE_LINES:
-                break
+    def __get_parallel_path(self):
+        """Return a file path if the source can be parsed in parallel.
+
+        It's possible only for local files in an encoding
+        where a newline byte can't be a part of another character.
+        Small files and single CPU machines are parsed serially as
+        the workers would only compete with the main process.
+
+        """
+        if not self.__workers or self.__workers < 2 or _get_cpu_count() < 2:
+            return None
+        if not isinstance(self.__loader, LocalLoader):
+            return None
+        path = getattr(self.__chars, 'name', None)
+        if not isinstance(path, six.string_types) or not os.path.isfile(path):
+            return None
+        encoding = codecs.lookup(self.__encoding or config.DEFAULT_ENCODING).name
+        if encoding not in config.CSV_PARALLEL_ENCODINGS:
+            return None
+        if os.path.getsize(path) < 2 * config.CSV_PARALLEL_CHUNK_SIZE:
+            return None
+        return path
+
+    def __iter_parallel_items(self, path, dialect):
+        """Parse byte ranges of the file in a process pool.
+
+        Ranges are aligned to line endings but a line ending could be inside
+        a quoted value. So a range is trusted only if the previous range
+        has been parsed to the end without an unfinished record. Otherwise,
+        the ranges are merged and re-parsed in the main process.
 
-        # Get dialect
+        Workers return the parsed items joined by separator characters
+        (see `_parse_range`) so the main process only unpickles a string
+        and splits it which is much cheaper than `csv.reader`.
+
+        """
+        # To reduce tabulator import time
+        import multiprocessing
+
+        # Prepare ranges
+        boundaries = [0]
+        with io.open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            while True:
+                file.seek(boundaries[-1] + config.CSV_PARALLEL_CHUNK_SIZE)
+                file.readline()
+                position = file.tell()
+                if position >= size:
+                    break
+                boundaries.append(position)
+        boundaries.append(size)
+        ranges = deque(zip(boundaries[:-1], boundaries[1:]))
+
+        # Prepare tasks
+        encoding = self.__encoding or config.DEFAULT_ENCODING
+        dialect = dict((name, getattr(dialect, name)) for name in [
+            'delimiter', 'doublequote', 'escapechar', 'quotechar',
+            'quoting', 'skipinitialspace', 'lineterminator'])
+        workers = min(self.__workers, _get_cpu_count())
+        pool = self.__pool = multiprocessing.Pool(workers)
+        tasks = deque()
+        def submit():
+            while ranges and len(tasks) < 2 * workers:
+                start, end = ranges.popleft()
+                task = (path, start, end, encoding, dialect)
+                tasks.append((start, end, pool.apply_async(_parse_range, [task])))
+
+        # Yield items
         try:
-            separator = b'' if six.PY2 else ''
-            delimiter = self.__options.get('delimiter', ',\t;|')
-            dialect = csv.Sniffer().sniff(separator.join(sample), delimiter)
-            if not dialect.escapechar:
-                dialect.doublequote = True
-        except csv.Error:
+            submit()
+            while tasks:
+                start, end, result = tasks.popleft()
+                items, finished, error = result.get()
+                while not finished and tasks:
+                    _, end, _ = tasks.popleft()
+                    submit()
+                    task = (path, start, end, encoding, dialect)
+                    items, finished, error = _parse_range(task)
+                if error is not None:
+                    raise error
+                for item in _split_items(items):
+                    yield item
+                self.__read_bytes(end)
+                submit()
+        finally:
+            pool.terminate()
+            if self.__pool is pool:
+                self.__pool = None
+
+    def __read_bytes(self, position):
+        """Read the loader's bytes up to the position to keep the stats updated.
+        """
+        bytes = getattr(self.__chars, 'buffer', None)
+        while bytes is not None and bytes.tell() < position:
+            if not bytes.read1(position - bytes.tell()):
+                break
+
+    def __close_pool(self):
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool = None
+
+    def __prepare_dialect(self, stream):
+
+        # Dialect is given (e.g. from a stream profile)
+        if set(config.CSV_DIALECT_OPTIONS).issubset(self.__options):
+            sample = []
             class dialect(csv.excel):
                 pass
+
+        # Detect dialect
+        else:
+
+            # Get sample
+            sample = []
+            while True:
+                try:
+                    sample.append(next(stream))
+                except StopIteration:
+                    break
+                if len(sample) >= config.CSV_SAMPLE_LINES:
+                    break
+
+            # Get dialect
+            try:
+                separator = b'' if six.PY2 else ''
+                delimiter = self.__options.get('delimiter', ',\t;|')
+                dialect = csv.Sniffer().sniff(separator.join(sample), delimiter)
+                if not dialect.escapechar:
+                    dialect.doublequote = True
+            except csv.Error:
+                class dialect(csv.excel):
+                    pass
+
         for key, value in self.__options.items():
             setattr(dialect, key, value)
         # https://github.com/frictionlessdata/FrictionlessDarwinCore/issues/1
@@ -144,3 +312,73 @@ class CSVParser(Parser):
 
         self.__dialect = dialect
         return sample, dialect
+
+
+# Internal
+
+_FIELD_SEPARATOR = '\x1f'
+_ITEM_SEPARATOR = '\x1e'
+
+
+def _get_cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # To reduce tabulator import time
+        import multiprocessing
+        return multiprocessing.cpu_count()
+
+
+def _parse_range(task):
+    """Parse a byte range of a CSV file (it runs in a worker process).
+
+    Returns a tuple of parsed items, a flag if the last item has been finished
+    inside the range and an error if any. It's supposed that an item is not
+    finished if it's returned after all the lines in the range have been read.
+    Items are joined to a string by `_join_items` if possible.
+
+    """
+    path, start, end, encoding, dialect = task
+    state = {'exhausted': False}
+    def iter_lines(lines):
+        for line in lines:
+            yield line
+        state['exhausted'] = True
+    items = []
+    finished = True
+    try:
+        with io.open(path, 'rb') as file:
+            file.seek(start)
+            text = file.read(end - start).decode(encoding)
+        lines = io.StringIO(text, newline=None)
+        for item in csv.reader(iter_lines(lines), **dialect):
+            items.append(item)
+            if state['exhausted']:
+                finished = False
+    except Exception as exception:
+        return (items, finished, exception)
+    return (_join_items(items), finished, None)
+
+
+def _join_items(items):
+    """Join items by the ASCII unit/record separators.
+
+    Items are returned as they are if there are no items, an empty item
+    or a value containing a separator (the join couldn't be split back).
+
+    """
+    if not items or not all(items):
+        return items
+    text = _ITEM_SEPARATOR.join([_FIELD_SEPARATOR.join(item) for item in items])
+    if text.count(_ITEM_SEPARATOR) != len(items) - 1:
+        return items
+    if text.count(_FIELD_SEPARATOR) != sum(map(len, items)) - len(items):
+        return items
+    return text
+
+
+def _split_items(items):
+    # Items are split lazily as holding many lists triggers the garbage collector
+    if not isinstance(items, six.text_type):
+        return items
+    return (item.split(_FIELD_SEPARATOR) for item in items.split(_ITEM_SEPARATOR))
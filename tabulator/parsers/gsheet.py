@@ -17,11 +17,14 @@ class GsheetParser(Parser):
 
     # Public
 
-    options = []
+    options = [
+        'http_cache',
+    ]
 
-    def __init__(self, loader, force_parse=False):
+    def __init__(self, loader, force_parse=False, http_cache=None):
         self.__loader = loader
         self.__force_parse = force_parse
+        self.__http_cache = http_cache
         self.__stream = None
         self.__encoding = None
 
@@ -40,8 +43,12 @@ class GsheetParser(Parser):
         url = url % (key, key)
         if gid:
             url = '%s&gid=%s' % (url, gid)
+        options = {}
+        if self.__http_cache is not None:
+            options['http_cache'] = self.__http_cache
         self.__stream = Stream(
-            url, format='csv', encoding=encoding, force_parse=self.__force_parse).open()
+            url, format='csv', encoding=encoding, force_parse=self.__force_parse,
+            **options).open()
         self.__extended_rows = self.__stream.iter(extended=True)
         self.__encoding = encoding
 
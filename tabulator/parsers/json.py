@@ -27,6 +27,8 @@ class JSONParser(Parser):
         self.__property = property
         self.__force_parse = force_parse
         self.__extended_rows = None
+        self.__ignored_indexes = None
+        self.__headers = None
         self.__encoding = None
         self.__bytes = None
 
@@ -48,6 +50,8 @@ class JSONParser(Parser):
 
     def reset(self):
         helpers.reset_stream(self.__bytes)
+        self.__ignored_indexes = None
+        self.__headers = None
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -58,6 +62,11 @@ class JSONParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def project(self, ignored_indexes, headers):
+        self.__ignored_indexes = frozenset(ignored_indexes)
+        self.__headers = frozenset(headers)
+        return True
+
     # Private
 
     def __iter_extended_rows(self):
@@ -67,8 +76,15 @@ class JSONParser(Parser):
         items = ijson.items(self.__bytes, path)
         for row_number, item in enumerate(items, start=1):
             if isinstance(item, (tuple, list)):
+                if self.__ignored_indexes:
+                    item = [value for index, value in enumerate(item)
+                        if index not in self.__ignored_indexes]
                 yield (row_number, None, list(item))
             elif isinstance(item, dict):
+                if self.__headers is not None and item:
+                    # Keep the headers as missing values if none of them is present
+                    headers = self.__headers.intersection(item) or self.__headers
+                    item = dict((key, item.get(key)) for key in headers)
                 keys = []
                 values = []
                 for key in sorted(item.keys()):
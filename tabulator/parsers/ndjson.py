@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import jsonlines
+from itertools import count, islice
 from ..parser import Parser
 from .. import exceptions
 from .. import helpers
@@ -26,6 +27,11 @@ class NDJSONParser(Parser):
         self.__loader = loader
         self.__force_parse = force_parse
         self.__extended_rows = None
+        self.__lines = None
+        self.__counter = None
+        self.__ignored_indexes = None
+        self.__headers = None
+        self.__positions = False
         self.__encoding = None
         self.__chars = None
 
@@ -47,6 +53,9 @@ class NDJSONParser(Parser):
 
     def reset(self):
         helpers.reset_stream(self.__chars)
+        self.__lines = None
+        self.__ignored_indexes = None
+        self.__headers = None
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -57,14 +66,56 @@ class NDJSONParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def tell(self):
+        if not self.__positions:
+            return None
+        return helpers.tell_stream(self.__chars)
+
+    def track_positions(self, enabled=True):
+        self.__positions = enabled
+        return True
+
+    def seek(self, position, row_number):
+        self.__chars.seek(position)
+        self.__lines = None
+        self.__extended_rows = self.__iter_extended_rows(row_number)
+
+    def pushdown(self, skip=0, limit=None):
+        # Skip lines without decoding if iteration is started
+        if self.__lines is not None:
+            next(islice(self.__lines, skip, skip), None)
+            next(islice(self.__counter, skip, skip), None)
+            skip = 0
+        stop = skip + limit if limit is not None else None
+        self.__extended_rows = islice(self.__extended_rows, skip, stop)
+        return True
+
+    def project(self, ignored_indexes, headers):
+        self.__ignored_indexes = frozenset(ignored_indexes)
+        self.__headers = frozenset(headers)
+        return True
+
     # Private
 
-    def __iter_extended_rows(self):
-        rows = jsonlines.Reader(self.__chars)
-        for row_number, row in enumerate(rows, start=1):
+    def __iter_extended_rows(self, row_number=1):
+        self.__lines = helpers.iter_lines(self.__chars, self.__positions)
+        self.__counter = count(row_number)
+        reader = jsonlines.Reader(self.__lines)
+        for row_number in self.__counter:
+            try:
+                row = reader.read()
+            except EOFError:
+                break
             if isinstance(row, (tuple, list)):
+                if self.__ignored_indexes:
+                    row = [value for index, value in enumerate(row)
+                        if index not in self.__ignored_indexes]
                 yield row_number, None, list(row)
             elif isinstance(row, dict):
+                if self.__headers is not None and row:
+                    # Keep the headers as missing values if none of them is present
+                    headers = self.__headers.intersection(row) or self.__headers
+                    row = dict((key, row.get(key)) for key in headers)
                 keys, values = zip(*sorted(row.items()))
                 yield (row_number, list(keys), list(values))
             else:
@@ -30,6 +30,7 @@ class ODSParser(Parser):
         self.__sheet_pointer = sheet
         self.__force_parse = force_parse
         self.__extended_rows = None
+        self.__ignored_indexes = frozenset()
         self.__encoding = None
         self.__bytes = None
         self.__book = None
@@ -66,6 +67,7 @@ class ODSParser(Parser):
 
     def reset(self):
         helpers.reset_stream(self.__bytes)
+        self.__ignored_indexes = frozenset()
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -76,6 +78,10 @@ class ODSParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def project(self, ignored_indexes, headers):
+        self.__ignored_indexes = frozenset(ignored_indexes)
+        return True
+
     # Private
 
     def __iter_extended_rows(self):
@@ -101,4 +107,6 @@ class ODSParser(Parser):
             return value
 
         for row_number, row in enumerate(self.__sheet.rows(), start=1):
-            yield row_number, None, [type_value(cell) for cell in row]
+            ignored_indexes = self.__ignored_indexes
+            yield row_number, None, [type_value(cell)
+                for index, cell in enumerate(row) if index not in ignored_indexes]
@@ -21,6 +21,7 @@ class SQLParser(Parser):
         'table',
         'order_by',
     ]
+    thread_safe = False
 
     def __init__(self, loader, force_parse=False, table=None, order_by=None):
 
@@ -35,6 +36,8 @@ class SQLParser(Parser):
         self.__force_parse = force_parse
         self.__engine = None
         self.__extended_rows = None
+        self.__row_number = 0
+        self.__columns = None
         self.__encoding = None
 
     @property
@@ -50,10 +53,14 @@ class SQLParser(Parser):
 
     def close(self):
         if not self.closed:
+            self.__close_extended_rows()
             self.__engine.dispose()
             self.__engine = None
 
     def reset(self):
+        self.__close_extended_rows()
+        self.__row_number = 0
+        self.__columns = None
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -64,12 +71,45 @@ class SQLParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def pushdown(self, skip=0, limit=None):
+        # Rows order is undefined between queries without ORDER BY
+        if not self.__order_by:
+            return False
+        offset = self.__row_number + skip
+        self.__close_extended_rows()
+        self.__extended_rows = self.__iter_extended_rows(offset, limit)
+        return True
+
+    def project(self, ignored_indexes, headers):
+        if not self.__order_by and self.__row_number:
+            return False
+        self.__columns = list(headers)
+        self.__close_extended_rows()
+        self.__extended_rows = self.__iter_extended_rows(self.__row_number)
+        return True
+
     # Private
 
-    def __iter_extended_rows(self):
+    def __close_extended_rows(self):
+        # Release the cursor of an already started query
+        if self.__extended_rows is not None:
+            self.__extended_rows.close()
+
+    def __iter_extended_rows(self, offset=0, limit=None):
         table = sql.table(self.__table)
         order = sql.text(self.__order_by) if self.__order_by else None
-        query = sql.select(['*']).select_from(table).order_by(order)
+        columns = ['*']
+        if self.__columns:
+            columns = [sql.column(name) for name in self.__columns]
+        query = sql.select(columns).select_from(table).order_by(order)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
         result = self.__engine.execute(query)
-        for row_number, row in enumerate(iter(result), start=1):
-            yield (row_number, list(row.keys()), list(row))
+        try:
+            for row_number, row in enumerate(iter(result), start=offset + 1):
+                self.__row_number = row_number
+                yield (row_number, list(row.keys()), list(row))
+        finally:
+            result.close()
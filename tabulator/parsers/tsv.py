@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import tsv
+from itertools import islice
 from ..parser import Parser
 from .. import helpers
 
@@ -26,6 +27,8 @@ class TSVParser(Parser):
         self.__loader = loader
         self.__force_parse = force_parse
         self.__extended_rows = None
+        self.__items = None
+        self.__positions = False
         self.__encoding = None
         self.__chars = None
 
@@ -47,6 +50,7 @@ class TSVParser(Parser):
 
     def reset(self):
         helpers.reset_stream(self.__chars)
+        self.__items = None
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -57,9 +61,33 @@ class TSVParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def tell(self):
+        if not self.__positions:
+            return None
+        return helpers.tell_stream(self.__chars)
+
+    def track_positions(self, enabled=True):
+        self.__positions = enabled
+        return True
+
+    def seek(self, position, row_number):
+        self.__chars.seek(position)
+        self.__items = None
+        self.__extended_rows = self.__iter_extended_rows(row_number)
+
+    def pushdown(self, skip=0, limit=None):
+        # Skip items without building extended rows if iteration is started
+        if self.__items is not None:
+            next(islice(self.__items, skip, skip), None)
+            skip = 0
+        stop = skip + limit if limit is not None else None
+        self.__extended_rows = islice(self.__extended_rows, skip, stop)
+        return True
+
     # Private
 
-    def __iter_extended_rows(self):
-        items = tsv.un(self.__chars)
-        for row_number, item in enumerate(items, start=1):
+    def __iter_extended_rows(self, row_number=1):
+        items = tsv.un(helpers.iter_lines(self.__chars, self.__positions))
+        self.__items = enumerate(items, start=row_number)
+        for row_number, item in self.__items:
             yield (row_number, None, list(item))
@@ -31,6 +31,8 @@ class XLSParser(Parser):
         self.__fill_merged_cells = fill_merged_cells
         self.__force_parse = force_parse
         self.__extended_rows = None
+        self.__row_number = 0
+        self.__ignored_indexes = frozenset()
         self.__encoding = None
         self.__fragment = None
         self.__bytes = None
@@ -81,6 +83,8 @@ class XLSParser(Parser):
 
     def reset(self):
         helpers.reset_stream(self.__bytes)
+        self.__row_number = 0
+        self.__ignored_indexes = frozenset()
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -95,9 +99,19 @@ class XLSParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def pushdown(self, skip=0, limit=None):
+        start = self.__row_number + skip
+        stop = start + limit if limit is not None else None
+        self.__extended_rows = self.__iter_extended_rows(start, stop)
+        return True
+
+    def project(self, ignored_indexes, headers):
+        self.__ignored_indexes = frozenset(ignored_indexes)
+        return True
+
     # Private
 
-    def __iter_extended_rows(self):
+    def __iter_extended_rows(self, start=0, stop=None):
 
         def type_value(ctype, value):
             """ Detects boolean value, int value, datetime """
@@ -117,10 +131,15 @@ class XLSParser(Parser):
 
             return value
 
-        for x in range(0, self.__sheet.nrows):
+        nrows = self.__sheet.nrows
+        for x in range(start, min(stop, nrows) if stop is not None else nrows):
             row_number = x + 1
+            self.__row_number = row_number
             row = []
+            ignored_indexes = self.__ignored_indexes
             for y, value in enumerate(self.__sheet.row_values(x)):
+                if y in ignored_indexes:
+                    continue
                 value = type_value(self.__sheet.cell(x, y).ctype, value)
                 if self.__fill_merged_cells:
                     for xlo, xhi, ylo, yhi in self.__sheet.merged_cells:
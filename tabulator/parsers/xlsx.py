@@ -53,6 +53,8 @@ class XLSXParser(Parser):
         self.__preserve_formatting = preserve_formatting
         self.__adjust_floating_point_error = adjust_floating_point_error
         self.__extended_rows = None
+        self.__row_number = 0
+        self.__ignored_indexes = frozenset()
         self.__encoding = None
         self.__fragment = None
         self.__force_parse = force_parse
@@ -120,6 +122,8 @@ class XLSXParser(Parser):
 
     def reset(self):
         helpers.reset_stream(self.__bytes)
+        self.__row_number = 0
+        self.__ignored_indexes = frozenset()
         self.__extended_rows = self.__iter_extended_rows()
 
     @property
@@ -134,10 +138,50 @@ class XLSXParser(Parser):
     def extended_rows(self):
         return self.__extended_rows
 
+    def pushdown(self, skip=0, limit=None):
+        min_row = self.__row_number + skip + 1
+        max_row = min_row + limit - 1 if limit is not None else None
+        self.__extended_rows = self.__iter_extended_rows(min_row, max_row)
+        return True
+
+    def project(self, ignored_indexes, headers):
+        self.__ignored_indexes = frozenset(ignored_indexes)
+        self.__extended_rows = self.__iter_extended_rows(self.__row_number + 1)
+        return True
+
     # Private
 
-    def __iter_extended_rows(self):
-        for row_number, row in enumerate(self.__sheet.iter_rows(), start=1):
+    def __iter_extended_rows(self, min_row=1, max_row=None):
+        if max_row is not None and max_row < min_row:
+            return
+        bounds = {}
+        if min_row > 1:
+            bounds['min_row'] = min_row
+        if max_row is not None:
+            bounds['max_row'] = max_row
+
+        # Bound columns to skip leading/trailing ignored cells
+        ignored_indexes = self.__ignored_indexes
+        if ignored_indexes:
+            min_col = 1
+            while min_col - 1 in ignored_indexes:
+                min_col += 1
+            max_col = self.__sheet.max_column
+            if max_col is not None and max_col - 1 in ignored_indexes:
+                while max_col - 1 in ignored_indexes:
+                    max_col -= 1
+                if max_col >= min_col:
+                    bounds['max_col'] = max_col
+            if min_col > 1:
+                bounds['min_col'] = min_col
+            ignored_indexes = frozenset(index - min_col + 1
+                for index in ignored_indexes if index >= min_col - 1)
+
+        rows = self.__sheet.iter_rows(**bounds)
+        for row_number, row in enumerate(rows, start=min_row):
+            self.__row_number = row_number
+            if ignored_indexes:
+                row = [cell for index, cell in enumerate(row) if index not in ignored_indexes]
             yield (
                 row_number,
                 None,
@@ -4,15 +4,19 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
+import os
 import re
 import six
-import gzip
-import zipfile
-import tempfile
+import json
+import hashlib
 import warnings
+import threading
+from bisect import bisect_right
 from copy import copy
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
+from six.moves import queue, zip_longest
 from .loaders.stream import StreamLoader
 from . import exceptions
 from . import helpers
@@ -21,7 +25,6 @@ from . import config
 
 # Module API
 
-# TODO: merge pick/skip rows logic
 class Stream(object):
     """Stream of tabular data.
 
@@ -66,6 +69,34 @@ class Stream(object):
             To provide a regex pattern use  `{'type'\\: 'regex', 'value'\\: '^#'}`
             For example\\: `skip_rows=[1, '# comment', {'type'\\: 'regex', 'value'\\: '^# (regex|comment)'}]`
 
+        start_row (int, optional):
+            Number of the row to start reading from (rows start counting at 1).
+            Rows before it are not returned but used for sampling and headers.
+            If there is an up-to-date index built by `Stream.build_index`
+            the stream seeks straight to the nearest indexed row instead
+            of parsing all the previous rows.
+
+        index_path (str, optional):
+            Path to the index built by `Stream.build_index`.
+            Defaults to the source path plus ``config.INDEX_SUFFIX``.
+
+        resume_from (dict, optional):
+            Checkpoint returned by `Stream.checkpoint` to continue reading
+            after its row. For seekable sources it seeks straight to the
+            checkpoint's position instead of parsing all the previous rows.
+
+        resumable (bool, optional):
+            Keep the parser's position available so checkpoints returned
+            by `Stream.checkpoint` are resumed by a seek. It makes parsing
+            of `csv`, `tsv` and `ndjson` a bit slower so it's disabled
+            by default (it's enabled for a stream having `resume_from`).
+
+        profile (dict, optional):
+            Profile returned by `Stream.profile` for another source
+            having the same layout. Its scheme, format, compression, encoding
+            and dialect are used instead of detecting them. If the headers
+            don't match the profile, the stream warns and detects everything.
+
         pick_fields (List[Union[int, str]], optional):
             When passed, ignores all columns with headers
             that the given list DOES NOT include
@@ -86,6 +117,13 @@ class Stream(object):
             of number of rows, controls number of bytes. Defaults to
             ``config.DEFAULT_BYTES_SAMPLE_SIZE``.
 
+        read_ahead (int, optional):
+            When passed, loading, decompression and parsing are done
+            in a background thread filling a queue of at most this number
+            of row batches (``config.DEFAULT_BATCH_SIZE`` rows each).
+            It speeds up I/O bound sources. It's ignored with a warning for
+            parsers which are not thread-safe (e.g. `sql`). Defaults to None.
+
         allow_html (bool, optional):
             Allow the file source to be an HTML page.
             If False, raises ``exceptions.FormatError`` if the loaded file is
@@ -120,6 +158,11 @@ class Stream(object):
             receives a list of rows and headers, processes them, and yields
             them (or not). Useful to pre-process the data. Defaults to None.
 
+        post_parse_batches (List[function], optional):
+            The same as `post_parse` but every function
+            receives an iterator of batches (lists of extended rows) and yields
+            batches. It's applied after `post_parse`. Defaults to None.
+
         custom_loaders (dict, optional):
             Dictionary with keys as scheme names,
             and values as their respective ``Loader`` class implementations.
@@ -151,6 +194,7 @@ class Stream(object):
                  allow_html=False,
                  sample_size=config.DEFAULT_SAMPLE_SIZE,
                  bytes_sample_size=config.DEFAULT_BYTES_SAMPLE_SIZE,
+                 read_ahead=None,
                  ignore_blank_headers=False,
                  ignore_listed_headers=None,
                  ignore_not_listed_headers=None,
@@ -169,7 +213,13 @@ class Stream(object):
                  skip_rows=None,
                  limit_rows=None,
                  offset_rows=None,
+                 start_row=None,
+                 index_path=None,
+                 resume_from=None,
+                 resumable=False,
+                 profile=None,
                  post_parse=[],
+                 post_parse_batches=[],
                  custom_loaders={},
                  custom_parsers={},
                  custom_writers={},
@@ -203,43 +253,12 @@ class Stream(object):
             else:
                 self.__headers = list(headers)
 
-        # Set pick rows
+        # Set pick/skip rows
         self.__pick_rows = pick_rows
-        self.__pick_rows_by_numbers = []
-        self.__pick_rows_by_patterns = []
-        self.__pick_rows_by_comments = []
-        self.__pick_rows_by_presets = {}
-        for directive in copy(pick_rows or []):
-            if isinstance(directive, int):
-                self.__pick_rows_by_numbers.append(directive)
-            elif isinstance(directive, dict):
-                if directive['type'] == 'regex':
-                    self.__pick_rows_by_patterns.append(re.compile(directive['value']))
-                elif directive['type'] == 'preset' and directive['value'] == 'blank':
-                    self.__pick_rows_by_presets['blank'] = True
-                else:
-                    raise ValueError('Not supported pick rows: %s' % directive)
-            else:
-                self.__pick_rows_by_comments.append(str(directive))
-
-        # Set skip rows
+        self.__pick_rows_matcher = _RowsMatcher(pick_rows or [], action='pick')
         self.__skip_rows = skip_rows
-        self.__skip_rows_by_numbers = []
-        self.__skip_rows_by_patterns = []
-        self.__skip_rows_by_comments = []
-        self.__skip_rows_by_presets = {}
-        for directive in copy(skip_rows or []):
-            if isinstance(directive, int):
-                self.__skip_rows_by_numbers.append(directive)
-            elif isinstance(directive, dict):
-                if directive['type'] == 'regex':
-                    self.__skip_rows_by_patterns.append(re.compile(directive['value']))
-                elif directive['type'] == 'preset' and directive['value'] == 'blank':
-                    self.__skip_rows_by_presets['blank'] = True
-                else:
-                    raise ValueError('Not supported skip rows: %s' % directive)
-            else:
-                self.__skip_rows_by_comments.append(str(directive))
+        self.__skip_rows_matcher = _RowsMatcher(skip_rows or [], action='skip')
+        self.__skip_rows_by_numbers = self.__skip_rows_matcher.numbers
 
         # Support for pathlib.Path
         if hasattr(source, 'joinpath'):
@@ -254,6 +273,8 @@ class Stream(object):
         self.__allow_html = allow_html
         self.__sample_size = sample_size
         self.__bytes_sample_size = bytes_sample_size
+        self.__read_ahead = read_ahead
+        self.__read_ahead_rows = None
         self.__ignore_blank_headers = ignore_blank_headers
         self.__ignore_listed_headers = ignore_listed_headers
         self.__ignore_not_listed_headers = ignore_not_listed_headers
@@ -267,7 +288,14 @@ class Stream(object):
         self.__offset_fields = offset_fields
         self.__limit_rows = limit_rows
         self.__offset_rows = offset_rows
+        self.__start_row = start_row
+        self.__index_path = index_path
+        self.__resume_from = resume_from
+        self.__resumable = resumable or bool(resume_from)
+        self.__profile = profile
+        self.__profile_enabled = True
         self.__post_parse = copy(post_parse)
+        self.__post_parse_batches = copy(post_parse_batches)
         self.__custom_loaders = copy(custom_loaders)
         self.__custom_parsers = copy(custom_parsers)
         self.__custom_writers = copy(custom_writers)
@@ -275,13 +303,21 @@ class Stream(object):
         self.__actual_format = format
         self.__actual_encoding = encoding
         self.__actual_compression = compression
+        self.__detected = None
         self.__options = options
         self.__sample_extended_rows = []
+        self.__sample_row_number = 0
+        self.__parser_row_number = None
+        self.__seek_row_number = None
+        self.__pushed_down = False
+        self.__fields_pushed_down = False
         self.__field_positions = None
         self.__loader = None
+        self.__source_loader = None
         self.__parser = None
         self.__row_number = 0
         self.__stats = None
+        self.__compile_pipeline()
 
     def __enter__(self):
         if self.closed:
@@ -314,6 +350,8 @@ class Stream(object):
         """
         source = self.__source
         options = copy(self.__options)
+        profile = self.__profile if self.__profile_enabled else None
+        self.__stop_read_ahead()
 
         # Programming error assertions
         assert self.__hashing_algorithm in config.SUPPORTED_HASHING_ALGORITHMS
@@ -326,7 +364,11 @@ class Stream(object):
 
         # Get scheme and format if not already given
         compression = None
-        if self.__scheme is None or self.__format is None:
+        if profile is not None:
+            scheme = self.__scheme or profile['scheme']
+            format = self.__format or profile['format']
+            compression = self.__compression or profile['compression']
+        elif self.__scheme is None or self.__format is None:
             detected_scheme, detected_format = helpers.detect_scheme_and_format(source)
             scheme = self.__scheme or detected_scheme
             format = self.__format or detected_format
@@ -337,6 +379,7 @@ class Stream(object):
         else:
             scheme = self.__scheme
             format = self.__format
+        self.__detected = {'scheme': scheme, 'format': format, 'compression': compression}
 
         # Initiate loader
         self.__loader = None
@@ -356,27 +399,33 @@ class Stream(object):
                 self.__loader = loader_class(
                     bytes_sample_size=self.__bytes_sample_size,
                     **loader_options)
+        self.__source_loader = self.__loader
 
         # Zip compression
         if compression == 'zip' and six.PY3:
+            # To reduce tabulator import time
+            import zipfile
             source = self.__loader.load(source, mode='b')
             with zipfile.ZipFile(source) as archive:
                 name = archive.namelist()[0]
                 if 'filename' in options.keys():
                     name = options['filename']
                     del options['filename']
-                with archive.open(name) as file:
-                    source = tempfile.NamedTemporaryFile(suffix='.' + name)
-                    for line in file:
-                        source.write(line)
-                    source.seek(0)
+                # The member keeps the archive's file open after closing the archive
+                source = archive.open(name)
             # We redefine loader/format/schema after decompression
             self.__loader = StreamLoader(bytes_sample_size=self.__bytes_sample_size)
-            format = self.__format or helpers.detect_scheme_and_format(source.name)[1]
+            format = self.__format or helpers.detect_scheme_and_format(name)[1]
             scheme = 'stream'
+            # The member is read forward and rewound by restarting decompression
+            # so it's spooled to disk only if a parser needs random access
+            if format in config.ZIP_SPOOLED_FORMATS or not source.seekable():
+                source = _spool_zip_member(source, name)
 
         # Gzip compression
         elif compression == 'gz' and six.PY3:
+            # To reduce tabulator import time
+            import gzip
             name = ''
             if isinstance(source, str):
                 name = source.replace('.gz', '')
@@ -408,6 +457,10 @@ class Stream(object):
                 message = 'Format "%s" is not supported' % format
                 raise exceptions.FormatError(message)
             parser_class = helpers.import_attribute(config.PARSERS[format])
+        if profile is not None and profile.get('dialect'):
+            for key, value in profile['dialect'].items():
+                if key.lower() in parser_class.options:
+                    options.setdefault(key.lower(), value)
         parser_options = helpers.extract_options(options, parser_class.options)
         self.__parser = parser_class(self.__loader,
                 force_parse=self.__force_parse,
@@ -419,36 +472,68 @@ class Stream(object):
             message = message % (', '.join(options), scheme, format)
             warnings.warn(message, UserWarning)
 
+        # Thread-bound parser
+        if self.__read_ahead and not self.__parser.thread_safe:
+            message = 'Format "%s" is not thread-safe so "read_ahead" is ignored'
+            warnings.warn(message % format, UserWarning)
+
         # Open and setup
-        self.__parser.open(source, encoding=self.__encoding)
+        encoding = self.__encoding
+        if encoding is None and self.__resume_from:
+            encoding = self.__resume_from.get('encoding')
+        if encoding is None and profile is not None:
+            encoding = profile['encoding']
+        self.__parser.track_positions(self.__resumable)
+        self.__parser.open(source, encoding=encoding)
+        self.__fields_pushed_down = False
         self.__extract_sample()
         self.__extract_headers()
+        self.__compile_pipeline()
         if not self.__allow_html:
             self.__detect_html()
 
+        # Verify profile
+        if profile is not None and profile.get('headers') != self.__headers:
+            message = 'Source doesn\'t match the profile and it will be detected'
+            warnings.warn(message, UserWarning)
+            self.__parser.close()
+            self.__profile_enabled = False
+            try:
+                return self.open()
+            finally:
+                self.__profile_enabled = True
+
         # Set scheme/format/encoding
         self.__actual_scheme = scheme
         self.__actual_format = format
         self.__actual_encoding = self.__parser.encoding
         self.__actual_compression = compression
 
+        # Seek to the start row
+        self.__prepare_start()
+
         return self
 
     def close(self):
         """Closes the stream.
         """
+        self.__stop_read_ahead()
         self.__parser.close()
         self.__row_number = 0
 
     def reset(self):
         """Resets the stream pointer to the beginning of the file.
+
+        If `start_row` or `resume_from` is set, the stream is reset to this row.
+
         """
-        if self.__row_number > self.__sample_size:
+        read_ahead_started = self.__stop_read_ahead()
+        if (self.__row_number > self.__sample_size or self.__pushed_down or
+                self.__start_row or self.__resume_from or read_ahead_started):
             self.__stats = {'size': 0, 'hash': ''}
-            self.__parser.reset()
-            self.__extract_sample()
-            self.__extract_headers()
+            self.__reset_parser()
         self.__row_number = 0
+        self.__prepare_start()
 
     @property
     def source(self):
@@ -479,6 +564,7 @@ class Stream(object):
 
         """
         self.__headers = headers
+        self.__compile_pipeline()
 
     @property
     def scheme(self):
@@ -635,24 +721,20 @@ class Stream(object):
             raise exceptions.TabulatorException(message)
 
         # Create iterator
+        self.__parser_row_number = None
         iterator = chain(
             self.__sample_extended_rows,
-            self.__parser.extended_rows)
+            self.__get_read_ahead_rows() or self.__parser.extended_rows)
         iterator = self.__apply_processors(iterator)
 
+        # Apply limit/offset
+        if self.__limit_rows or self.__offset_rows:
+            iterator = self.__limit_offset_processor(iterator)
+
         # Yield rows from iterator
         try:
-            count = 0
             for row_number, headers, row in iterator:
                 if row_number > self.__row_number:
-                    count += 1
-                    if self.__limit_rows or self.__offset_rows:
-                        offset = self.__offset_rows or 0
-                        limit = self.__limit_rows + offset if self.__limit_rows else None
-                        if offset and count <= offset:
-                            continue
-                        if limit and count > limit:
-                            break
                     self.__row_number = row_number
                     if extended:
                         yield (row_number, headers, row)
@@ -688,11 +770,306 @@ class Stream(object):
                 break
         return result
 
-    def save(self, target, format=None,  encoding=None, **options):
-        """Save stream to the local filesystem.
+    def iter_batches(self, size=config.DEFAULT_BATCH_SIZE, keyed=False, extended=False):
+        """Iterate over the rows in batches.
+
+        It works as `Stream.iter` but returns lists of rows instead of single rows.
+        Processing is done for a whole batch at once, so it's much faster
+        for big sources. The last batch could be smaller than `size`.
+
+        # Arguments
+            size (int, optional):
+                Maximum number of rows in a batch.
+                Defaults to ``config.DEFAULT_BATCH_SIZE``.
+            keyed (bool, optional): See :func:`Stream.iter`.
+            extended (bool, optional): See :func:`Stream.iter`.
+
+        # Raises
+            exceptions.TabulatorException: If the stream is closed.
+
+        # Returns
+            Iterator[List[Union[List[Any], Dict[str, Any], Tuple[int, List[str], List[Any]]]]]:
+                Lists of rows. The format of rows depends on the values
+                of `keyed` and `extended` arguments.
+
+        """
+
+        # Error if closed
+        if self.closed:
+            message = 'Stream is closed. Please call "stream.open()" first.'
+            raise exceptions.TabulatorException(message)
+
+        # Create iterator
+        self.__parser_row_number = self.__sample_row_number
+        read_ahead_rows = self.__get_read_ahead_rows()
+        if read_ahead_rows is not None:
+            parser_batches = helpers.make_batches(read_ahead_rows, size)
+        else:
+            parser_batches = self.__track_parser_batches(self.__parser.extended_rows_batches(size))
+        batches = chain(
+            helpers.make_batches(self.__sample_extended_rows, size),
+            parser_batches)
+        batches = self.__apply_batch_processors(batches, size)
+
+        # Yield batches from iterator
+        try:
+            count = 0
+            offset = 0 if self.__pushed_down else (self.__offset_rows or 0)
+            limit = self.__limit_rows + offset if self.__limit_rows else None
+            for batch in batches:
+                if batch and batch[0][0] <= self.__row_number:
+                    batch = [item for item in batch if item[0] > self.__row_number]
+                if offset or limit:
+                    position = count
+                    count += len(batch)
+                    batch = batch[max(offset - position, 0):
+                                  max(limit - position, 0) if limit else None]
+                if batch:
+                    self.__row_number = batch[-1][0]
+                    if extended:
+                        yield batch
+                    elif keyed:
+                        yield [dict(zip(headers, row)) for _, headers, row in batch]
+                    else:
+                        yield [row for _, _, row in batch]
+                if limit and count >= limit:
+                    break
+        except UnicodeError as error:
+            message = 'Cannot parse the source "%s" using "%s" encoding at "%s"'
+            raise exceptions.EncodingError(message % (self.__source, error.encoding, error.start))
+        except Exception as error:
+            raise exceptions.SourceError(str(error))
+
+    def iter_column_batches(self, size=config.DEFAULT_BATCH_SIZE, keyed=False):
+        """Iterate over the columns in batches.
+
+        Every batch of rows (see `Stream.iter_batches`) is returned transposed
+        as a list of columns. Columns of integers or floats are returned as
+        `array.array` (or as NumPy arrays if NumPy is installed) and any other
+        columns as lists. Columns match `Stream.headers` so if headers are
+        available shorter rows are padded with `None` and longer rows are cut.
+
+        # Arguments
+            size (int, optional):
+                Maximum number of rows in a batch.
+                Defaults to ``config.DEFAULT_BATCH_SIZE``.
+            keyed (bool, optional):
+                When True, each batch is returned as an ordered
+                `dict` mapping the header name to its column. Defaults to False.
+
+        # Raises
+            exceptions.TabulatorException: If the stream is closed or
+                `keyed` is used without headers.
+
+        # Returns
+            Iterator[Union[List[Sequence[Any]], Dict[str, Sequence[Any]]]]:
+                Columns of each batch of rows.
+
+        """
+        self.__check_columns_keyed(keyed)
+        for batch in self.iter_batches(size=size):
+            buffers = []
+            for values in self.__transpose_rows(batch):
+                buffer = helpers.ColumnBuffer()
+                buffer.extend(values)
+                buffers.append(buffer)
+            yield self.__finalize_columns(buffers, keyed)
+
+    def read_columns(self, keyed=False):
+        """Returns a list of columns.
+
+        Columns are filled directly while iterating so the rows are never
+        held in memory. See `Stream.iter_column_batches` for the columns format.
+
+        # Arguments
+            keyed (bool, optional): See :func:`Stream.iter_column_batches`.
+
+        # Returns
+            Union[List[Sequence[Any]], Dict[str, Sequence[Any]]]:
+                The list of columns or an ordered `dict` mapping the header
+                name to its column.
+
+        """
+        self.__check_columns_keyed(keyed)
+        count = 0
+        buffers = [helpers.ColumnBuffer() for _ in self.__headers or []]
+        for batch in self.iter_batches():
+            columns = list(self.__transpose_rows(batch))
+            for index, values in enumerate(columns):
+                if index == len(buffers):
+                    buffer = helpers.ColumnBuffer()
+                    buffer.extend([None] * count)
+                    buffers.append(buffer)
+                buffers[index].extend(values)
+            for buffer in buffers[len(columns):]:
+                buffer.extend([None] * len(batch))
+            count += len(batch)
+        return self.__finalize_columns(buffers, keyed)
+
+    def build_index(self, every=config.DEFAULT_INDEX_EVERY, path=None):
+        """Build an index of row positions for the local file source.
+
+        The index is saved as a JSON file alongside the source. It allows
+        to open the stream at any row (see the `start_row` argument) without
+        parsing all the previous rows. The index is bound to the source
+        file's size, modification time and hash of the first bytes so
+        it's ignored if the file has been changed.
+        Only text formats like `csv`, `tsv` and `ndjson` support indexing.
+
+        # Arguments
+            every (int, optional):
+                Distance in rows between indexed positions.
+                Defaults to ``config.DEFAULT_INDEX_EVERY``.
+            path (str, optional):
+                Path to save the index. Defaults to the source path
+                plus ``config.INDEX_SUFFIX``.
+
+        # Raises
+            exceptions.TabulatorException: If the stream is closed or
+                the source is not a local file.
+
+        # Returns
+            str: Path to the saved index
+
+        """
+
+        # Error if closed
+        if self.closed:
+            message = 'Stream is closed. Please call "stream.open()" first.'
+            raise exceptions.TabulatorException(message)
+
+        # Error if not local
+        source_path = self.__get_local_path()
+        if source_path is None:
+            message = 'Only local file sources could be indexed'
+            raise exceptions.TabulatorException(message)
+
+        # Collect positions
+        checkpoints = []
+        self.__stop_read_ahead()
+        self.__parser.track_positions()
+        self.__parser.reset()
+        try:
+            for row_number, _, _ in self.__parser.extended_rows:
+                if not row_number % every:
+                    position = self.__parser.tell()
+                    if position is not None:
+                        checkpoints.append([row_number + 1, position])
+        except UnicodeError as error:
+            message = 'Cannot parse the source "%s" using "%s" encoding at "%s"'
+            raise exceptions.EncodingError(message % (self.__source, error.encoding, error.start))
+        except Exception as error:
+            raise exceptions.SourceError(str(error))
+
+        # Save index
+        index = self.__get_index_signature(source_path)
+        index['every'] = every
+        index['checkpoints'] = checkpoints
+        path = path or self.__index_path or source_path + config.INDEX_SUFFIX
+        helpers.ensure_dir(path)
+        with io.open(path, 'w', encoding='utf-8') as file:
+            file.write(six.text_type(json.dumps(index)))
+
+        # Reset stream
+        self.__parser.track_positions(self.__resumable)
+        self.__reset_parser()
+        self.__row_number = 0
+        self.__prepare_start()
+
+        return path
+
+    def checkpoint(self):
+        """Returns a checkpoint to resume reading after the last returned row.
+
+        The checkpoint is a JSON serializable dict containing the current row
+        number, position of the parser in the source and detected encoding,
+        dialect and headers. Pass it as a `resume_from` argument to a new
+        stream to continue reading. If the parser position is not available
+        (e.g. the stream is not `resumable`, the format is not seekable
+        or processors have read ahead)
+        the resumed stream will skip the previous rows by parsing.
+
+        # Raises
+            exceptions.TabulatorException: If the stream is closed.
+
+        # Returns
+            dict: Checkpoint
+
+        """
+
+        # Error if closed
+        if self.closed:
+            message = 'Stream is closed. Please call "stream.open()" first.'
+            raise exceptions.TabulatorException(message)
+
+        # Get position
+        # The parser's position is valid only if it's exactly after the last returned row
+        position = None
+        read_ahead = (self.__read_ahead or self.__post_parse or self.__post_parse_batches or
+            [number for number in self.__skip_rows_by_numbers if number < 0])
+        if not read_ahead:
+            parser_row_number = self.__parser_row_number
+            if parser_row_number is None:
+                parser_row_number = max(self.__row_number, self.__sample_row_number)
+            if parser_row_number == self.__row_number:
+                position = self.__parser.tell()
+
+        # Create checkpoint
+        checkpoint = {
+            'row_number': self.__row_number,
+            'position': position,
+            'format': self.format,
+            'encoding': self.encoding,
+            'dialect': self.dialect,
+            'headers': self.headers,
+        }
+        signature = self.__get_source_signature()
+        if signature is not None:
+            checkpoint['signature'] = signature
+
+        return checkpoint
+
+    def profile(self):
+        """Returns a profile to open other sources having the same layout.
+
+        The profile is a JSON serializable dict containing detected scheme,
+        format, compression, encoding, dialect and headers. Pass it as
+        a `profile` argument to a new stream to skip the detection.
+
+        # Raises
+            exceptions.TabulatorException: If the stream is closed.
+
+        # Returns
+            dict: Profile
+
+        """
+
+        # Error if closed
+        if self.closed:
+            message = 'Stream is closed. Please call "stream.open()" first.'
+            raise exceptions.TabulatorException(message)
+
+        # Create profile
+        profile = dict(self.__detected)
+        profile.update({
+            'encoding': self.encoding,
+            'dialect': self.dialect,
+            'headers': self.headers,
+        })
+
+        return profile
+
+    def save(self, target, format=None, encoding=None, **options):
+        """Save stream to the local filesystem, S3 or a file-like object.
+
+        An `s3://` target is written by a streaming multipart upload
+        (see `tabulator.loaders.aws.S3File`) using the `s3_endpoint_url`
+        option of the stream unless it's passed to this method.
 
         # Arguments
-            target (str): Path where to save the stream.
+            target (str/BinaryIO):
+                Path, S3 URL or a binary file-like object
+                where to save the stream.
             format (str, optional):
                 The format the stream will be saved as. If
                 None, detects from the ``target`` path. Defaults to None.
@@ -718,6 +1095,15 @@ class Stream(object):
                 raise exceptions.FormatError(message)
             writer_class = helpers.import_attribute(config.WRITERS[format])
 
+        # Prepare S3 target
+        upload = None
+        if isinstance(target, six.string_types) and target.startswith('s3://'):
+            # To reduce tabulator import time
+            from .loaders.aws import S3File
+            s3_endpoint_url = options.pop(
+                's3_endpoint_url', self.__options.get('s3_endpoint_url'))
+            upload = S3File(target, s3_endpoint_url=s3_endpoint_url)
+
         # Prepare writer options
         writer_options = helpers.extract_options(options, writer_class.options)
         if options:
@@ -727,7 +1113,10 @@ class Stream(object):
 
         # Write data to target
         writer = writer_class(**writer_options)
-        return writer.write(self.iter(), target, headers=self.headers, encoding=encoding)
+        if upload is None:
+            return writer.write(self.iter(), target, headers=self.headers, encoding=encoding)
+        with upload:
+            return writer.write(self.iter(), upload, headers=self.headers, encoding=encoding)
 
     # Private
 
@@ -739,9 +1128,11 @@ class Stream(object):
 
         # Extract sample rows
         self.__sample_extended_rows = []
+        self.__sample_row_number = 0
         for _ in range(self.__sample_size):
             try:
                 row_number, headers, row = next(self.__parser.extended_rows)
+                self.__sample_row_number = row_number
                 if self.__headers_row and self.__headers_row >= row_number:
                     if self.__check_if_row_for_skipping(row_number, headers, row):
                         self.__headers_row += 1
@@ -862,6 +1253,170 @@ class Stream(object):
                 str_headers.append(six.text_type(header) if header is not None else '')
             self.__headers = str_headers
 
+    def __reset_parser(self):
+        self.__parser.reset()
+        self.__fields_pushed_down = False
+        self.__extract_sample()
+        self.__extract_headers()
+        self.__compile_pipeline()
+
+    def __prepare_start(self):
+        self.__seek_row_number = None
+        self.__pushed_down = False
+        self.__seek_start_row()
+        self.__pushdown_fields()
+        self.__pushdown_rows()
+
+    def __seek_start_row(self):
+
+        # Resume from a checkpoint
+        if self.__resume_from:
+            checkpoint = self.__resume_from
+            self.__row_number = checkpoint['row_number']
+            if checkpoint.get('position') is None:
+                return
+            signature = self.__get_source_signature()
+            if (checkpoint.get('signature') != signature or
+                    checkpoint.get('headers') != self.__headers):
+                message = 'Checkpoint doesn\'t match the source and its position will not be used'
+                warnings.warn(message, UserWarning)
+                return
+            row_number = self.__row_number + 1
+            if row_number > self.__sample_row_number + 1:
+                self.__parser.seek(checkpoint['position'], row_number)
+                self.__seek_row_number = row_number
+            return
+
+        # Start row is not set
+        if not self.__start_row or self.__start_row <= 1:
+            return
+
+        # Skip rows before the start row
+        self.__row_number = self.__start_row - 1
+
+        # Seek to the nearest indexed position
+        index = self.__load_index()
+        if index:
+            rows = [row_number for row_number, _ in index['checkpoints']]
+            position = bisect_right(rows, self.__start_row) - 1
+            if position >= 0:
+                row_number, offset = index['checkpoints'][position]
+                if row_number > self.__sample_row_number + 1:
+                    self.__parser.seek(offset, row_number)
+                    self.__seek_row_number = row_number
+
+    def __pushdown_rows(self):
+
+        # Pushdown is not requested
+        if not self.__limit_rows and not self.__offset_rows:
+            return
+
+        # Pushdown is not safe
+        if (self.__pick_rows or self.__skip_rows or
+                self.__post_parse or self.__post_parse_batches):
+            return
+
+        # Get data rows in the sample and the next parser row
+        offset = self.__offset_rows or 0
+        limit = self.__limit_rows or None
+        sample_rows = [row_number
+            for row_number, _, _ in self.__sample_extended_rows
+            if row_number > self.__row_number]
+        parser_row_number = self.__seek_row_number or self.__sample_row_number + 1
+
+        # Offset ends in the sample
+        if offset < len(sample_rows):
+            row_number = sample_rows[offset] - 1
+            skip = max(self.__row_number + 1 - parser_row_number, 0)
+            if limit is not None:
+                limit = max(limit - (len(sample_rows) - offset), 0)
+
+        # Offset ends in the parser rows
+        else:
+            row_number = max(self.__row_number, self.__sample_row_number)
+            skip = max(self.__row_number + 1 - parser_row_number, 0)
+            skip += offset - len(sample_rows)
+
+        # Pushdown to the parser
+        if skip or limit is not None:
+            if not self.__parser.pushdown(skip, limit):
+                return
+        self.__row_number = row_number
+        self.__pushed_down = True
+
+    def __pushdown_fields(self):
+
+        # Pushdown is not requested or already applied
+        if not self.__ignored_headers_indexes or not self.__headers:
+            return
+        if self.__fields_pushed_down:
+            return
+
+        # Pushdown to the parser
+        if not self.__parser.project(self.__ignored_headers_indexes, self.__headers):
+            return
+
+        # Project the sample as the parser rows
+        projection = self.__projection
+        self.__sample_extended_rows = [
+            (row_number, headers, projection(row) if headers is None else row)
+            for row_number, headers, row in self.__sample_extended_rows]
+        self.__fields_pushed_down = True
+        self.__compile_pipeline()
+
+    def __load_index(self):
+        source_path = self.__get_local_path()
+        if source_path is None:
+            return None
+        path = self.__index_path or source_path + config.INDEX_SUFFIX
+        if not os.path.isfile(path):
+            return None
+        with io.open(path, encoding='utf-8') as file:
+            index = json.load(file)
+        signature = self.__get_index_signature(source_path)
+        for key, value in signature.items():
+            if index.get(key) != value:
+                message = 'Index "%s" is outdated and will not be used' % path
+                warnings.warn(message, UserWarning)
+                return None
+        return index
+
+    def __get_index_signature(self, source_path):
+        with io.open(source_path, 'rb') as file:
+            sample = file.read(self.__bytes_sample_size or config.DEFAULT_BYTES_SAMPLE_SIZE)
+            stat = os.fstat(file.fileno())
+        return {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'hash': getattr(hashlib, self.__hashing_algorithm)(sample).hexdigest(),
+            'hashing_algorithm': self.__hashing_algorithm,
+            'format': self.__actual_format,
+            'encoding': self.__parser.encoding,
+        }
+
+    def __get_source_signature(self):
+        source_path = self.__get_local_path()
+        if source_path is not None:
+            return self.__get_index_signature(source_path)
+        # Remote loaders could identify the loaded version (e.g. S3 ETag)
+        signature = getattr(self.__source_loader, 'signature', None)
+        if signature is not None:
+            signature = dict(signature,
+                format=self.__actual_format, encoding=self.__parser.encoding)
+        return signature
+
+    def __get_local_path(self):
+        if not isinstance(self.__source, six.string_types):
+            return None
+        if self.__actual_scheme != 'file' or self.__actual_compression:
+            return None
+        path = self.__source
+        if path.startswith('file://'):
+            path = path.replace('file://', '', 1)
+        if not os.path.isfile(path):
+            return None
+        return path
+
     def __detect_html(self):
 
         # Prepare text
@@ -879,25 +1434,6 @@ class Stream(object):
 
     def __apply_processors(self, iterator):
 
-        # Base processor
-        def builtin_processor(extended_rows):
-            for row_number, headers, row in extended_rows:
-
-                # Sync headers/row
-                if headers != self.__headers:
-                    if headers and self.__headers:
-                        keyed_row = dict(zip(headers, row))
-                        row = [keyed_row.get(header) for header in self.__headers]
-                    elif self.__ignored_headers_indexes:
-                        row = [value for index, value in enumerate(row) if index not in self.__ignored_headers_indexes]
-                    headers = self.__headers
-
-                # Skip rows by numbers/comments
-                if self.__check_if_row_for_skipping(row_number, headers, row):
-                    continue
-
-                yield (row_number, headers, row)
-
         # Skip nagative rows processor
         def skip_negative_rows(extended_rows):
             '''
@@ -922,6 +1458,13 @@ class Stream(object):
                 if i - n not in rows_to_skip:
                     yield row
 
+        # Batch processors processor
+        def post_parse_batches_processor(extended_rows):
+            batches = helpers.make_batches(extended_rows, config.DEFAULT_BATCH_SIZE)
+            for processor in self.__post_parse_batches:
+                batches = processor(batches)
+            return chain.from_iterable(batches)
+
         # Force values to strings processor
         def force_strings_processor(extended_rows):
             for row_number, headers, row in extended_rows:
@@ -929,12 +1472,14 @@ class Stream(object):
                 yield (row_number, headers, row)
 
         # Form a processors list
-        processors = [builtin_processor]
+        processors = [self.__builtin_processor]
         # if we have to delete some rows with negative index (counting from the end)
         if [n for n in self.__skip_rows_by_numbers if n < 0]:
             processors.insert(0, skip_negative_rows)
         if self.__post_parse:
             processors += self.__post_parse
+        if self.__post_parse_batches:
+            processors.append(post_parse_batches_processor)
         if self.__force_strings:
             processors.append(force_strings_processor)
 
@@ -944,71 +1489,361 @@ class Stream(object):
 
         return iterator
 
+    def __apply_batch_processors(self, batches, size):
+
+        # Base processor
+        def builtin_processor(batches):
+            for batch in batches:
+                yield list(self.__builtin_processor(batch))
+
+        # Skip nagative rows processor (see `__apply_processors`)
+        def skip_negative_rows(batches):
+            rows_to_skip = [n for n in self.__skip_rows_by_numbers if n < 0]
+            buffer_size = abs(min(rows_to_skip))
+            buffer = deque()
+
+            # Use buffer to save last rows
+            for batch in batches:
+                buffer.extend(batch)
+                if len(buffer) > buffer_size:
+                    yield [buffer.popleft() for _ in range(len(buffer) - buffer_size)]
+
+            # Now squeeze out the buffer
+            n = len(buffer)
+            yield [row for i, row in enumerate(buffer) if i - n not in rows_to_skip]
+
+        # Row processors processor
+        def post_parse_processor(batches):
+            extended_rows = chain.from_iterable(batches)
+            for processor in self.__post_parse:
+                extended_rows = processor(extended_rows)
+            return helpers.make_batches(extended_rows, size)
+
+        # Force values to strings processor
+        def force_strings_processor(batches):
+            for batch in batches:
+                yield [(row_number, headers, list(map(helpers.stringify_value, row)))
+                       for row_number, headers, row in batch]
+
+        # Form a processors list
+        processors = [builtin_processor]
+        if [n for n in self.__skip_rows_by_numbers if n < 0]:
+            processors.insert(0, skip_negative_rows)
+        if self.__post_parse:
+            processors.append(post_parse_processor)
+        if self.__post_parse_batches:
+            processors += self.__post_parse_batches
+        if self.__force_strings:
+            processors.append(force_strings_processor)
+
+        # Apply processors to batches
+        for processor in processors:
+            batches = processor(batches)
+
+        return batches
+
+    def __compile_pipeline(self):
+        ignored_indexes = self.__ignored_headers_indexes
+        if self.__fields_pushed_down:
+            ignored_indexes = []
+        size = None
+        if self.__headers is not None:
+            size = len(self.__headers) + len(ignored_indexes)
+        self.__projection = _make_projection(ignored_indexes, size)
+        self.__row_syncs = {}
+
+    def __builtin_processor(self, extended_rows):
+        stream_headers = self.__headers
+        projection = self.__projection
+        get_row_sync = self.__get_row_sync
+        check = None
+        if self.__pick_rows or self.__skip_rows:
+            check = self.__check_if_row_for_skipping
+
+        # No-op processor
+        if projection is None and check is None and stream_headers is None:
+            for row_number, _, row in extended_rows:
+                yield (row_number, None, row)
+            return
+
+        for row_number, headers, row in extended_rows:
+
+            # Sync headers/row
+            if headers is None:
+                if projection is not None and stream_headers is not None:
+                    row = projection(row)
+                headers = stream_headers
+            elif headers is not stream_headers:
+                sync = get_row_sync(headers)
+                if sync is not None:
+                    row = sync(row)
+                headers = stream_headers
+
+            # Skip rows by numbers/comments
+            if check is not None and check(row_number, headers, row):
+                continue
+
+            yield (row_number, headers, row)
+
+    def __get_row_sync(self, headers):
+        key = tuple(headers)
+        try:
+            return self.__row_syncs[key]
+        except KeyError:
+            pass
+        sync = None
+        if headers != self.__headers:
+            if headers and self.__headers:
+                sync = helpers.make_keyed_projection(headers, self.__headers)
+            else:
+                sync = self.__projection
+        if len(self.__row_syncs) < config.ROW_SYNCS_CACHE_SIZE:
+            self.__row_syncs[key] = sync
+        return sync
+
+    def __get_read_ahead_rows(self):
+        if not self.__read_ahead or not self.__parser.thread_safe:
+            return None
+        if self.__read_ahead_rows is None:
+            batches = self.__parser.extended_rows_batches(config.DEFAULT_BATCH_SIZE)
+            self.__read_ahead_rows = _ReadAheadRows(batches, self.__read_ahead)
+        return self.__read_ahead_rows
+
+    def __stop_read_ahead(self):
+        if self.__read_ahead_rows is None:
+            return False
+        self.__read_ahead_rows.stop()
+        self.__read_ahead_rows = None
+        return True
+
+    def __track_parser_batches(self, batches):
+        for batch in batches:
+            self.__parser_row_number = batch[-1][0]
+            yield batch
+
+    def __limit_offset_processor(self, extended_rows):
+        count = 0
+        offset = 0 if self.__pushed_down else (self.__offset_rows or 0)
+        limit = self.__limit_rows + offset if self.__limit_rows else None
+        for row_number, headers, row in extended_rows:
+            if row_number > self.__row_number:
+                count += 1
+                if count <= offset:
+                    continue
+                yield (row_number, headers, row)
+                # Break without reading ahead to keep the parser position
+                if limit and count >= limit:
+                    break
+                continue
+            yield (row_number, headers, row)
+
+    def __check_columns_keyed(self, keyed):
+        if self.closed:
+            message = 'Stream is closed. Please call "stream.open()" first.'
+            raise exceptions.TabulatorException(message)
+        if keyed and not self.__headers:
+            message = 'Keyed columns require the stream headers'
+            raise exceptions.TabulatorException(message)
+
+    def __transpose_rows(self, rows):
+        if self.__headers:
+            width = len(self.__headers)
+            rows = [row[:width] if len(row) > width else row for row in rows]
+            # Padding the first row makes zip_longest pad all the columns
+            if len(rows[0]) < width:
+                rows = [list(rows[0]) + [None] * (width - len(rows[0]))] + rows[1:]
+        return zip_longest(*rows)
+
+    def __finalize_columns(self, buffers, keyed):
+        columns = [buffer.finalize() for buffer in buffers]
+        if keyed:
+            return OrderedDict(zip(self.__headers, columns))
+        return columns
+
     def __check_if_row_for_skipping(self, row_number, headers, row):
 
         # Pick rows
         if self.__pick_rows:
+            return not self.__pick_rows_matcher.match(row_number, row)
+
+        # Skip rows
+        if self.__skip_rows:
+            return self.__skip_rows_matcher.match(row_number, row)
 
-            # Skip by number
-            if row_number in self.__pick_rows_by_numbers:
-                return False
+        # No pick/skip
+        return False
 
-            # Get first cell
-            cell = row[0] if row else None
 
-            # Handle blank cell/row
-            if cell in [None, '']:
-                if '' in self.__pick_rows_by_comments:
-                    return False
-                if self.__pick_rows_by_presets.get('blank'):
-                    if not list(filter(lambda cell: cell not in [None, ''], row)):
-                        return False
-                return True
+# Internal
+
+def _spool_zip_member(member, name):
+    # To reduce tabulator import time
+    import shutil
+    import tempfile
+    suffix = '.' + os.path.basename(name)
+    target = tempfile.NamedTemporaryFile(suffix=suffix)
+    with member:
+        shutil.copyfileobj(member, target, config.ZIP_SPOOL_CHUNK_SIZE)
+    target.seek(0)
+    return target
 
-            # Pick by pattern
-            for pattern in self.__pick_rows_by_patterns:
-                if bool(pattern.search(cell)):
-                    return False
 
-            # Pick by comment
-            for comment in filter(None, self.__pick_rows_by_comments):
-                if six.text_type(cell).startswith(comment):
-                    return False
+class _RowsMatcher(object):
+    """Pick/skip rows directives compiled once for fast matching.
+    """
+
+    def __init__(self, directives, action):
+        self.numbers = []
+        patterns = []
+        comments = []
+        self.__blank_preset = False
+        for directive in directives:
+            if isinstance(directive, int):
+                self.numbers.append(directive)
+            elif isinstance(directive, dict):
+                if directive['type'] == 'regex':
+                    patterns.append(re.compile(directive['value']))
+                elif directive['type'] == 'preset' and directive['value'] == 'blank':
+                    self.__blank_preset = True
+                else:
+                    raise ValueError('Not supported %s rows: %s' % (action, directive))
+            else:
+                comments.append(str(directive))
+        self.__numbers = frozenset(self.numbers)
+        self.__patterns = _combine_patterns(patterns)
+        self.__comments = tuple(filter(None, comments))
+        self.__blank_comment = '' in comments
+
+    def match(self, row_number, row):
 
-            # Default
+        # Match by number
+        if row_number in self.__numbers:
             return True
 
-        # Skip rows
-        if self.__skip_rows:
+        # Get first cell
+        cell = row[0] if row else None
 
-            # Skip by number
-            if row_number in self.__skip_rows_by_numbers:
+        # Handle blank cell/row
+        if cell is None or cell == '':
+            if self.__blank_comment:
                 return True
-
-            # Get first cell
-            cell = row[0] if row else None
-
-            # Handle blank cell/row
-            if cell in [None, '']:
-                if '' in self.__skip_rows_by_comments:
-                    return True
-                if self.__skip_rows_by_presets.get('blank'):
-                    if not list(filter(lambda cell: cell not in [None, ''], row)):
-                        return True
-                return False
-
-            # Skip by pattern
-            for pattern in self.__skip_rows_by_patterns:
-                if bool(pattern.search(cell)):
-                    return True
-
-            # Skip by comment
-            for comment in filter(None, self.__skip_rows_by_comments):
-                if six.text_type(cell).startswith(comment):
-                    return True
-
-            # Default
+            if self.__blank_preset:
+                return all(cell is None or cell == '' for cell in row)
             return False
 
-        # No pick/skip
+        # Match by pattern
+        for pattern in self.__patterns:
+            if pattern.search(cell):
+                return True
+
+        # Match by comment
+        if self.__comments:
+            return six.text_type(cell).startswith(self.__comments)
+
+        return False
+
+
+class _ReadAheadRows(object):
+    """Iterator over rows of batches read in a background thread.
+
+    Batches are put to a bounded queue so the reading is paused
+    if the consumer is slower. An exception is re-raised in the consumer.
+    Rows of the current batch are kept between iterations.
+
+    """
+
+    # Public
+
+    def __init__(self, batches, size):
+        self.__queue = queue.Queue(size)
+        self.__stopped = threading.Event()
+        self.__finished = False
+        self.__rows = iter([])
+        self.__thread = threading.Thread(target=self.__produce, args=(batches,))
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def __iter__(self):
+        while True:
+            for row in self.__rows:
+                yield row
+            if self.__finished:
+                return
+            kind, value = self.__queue.get()
+            if kind == 'error':
+                self.__finished = True
+                raise value
+            if kind == 'end':
+                self.__finished = True
+                return
+            self.__rows = iter(value)
+
+    def stop(self):
+        self.__stopped.set()
+        self.__thread.join()
+
+    # Private
+
+    def __produce(self, batches):
+        try:
+            for batch in batches:
+                if not self.__put('batch', batch):
+                    return
+        except Exception as exception:
+            self.__put('error', exception)
+            return
+        self.__put('end', None)
+
+    def __put(self, kind, value):
+        while not self.__stopped.is_set():
+            try:
+                self.__queue.put((kind, value), timeout=config.READ_AHEAD_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
         return False
+
+
+def _make_projection(ignored_indexes, size=None):
+    """Return a function removing ignored indexes from a row (or None).
+
+    Rows of the given size (e.g. matching the headers) take a single getter call.
+
+    """
+    if not ignored_indexes:
+        return None
+    ignored = frozenset(ignored_indexes)
+    last = max(ignored)
+    getter = helpers.make_getter([index for index in range(last) if index not in ignored])
+    sized_getter = None
+    if size is not None and size > last:
+        sized_getter = helpers.make_getter([index for index in range(size) if index not in ignored])
+    else:
+        size = None
+    def projection(row):
+        if len(row) == size:
+            return sized_getter(row)
+        if len(row) > last:
+            return getter(row) + list(row[last + 1:])
+        return [value for index, value in enumerate(row) if index not in ignored]
+    return projection
+
+
+def _combine_patterns(patterns):
+    """Combine patterns into one alternation where it's safe.
+
+    Patterns having groups (backreferences) or global flags
+    are kept as they are because they can't be safely combined.
+
+    """
+    flags = re.compile(type(patterns[0].pattern)()).flags if patterns else 0
+    simple = [pattern for pattern in patterns
+        if not pattern.groups and pattern.flags == flags]
+    others = [pattern for pattern in patterns if pattern not in simple]
+    if len(simple) > 1:
+        source = '|'.join('(?:%s)' % pattern.pattern for pattern in simple)
+        try:
+            simple = [re.compile(source)]
+        except (re.error, TypeError):
+            pass
+    return simple + others
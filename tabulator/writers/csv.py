@@ -4,7 +4,6 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-import io
 import six
 import unicodecsv
 from ..writer import Writer
@@ -35,9 +34,8 @@ class CSVWriter(Writer):
         self.__options = options
 
     def write(self, source, target, headers, encoding=None):
-        helpers.ensure_dir(target)
         count = 0
-        with io.open(target, 'wb') as file:
+        with helpers.open_target(target) as file:
             writer = unicodecsv.writer(file, encoding=encoding, **self.__options)
             if headers:
                 writer.writerow(headers)
@@ -4,7 +4,6 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-import json
 from ..writer import Writer
 from .. import helpers
 
@@ -13,28 +12,53 @@ from .. import helpers
 
 class JSONWriter(Writer):
     """JSON writer.
+
+    Rows are written one by one as they are read so memory usage
+    doesn't depend on the number of rows. By default the output is indented
+    as `json.dump(data, indent=2)` would do except for values not supported
+    by JSON (see `helpers.get_json_encoder`): NaN and infinite numbers are
+    written as `null` instead of invalid `NaN`/`Infinity` tokens. The `compact`
+    option removes the whitespace and uses `orjson`/`ujson` if installed.
+
     """
 
     # Public
 
     options = [
         'keyed',
+        'compact',
     ]
 
-    def __init__(self, keyed=False):
+    def __init__(self, keyed=False, compact=False):
         self.__keyed = keyed
+        self.__compact = compact
 
     def write(self, source, target, headers, encoding=None):
-        helpers.ensure_dir(target)
-        data = []
+        if self.__compact:
+            encode = helpers.get_json_encoder()
+            separators = (b'', b',', b']')
+        else:
+            encode = _make_indented_encoder()
+            separators = (b'\n  ', b',\n  ', b'\n]')
         count = 0
-        if not self.__keyed:
-            data.append(headers)
-        for row in source:
-            if self.__keyed:
-                row = dict(zip(headers, row))
-            data.append(row)
-            count += 1
-        with open(target, 'w') as file:
-            json.dump(data, file, indent=2)
+        with helpers.open_target(target) as file:
+            file.write(b'[')
+            separator = separators[0]
+            if not self.__keyed:
+                file.write(separator + encode(headers))
+                separator = separators[1]
+            for row in source:
+                if self.__keyed:
+                    row = dict(zip(headers, row))
+                file.write(separator + encode(row))
+                separator = separators[1]
+                count += 1
+            file.write(separators[2] if separator == separators[1] else b']')
         return count
+
+
+# Internal
+
+def _make_indented_encoder():
+    encode = helpers.get_json_encoder(indent=2)
+    return lambda value: encode(value).replace(b'\n', b'\n  ')
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from ..writer import Writer
+from .. import helpers
+
+
+# Module API
+
+class NDJSONWriter(Writer):
+    """NDJSON (JSON Lines) writer.
+
+    Every row is written as a line of compact JSON (using `orjson`/`ujson`
+    if installed). Without the `keyed` option the first line is the headers.
+
+    """
+
+    # Public
+
+    options = [
+        'keyed',
+    ]
+
+    def __init__(self, keyed=False):
+        self.__keyed = keyed
+
+    def write(self, source, target, headers, encoding=None):
+        encode = helpers.get_json_encoder()
+        count = 0
+        with helpers.open_target(target) as file:
+            if not self.__keyed:
+                file.write(encode(headers) + b'\n')
+            for row in source:
+                if self.__keyed:
+                    row = dict(zip(headers, row))
+                file.write(encode(row) + b'\n')
+                count += 1
+        return count
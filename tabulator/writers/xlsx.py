@@ -34,7 +34,8 @@ class XLSXWriter(Writer):
         self.__options = options
 
     def write(self, source, target, headers, encoding=None):
-        helpers.ensure_dir(target)
+        if not hasattr(target, 'write'):
+            helpers.ensure_dir(target)
         count = 0
         wb = openpyxl.Workbook(write_only=True)
         ws = wb.create_sheet(title=self.__options.get('sheet'))
@@ -4,8 +4,21 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
+import re
+import sys
 import pytest
+import hashlib
 import sqlite3
+import threading
+from six.moves import BaseHTTPServer, socketserver
+
+
+# Settings
+
+# Async syntax is not available
+if sys.version_info < (3, 5):
+    collect_ignore = ['test_asyncstream.py']
 
 
 # Fixtures
@@ -19,3 +32,100 @@ def database_url(tmpdir):
     conn.commit()
     yield 'sqlite:///%s' % path
     conn.close()
+
+
+@pytest.fixture(params=['orjson', 'ujson', 'json'])
+def json_backend(request, monkeypatch):
+    """JSON encoder backend used by `helpers.get_json_encoder`.
+
+    Tests are skipped for not installed backends. The backends preferred
+    to the requested one are hidden so it's imported instead.
+
+    """
+    from tabulator import helpers
+    backends = ['orjson', 'ujson', 'json']
+    pytest.importorskip(request.param)
+    for name in backends[:backends.index(request.param)]:
+        monkeypatch.setitem(sys.modules, name, None)
+    monkeypatch.setattr(helpers, '_JSON_ENCODER', None)
+    yield request.param
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP server for remote sources.
+
+    It serves `http_server.files` by path or local files relative to the
+    working directory and logs the requested paths to `http_server.requests`
+    (and the `Range` headers to `http_server.ranges`). The behaviour is set
+    by `http_server.settings`:
+    - etags: responses have an ETag so conditional requests
+      are answered with `304 Not Modified`
+    - ranges: `Range` requests are answered with `206 Partial Content`
+
+    """
+    files = {}
+    requests = []
+    ranges = []
+    settings = {'etags': True, 'ranges': True}
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            self.respond(head=True)
+
+        def do_GET(self):
+            requests.append(self.path)
+            self.respond()
+
+        def respond(self, head=False):
+            body = files.get(self.path)
+            if body is None:
+                try:
+                    with io.open(self.path.lstrip('/'), 'rb') as file:
+                        body = file.read()
+                except IOError:
+                    self.send_error(404)
+                    return
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            if settings['etags'] and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            match = re.match(r'bytes=(\d+)-(\d+)$', self.headers.get('Range') or '')
+            if settings['ranges'] and match and not head:
+                ranges.append(self.headers['Range'])
+                start, end = int(match.group(1)), int(match.group(2))
+                self.send_response(206)
+                self.send_header('Content-Range', 'bytes %s-%s/%s' % (start, end, len(body)))
+                body = body[start:end + 1]
+            else:
+                self.send_response(200)
+            if settings['etags']:
+                self.send_header('ETag', etag)
+            if settings['ranges']:
+                self.send_header('Accept-Ranges', 'bytes')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if not head:
+                self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+        daemon_threads = True
+
+    server = Server(('127.0.0.1', 0), Handler)
+    server.url = 'http://127.0.0.1:%s' % server.server_port
+    server.files = files
+    server.requests = requests
+    server.ranges = ranges
+    server.settings = settings
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
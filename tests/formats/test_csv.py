@@ -7,8 +7,9 @@ from __future__ import unicode_literals
 import io
 import pytest
 from mock import Mock
-from tabulator import Stream
+from tabulator import Stream, config
 from tabulator.parsers.csv import CSVParser
+from tabulator.parsers import csv as csv_parser
 BASE_URL = 'https://raw.githubusercontent.com/okfn/tabulator-py/master/%s'
 
 
@@ -155,6 +156,72 @@ def test_stream_csv_quotechar_is_empty_string():
         stream.read() == ['value1', 'value2"', 'value3']
 
 
+def test_stream_csv_workers(tmpdir, monkeypatch):
+    monkeypatch.setattr(config, 'CSV_PARALLEL_CHUNK_SIZE', 64)
+    monkeypatch.setattr(csv_parser, '_get_cpu_count', lambda: 4)
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8', newline='') as file:
+        file.write('id,name\r\n')
+        for number in range(1, 201):
+            if number % 7:
+                file.write('%s,name-%s-中国人\r\n' % (number, number))
+            else:
+                file.write('%s,"multi\nline\n\nname ""%s"""\r\n' % (number, number))
+    options = {'headers': 1, 'skip_rows': [5, 100], 'limit_rows': 180}
+    with Stream(source, **options) as stream:
+        expected = stream.read(extended=True)
+    with Stream(source, workers=3, **options) as stream:
+        assert stream.read(extended=True) == expected
+        stream.reset()
+        assert stream.read(extended=True) == expected
+    with Stream(source) as stream:
+        expected = stream.read()
+        size, hash = stream.size, stream.hash
+    with Stream(source, workers=2) as stream:
+        assert stream.read() == expected
+        assert stream.size == size
+        assert stream.hash == hash
+
+
+def test_stream_csv_workers_quoted_newlines_across_ranges(tmpdir, monkeypatch):
+    monkeypatch.setattr(config, 'CSV_PARALLEL_CHUNK_SIZE', 16)
+    monkeypatch.setattr(csv_parser, '_get_cpu_count', lambda: 4)
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8', newline='') as file:
+        file.write('id,text\n1,"%s"\n2,end\n' % '\n'.join(['a,b'] * 40))
+    with Stream(source, workers=2) as stream:
+        assert stream.read() == [
+            ['id', 'text'], ['1', '\n'.join(['a,b'] * 40)], ['2', 'end']]
+
+
+def test_stream_csv_workers_separators_in_values(tmpdir, monkeypatch):
+    monkeypatch.setattr(config, 'CSV_PARALLEL_CHUNK_SIZE', 16)
+    monkeypatch.setattr(csv_parser, '_get_cpu_count', lambda: 4)
+    source = str(tmpdir.join('table.csv'))
+    rows = [['id', 'text']] + [[str(number), 'a\x1fb\x1ec'] for number in range(20)]
+    with io.open(source, 'w', encoding='utf-8', newline='') as file:
+        file.write(''.join('%s,%s\n' % tuple(row) for row in rows) + '""\n')
+    with Stream(source, workers=2) as stream:
+        assert stream.read() == rows + [['']]
+
+
+def test_stream_csv_workers_single_cpu(tmpdir, monkeypatch):
+    monkeypatch.setattr(config, 'CSV_PARALLEL_CHUNK_SIZE', 16)
+    monkeypatch.setattr(csv_parser, '_get_cpu_count', lambda: 1)
+    monkeypatch.setattr('multiprocessing.Pool', Mock(side_effect=RuntimeError))
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8') as file:
+        file.write('id\n' + ''.join('%s\n' % number for number in range(100)))
+    with Stream(source, headers=1, workers=4) as stream:
+        assert len(stream.read()) == 100
+
+
+def test_stream_csv_workers_not_local_file():
+    source = 'id,name\n1,english\n'
+    with Stream(source, scheme='text', format='csv', workers=2) as stream:
+        assert stream.read() == [['id', 'name'], ['1', 'english']]
+
+
 # Write
 
 def test_stream_save_csv(tmpdir):
@@ -170,6 +237,15 @@ def test_stream_save_csv(tmpdir):
         ]
 
 
+def test_stream_save_csv_file_like():
+    target = io.BytesIO()
+    with Stream('data/table.csv', headers=1) as stream:
+        assert stream.save(target, format='csv') == 2
+    assert not target.closed
+    assert target.getvalue().decode('utf-8').splitlines() == [
+        'id,name', '1,english', '2,中国人']
+
+
 # Internal
 
 def test_parser_csv():
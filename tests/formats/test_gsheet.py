@@ -5,7 +5,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import pytest
-from tabulator import Stream, exceptions
+from tabulator import Stream, HTTPCache, exceptions
 
 
 # Read
@@ -24,6 +24,15 @@ def test_stream_gsheet_with_gid():
         assert stream.read() == [['id', 'name'], ['2', '中国人'], ['3', 'german']]
 
 
+@pytest.mark.remote
+def test_stream_gsheet_http_cache(tmpdir):
+    cache = HTTPCache(str(tmpdir))
+    source = 'https://docs.google.com/spreadsheets/d/1mHIWnDvW9cALRMq9OdNfRwjAthCUFUOACPp0Lkyl7b4/edit?usp=sharing'
+    with Stream(source, http_cache=cache) as stream:
+        assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+    assert cache.stats['misses'] == 1
+
+
 @pytest.mark.remote
 def test_stream_gsheet_bad_url():
     stream = Stream('https://docs.google.com/spreadsheets/d/bad')
@@ -7,10 +7,17 @@ from __future__ import unicode_literals
 import io
 import json
 import pytest
+import decimal
+import datetime
 from mock import Mock
 from tabulator import Stream, exceptions
 from tabulator.parsers.json import JSONParser
 BASE_URL = 'https://raw.githubusercontent.com/okfn/tabulator-py/master/%s'
+VALUES = [
+    ['id', 'date', 'datetime', 'decimal', 'nan', 'name'],
+    [1, datetime.date(2026, 10, 18), datetime.datetime(2026, 10, 18, 12, 30),
+        decimal.Decimal('1.5'), float('nan'), '中国人'],
+]
 
 
 # Read
@@ -89,6 +96,53 @@ def test_stream_save_json_keyed(tmpdir):
         ]
 
 
+def test_stream_save_json_empty(tmpdir):
+    target = str(tmpdir.join('table.json'))
+    with Stream([['id', 'name']], headers=1) as stream:
+        assert stream.save(target, keyed=True) == 0
+    with open(target) as file:
+        assert file.read() == '[]'
+
+
+@pytest.mark.parametrize('keyed', [False, True])
+def test_stream_save_json_compact(keyed):
+    target = io.BytesIO()
+    with Stream('data/table.csv', headers=1) as stream:
+        assert stream.save(target, format='json', keyed=keyed, compact=True) == 2
+    text = target.getvalue().decode('utf-8')
+    assert ' ' not in text and '\n' not in text
+    with Stream('data/table.csv', headers=1) as stream:
+        rows = stream.read(keyed=keyed)
+    assert json.loads(text) == (rows if keyed else [['id', 'name']] + rows)
+
+
+def test_stream_save_json_compact_values(json_backend):
+    target = io.BytesIO()
+    with Stream(VALUES, headers=1) as stream:
+        assert stream.save(target, format='json', keyed=True, compact=True) == 1
+    assert target.getvalue() == (
+        b'[{"id":1,"date":"2026-10-18","datetime":"2026-10-18T12:30:00",'
+        b'"decimal":1.5,"nan":null,"name":"\xe4\xb8\xad\xe5\x9b\xbd\xe4\xba\xba"}]')
+
+
+def test_stream_save_json_non_finite_numbers():
+    # NaN/Infinity tokens (written by `json.dump` before v1.54) are not valid JSON
+    target = io.BytesIO()
+    with Stream([['nan', 'inf'], [float('nan'), float('-inf')]], headers=1) as stream:
+        assert stream.save(target, format='json') == 1
+    assert target.getvalue() == b'[\n  [\n    "nan",\n    "inf"\n  ],\n  [\n    null,\n    null\n  ]\n]'
+
+
+def test_stream_save_json_values():
+    target = io.BytesIO()
+    with Stream(VALUES, headers=1) as stream:
+        assert stream.save(target, format='json') == 1
+    assert json.loads(target.getvalue().decode('utf-8')) == [
+        ['id', 'date', 'datetime', 'decimal', 'nan', 'name'],
+        [1, '2026-10-18', '2026-10-18T12:30:00', 1.5, None, '中国人'],
+    ]
+
+
 # Internal
 
 def test_parser_json():
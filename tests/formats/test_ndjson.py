@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 import io
 import pytest
+import decimal
+import datetime
 from mock import Mock
 from six import StringIO
 from tabulator import exceptions, Stream
@@ -22,6 +24,46 @@ def test_stream_ndjson():
             {'id': 2, 'name': '中国人'}]
 
 
+# Write
+
+@pytest.mark.parametrize('format', ['ndjson', 'jsonl'])
+def test_stream_save_ndjson(tmpdir, format, json_backend):
+    target = str(tmpdir.join('table.%s' % format))
+    with Stream('data/table.csv', headers=1) as stream:
+        assert stream.save(target) == 2
+    with io.open(target, encoding='utf-8') as file:
+        assert file.read() == '["id","name"]\n["1","english"]\n["2","中国人"]\n'
+    with Stream(target, headers=1) as stream:
+        assert stream.headers == ['id', 'name']
+        assert stream.read() == [['1', 'english'], ['2', '中国人']]
+
+
+def test_stream_save_ndjson_keyed():
+    target = io.BytesIO()
+    with Stream('data/table.csv', headers=1) as stream:
+        assert stream.save(target, format='ndjson', keyed=True) == 2
+    target.seek(0)
+    with Stream(target, format='ndjson', headers=1) as stream:
+        assert stream.headers == ['id', 'name']
+        assert stream.read(keyed=True) == [
+            {'id': '1', 'name': 'english'},
+            {'id': '2', 'name': '中国人'},
+        ]
+
+
+def test_stream_save_ndjson_values(json_backend):
+    target = io.BytesIO()
+    source = [
+        ['id', 'datetime', 'decimal', 'inf'],
+        [1, datetime.datetime(2026, 10, 18, 12, 30), decimal.Decimal('1.5'), float('inf')],
+    ]
+    with Stream(source, headers=1) as stream:
+        assert stream.save(target, format='ndjson') == 1
+    assert target.getvalue() == (
+        b'["id","datetime","decimal","inf"]\n'
+        b'[1,"2026-10-18T12:30:00",1.5,null]\n')
+
+
 # Internal
 
 def test_parser_ndjson():
@@ -68,6 +68,17 @@ def test_stream_ods_with_ints_floats_dates():
                                  [1969, 11.7, datetime(2012, 8, 23).date(), datetime(2012, 8, 23, 20, 40, 59)]]
 
 
+@pytest.mark.parametrize('sample_size', [1, 2, 100])
+def test_stream_ods_pick_fields(sample_size):
+    source = 'data/special/table-with-ints-floats-dates.ods'
+    options = {'headers': 1, 'sample_size': sample_size}
+    with Stream(source, pick_fields=['Float', 'Datetime'], **options) as stream:
+        assert stream.headers == ['Float', 'Datetime']
+        assert stream.read() == [[3.3, datetime(2009, 8, 16, 5, 43, 21)],
+                                 [5.6, datetime(2009, 9, 20, 15, 30, 0)],
+                                 [11.7, datetime(2012, 8, 23, 20, 40, 59)]]
+
+
 # Internal
 
 def test_parser_ods():
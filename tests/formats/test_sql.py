@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import pytest
 from tabulator import Stream, exceptions
+from tabulator.parsers.sql import SQLParser
 
 
 # Read
@@ -15,6 +16,31 @@ def test_stream_format_sql(database_url):
         assert stream.read() == [[1, 'english'], [2, '中国人']]
 
 
+def test_stream_format_sql_limit_offset_rows(database_url):
+    with Stream(database_url, table='data', order_by='id', sample_size=0,
+            offset_rows=1, limit_rows=1) as stream:
+        assert stream.read(extended=True) == [(2, None, [2, '中国人'])]
+    with Stream(database_url, table='data', order_by='id', sample_size=1,
+            offset_rows=1) as stream:
+        assert stream.read() == [[2, '中国人']]
+
+
+def test_stream_format_sql_limit_offset_rows_without_order_by(database_url):
+    with Stream(database_url, table='data', sample_size=1,
+            offset_rows=1, limit_rows=1) as stream:
+        assert stream.read() == [[2, '中国人']]
+
+
+def test_parser_sql_pushdown_requires_order_by(database_url):
+    parser = SQLParser(None, table='data')
+    parser.open(database_url)
+    assert next(parser.extended_rows) == (1, ['id', 'name'], [1, 'english'])
+    assert parser.pushdown(skip=0, limit=1) is False
+    assert parser.project([0], ['name']) is False
+    assert list(parser.extended_rows) == [(2, ['id', 'name'], [2, '中国人'])]
+    parser.close()
+
+
 def test_stream_format_sql_order_by(database_url):
     with Stream(database_url, table='data', order_by='id') as stream:
         assert stream.read() == [[1, 'english'], [2, '中国人']]
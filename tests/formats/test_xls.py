@@ -22,6 +22,24 @@ def test_stream_local_xls():
         assert stream.read() == [['id', 'name'], [1, 'english'], [2, '中国人']]
 
 
+@pytest.mark.parametrize('sample_size', [1, 2, 100])
+def test_stream_xls_limit_offset_rows(sample_size):
+    options = {'headers': 1, 'sample_size': sample_size}
+    with Stream('data/table.xls', offset_rows=1, **options) as stream:
+        assert stream.read(extended=True) == [(3, ['id', 'name'], [2, '中国人'])]
+    with Stream('data/table.xls', limit_rows=1, **options) as stream:
+        assert stream.read(extended=True) == [(2, ['id', 'name'], [1, 'english'])]
+
+
+@pytest.mark.parametrize('sample_size', [1, 2, 100])
+def test_stream_xls_pick_fields(sample_size):
+    source = 'data/special/table-with-ints-floats-dates.xls'
+    options = {'headers': 1, 'sample_size': sample_size}
+    with Stream(source, skip_fields=['Int'], **options) as stream:
+        assert stream.headers == ['Float', 'Date']
+        assert [row[0] for row in stream.read()] == [3.3, 5.6, 11.7]
+
+
 @pytest.mark.remote
 def test_stream_remote_xls():
     with Stream(BASE_URL % 'data/table.xls') as stream:
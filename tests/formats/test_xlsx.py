@@ -16,6 +16,17 @@ BASE_URL = "https://raw.githubusercontent.com/frictionlessdata/tabulator-py/mast
 # Read
 
 
+@pytest.mark.parametrize('sample_size', [1, 2, 100])
+def test_stream_xlsx_limit_offset_rows(sample_size):
+    options = {'headers': 1, 'sample_size': sample_size}
+    with Stream('data/table.xlsx', offset_rows=1, **options) as stream:
+        assert stream.read(extended=True) == [(3, ['id', 'name'], [2, '中国人'])]
+    with Stream('data/table.xlsx', limit_rows=1, **options) as stream:
+        assert stream.read(extended=True) == [(2, ['id', 'name'], [1, 'english'])]
+    with Stream('data/table.xlsx', offset_rows=5, **options) as stream:
+        assert stream.read() == []
+
+
 def test_stream_xlsx_stream():
     source = io.open("data/table.xlsx", mode="rb")
     with Stream(source, format="xlsx") as stream:
@@ -174,6 +185,16 @@ def test_stream_save_xlsx_sheet_name(tmpdir):
         ]
 
 
+def test_stream_save_xlsx_file_like():
+    target = io.BytesIO()
+    with Stream("data/table.csv", headers=1) as stream:
+        assert stream.save(target, format="xlsx") == 2
+    target.seek(0)
+    with Stream(target, format="xlsx", headers=1) as stream:
+        assert stream.headers == ["id", "name"]
+        assert stream.read() == [["1", "english"], ["2", "中国人"]]
+
+
 # Internal
 
 
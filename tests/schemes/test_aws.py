@@ -4,26 +4,28 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
 import os
-import six
-import sys
 import boto3
 import pytest
+import time
 import string
 import random
-import subprocess
 from moto import mock_s3
-from tabulator import Stream, exceptions
+from moto.s3 import models as s3_models
+from tabulator import Stream, MultiStream, exceptions, config
+from tabulator.loaders import aws
+from tabulator.loaders.aws import _S3Object
 
 # Setup
 
 S3_ENDPOINT_URL = os.environ['S3_ENDPOINT_URL'] = 'http://localhost:5000'
+LARGE_CSV = b'id,name\n' + b''.join(
+    b'%d,name%d\n' % (number, number) for number in range(1, 1001))
 
 
 # Read
 
-# https://github.com/frictionlessdata/tabulator-py/issues/271
-@pytest.mark.skip
 def test_stream_s3(s3_client, bucket):
 
     # Upload a file
@@ -39,8 +41,6 @@ def test_stream_s3(s3_client, bucket):
         assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
 
 
-# https://github.com/frictionlessdata/tabulator-py/issues/271
-@pytest.mark.skip
 def test_stream_s3_endpoint_url(s3_client, bucket):
 
     # Upload a file
@@ -56,25 +56,233 @@ def test_stream_s3_endpoint_url(s3_client, bucket):
         assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
 
 
-# https://github.com/frictionlessdata/tabulator-py/issues/271
-@pytest.mark.skip
 def test_stream_s3_non_existent_file(s3_client, bucket):
     with pytest.raises(exceptions.IOError):
         Stream('s3://%s/table.csv' % bucket).open()
 
 
+@pytest.mark.parametrize('s3_spool', [False, True])
+def test_stream_s3_ranges(s3_client, bucket, monkeypatch, s3_spool):
+    monkeypatch.setattr(config, 'S3_CHUNK_SIZE', 1000)
+    s3_client.put_object(Body=LARGE_CSV, Bucket=bucket, Key='table.csv')
+    source = 's3://%s/table.csv' % bucket
+    with Stream(source, headers=1, s3_spool=s3_spool) as stream:
+        rows = stream.read()
+        assert rows[0] == ['1', 'name1']
+        assert rows[-1] == ['1000', 'name1000']
+        assert len(rows) == 1000
+        stream.reset()
+        assert stream.read() == rows
+
+
+def test_stream_s3_parallel(s3_client, bucket, monkeypatch):
+    monkeypatch.setattr(config, 'S3_CHUNK_SIZE', 1000)
+    s3_client.put_object(Body=LARGE_CSV, Bucket=bucket, Key='table.csv')
+    aws.s3_stats(reset=True)
+    with Stream('s3://%s/table.csv' % bucket, headers=1, s3_parallel=4) as stream:
+        rows = stream.read()
+        assert rows[-1] == ['1000', 'name1000']
+        assert len(rows) == 1000
+        stream.reset()
+        assert stream.read() == rows
+    stats = aws.s3_stats()
+    assert stats['requests'] == 12
+    assert stats['bytes'] == len(LARGE_CSV)
+    assert stats['transfer_time'] > 0
+
+
+def test_stream_s3_checkpoint_resume_from(s3_client, bucket):
+    source = 's3://%s/table.csv' % bucket
+    s3_client.put_object(Body=LARGE_CSV, Bucket=bucket, Key='table.csv')
+    with Stream(source, headers=1, resumable=True) as stream:
+        stream.read(limit=500)
+        checkpoint = stream.checkpoint()
+    assert checkpoint['position'] is not None
+    assert checkpoint['signature']['size'] == len(LARGE_CSV)
+    with Stream(source, headers=1, resume_from=checkpoint) as stream:
+        assert stream.read(limit=1) == [['501', 'name501']]
+
+    # Changed object of the same size
+    s3_client.put_object(Body=LARGE_CSV.replace(b'name', b'NAME'), Bucket=bucket, Key='table.csv')
+    with pytest.warns(UserWarning, match='Checkpoint'):
+        with Stream(source, headers=1, resume_from=checkpoint) as stream:
+            assert stream.read(limit=1) == [['501', 'NAME501']]
+
+
+def test_stream_s3_client_reused(s3_client, bucket):
+    s3_client.put_object(Body=b'id\n1\n', Bucket=bucket, Key='table.csv')
+    aws.get_client(S3_ENDPOINT_URL)
+    aws.s3_stats(reset=True)
+    for _ in range(3):
+        with Stream('s3://%s/table.csv' % bucket) as stream:
+            assert stream.read() == [['id'], ['1']]
+    stats = aws.s3_stats()
+    assert stats['clients'] == 0
+    assert stats['client_hits'] == 3
+    assert stats['requests'] == 3
+
+
+def test_loader_s3_get_client(s3_client, monkeypatch):
+    client = aws.get_client(S3_ENDPOINT_URL)
+    assert aws.get_client(S3_ENDPOINT_URL) is client
+    assert aws.get_client('http://localhost:5001') is not client
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'other')
+    assert aws.get_client(S3_ENDPOINT_URL) is not client
+
+
+def test_multistream_s3_glob(s3_client, bucket):
+    for name, body in [('part-2.csv', b'id,name\n2,b\n'), ('part-1.csv', b'id,name\n1,a\n'),
+                       ('other.csv', b'id,name\n3,c\n')]:
+        s3_client.put_object(Body=body, Bucket=bucket, Key='exports/%s' % name)
+    source = 's3://%s/exports/part-*.csv' % bucket
+    with MultiStream(source, headers=1, prefetch=2) as stream:
+        assert stream.headers == ['id', 'name']
+        assert list(stream.iter(extended=True)) == [
+            ('s3://%s/exports/part-1.csv' % bucket, 2, ['id', 'name'], ['1', 'a']),
+            ('s3://%s/exports/part-2.csv' % bucket, 2, ['id', 'name'], ['2', 'b']),
+        ]
+
+
+def test_multistream_s3_prefix(s3_client, bucket):
+    s3_client.put_object(Body=b'', Bucket=bucket, Key='exports/')
+    s3_client.put_object(Body=b'id\n1\n', Bucket=bucket, Key='exports/a.csv')
+    s3_client.put_object(Body=b'id\n2\n', Bucket=bucket, Key='exports/b/c.csv')
+    s3_client.put_object(Body=b'id\n3\n', Bucket=bucket, Key='table.csv')
+    with MultiStream('s3://%s/exports/' % bucket, headers=1) as stream:
+        assert stream.read() == [['1'], ['2']]
+
+
+def test_multistream_s3_no_sources(s3_client, bucket):
+    with pytest.raises(exceptions.SourceError):
+        MultiStream('s3://%s/exports/*.csv' % bucket).open()
+
+
+def test_loader_s3_list_sources(s3_client, bucket):
+    for number in range(1, 1101):
+        s3_client.put_object(Body=b'id\n', Bucket=bucket, Key='parts/%04d.csv' % number)
+    sources = aws.list_sources('s3://%s/parts/*.csv' % bucket)
+    assert len(sources) == 1100
+    assert sources[0] == 's3://%s/parts/0001.csv' % bucket
+    assert sources[-1] == 's3://%s/parts/1100.csv' % bucket
+    assert aws.list_sources('s3://%s/parts/000[1-3].csv' % bucket) == [
+        's3://%s/parts/%04d.csv' % (bucket, number) for number in range(1, 4)]
+    assert aws.list_sources('s3://%s/parts/0001.csv' % bucket) == [
+        's3://%s/parts/0001.csv' % bucket]
+
+
+def test_loader_s3_list_sources_nested_keys(s3_client, bucket):
+    for key in ['data/a.csv', 'data/sub/b.csv', 'data/sub/deep/c.csv', 'data/sub/d.txt']:
+        s3_client.put_object(Body=b'id\n', Bucket=bucket, Key=key)
+    url = 's3://%s/%%s' % bucket
+    assert aws.list_sources(url % 'data/*.csv') == [url % 'data/a.csv']
+    assert aws.list_sources(url % 'data/*/*.csv') == [url % 'data/sub/b.csv']
+    assert aws.list_sources(url % 'data/**/*.csv') == [
+        url % 'data/a.csv', url % 'data/sub/b.csv', url % 'data/sub/deep/c.csv']
+    assert aws.list_sources(url % 'data/sub/**') == [
+        url % 'data/sub/b.csv', url % 'data/sub/d.txt', url % 'data/sub/deep/c.csv']
+
+
+def test_loader_s3_list_sources_error(s3_client):
+    with pytest.raises(exceptions.IOError):
+        aws.list_sources('s3://bucket-not-existent/*.csv')
+
+
+# Write
+
+def test_stream_save_s3(s3_client, bucket):
+    with Stream('data/table.csv', headers=1) as stream:
+        assert stream.save('s3://%s/exports/table.csv' % bucket) == 2
+    with Stream('s3://%s/exports/table.csv' % bucket, headers=1) as stream:
+        assert stream.read() == [['1', 'english'], ['2', '中国人']]
+
+
+def test_stream_save_s3_multipart(s3_client, bucket, monkeypatch):
+    monkeypatch.setattr(config, 'S3_PART_SIZE', 1000)
+    monkeypatch.setattr(config, 'S3_UPLOAD_WORKERS', 2)
+    monkeypatch.setattr(s3_models, 'S3_UPLOAD_PART_MIN_SIZE', 256)
+    with Stream(io.BytesIO(LARGE_CSV), format='csv', headers=1) as stream:
+        target = 's3://%s/table.csv' % bucket
+        assert stream.save(target, s3_endpoint_url=S3_ENDPOINT_URL) == 1000
+    response = s3_client.get_object(Bucket=bucket, Key='table.csv')
+    body = response['Body'].read()
+    assert body.replace(b'\r\n', b'\n') == LARGE_CSV
+    # Multipart ETag ends with the number of parts
+    assert response['ETag'].strip('"').endswith('-%d' % -(-len(body) // 1000))
+
+
+def test_stream_save_s3_abort(s3_client, bucket, monkeypatch):
+    monkeypatch.setattr(config, 'S3_PART_SIZE', 1000)
+    monkeypatch.setattr(s3_models, 'S3_UPLOAD_PART_MIN_SIZE', 256)
+    def post_parse(extended_rows):
+        for row_number, headers, row in extended_rows:
+            if row_number > 500:
+                raise RuntimeError('failed')
+            yield (row_number, headers, row)
+    with Stream(io.BytesIO(LARGE_CSV), format='csv', post_parse=[post_parse]) as stream:
+        with pytest.raises(exceptions.SourceError):
+            stream.save('s3://%s/table.csv' % bucket)
+    assert 'Contents' not in s3_client.list_objects_v2(Bucket=bucket)
+    assert 'Uploads' not in s3_client.list_multipart_uploads(Bucket=bucket)
+
+
+def test_stream_save_s3_error(s3_client):
+    with Stream('data/table.csv', headers=1) as stream:
+        with pytest.raises(exceptions.IOError):
+            stream.save('s3://bucket-not-existent/table.csv')
+
+
+# Internal
+
+@pytest.mark.parametrize('spool, requests', [(False, 17), (True, 14)])
+def test_loader_s3_object(s3_client, bucket, monkeypatch, spool, requests):
+    monkeypatch.setattr(config, 'S3_CHUNK_SIZE', 1000)
+    s3_client.put_object(Body=LARGE_CSV, Bucket=bucket, Key='table.csv')
+    ranges = []
+    s3_client.meta.events.register('before-call.s3.GetObject',
+        lambda params, **kwargs: ranges.append(params['headers']['Range']))
+    bytes = _S3Object(s3_client, bucket, 'table.csv', spool=spool).open()
+    assert bytes.read(100) == LARGE_CSV[:100]
+    assert bytes.seek(0) == 0
+    assert bytes.read(1500) == LARGE_CSV[:1500]
+    assert bytes.seek(5000) == 5000
+    assert bytes.read(10) == LARGE_CSV[5000:5010]
+    assert bytes.seek(10) == 10
+    assert bytes.read() == LARGE_CSV[10:]
+    bytes.close()
+    assert set(ranges) == set('bytes=%s-%s' % (start, min(start + 1000, len(LARGE_CSV)) - 1)
+        for start in range(0, len(LARGE_CSV), 1000))
+    # Including not used read ahead (if it's not cancelled)
+    assert len(ranges) <= requests
+
+
+def test_loader_s3_object_close_waits_for_read_ahead(s3_client, bucket, monkeypatch):
+    monkeypatch.setattr(config, 'S3_CHUNK_SIZE', 1000)
+    s3_client.put_object(Body=LARGE_CSV, Bucket=bucket, Key='table.csv')
+    calls = []
+    s3_client.meta.events.register('before-call.s3.GetObject',
+        lambda **kwargs: calls.append('before') or time.sleep(0.2))
+    s3_client.meta.events.register('after-call.s3.GetObject',
+        lambda **kwargs: calls.append('after'))
+    bytes = _S3Object(s3_client, bucket, 'table.csv').open()
+    assert bytes.read(100) == LARGE_CSV[:100]
+    bytes.close()
+    assert calls.count('before') == calls.count('after')
+
+
 # Fixtures
 
-@pytest.fixture(scope='module')
-def s3_client():
-    subprocess.Popen('moto_server', shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    s3_client = boto3.client('s3', endpoint_url=S3_ENDPOINT_URL)
-    yield s3_client
-    os.system('pkill moto_server')
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setenv('MOTO_S3_CUSTOM_ENDPOINTS', S3_ENDPOINT_URL)
+    with mock_s3():
+        yield boto3.client('s3', endpoint_url=S3_ENDPOINT_URL)
 
 
 @pytest.fixture
 def bucket(s3_client):
-    bucket = 'bucket_%s' % ''.join(random.choice(string.digits) for _ in range(16))
+    bucket = 'bucket-%s' % ''.join(random.choice(string.digits) for _ in range(16))
     s3_client.create_bucket(Bucket=bucket, ACL='public-read')
     return bucket
@@ -5,12 +5,16 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import pytest
-from tabulator import Stream
+import requests
+from tabulator import Stream, HTTPCache, config
+from tabulator.loaders import remote
 from tabulator.loaders.remote import RemoteLoader
 from tabulator.exceptions import HTTPError
 from time import time
 
 BASE_URL = 'https://raw.githubusercontent.com/frictionlessdata/tabulator-py/master/%s'
+LARGE_CSV = b'id,name\n' + b''.join(
+    b'%d,name%d\n' % (number, number) for number in range(1, 1001))
 
 
 # Read
@@ -64,3 +68,205 @@ def test_loader_has_timeout():
         chars = loader.load('https://httpstat.us/200?sleep=5000', mode='b', encoding='utf-8')
     assert time() - t < 5
     assert time() - t > 1
+
+
+# Sample and spool
+
+def test_stream_http_sample_replayed(http_server):
+    with Stream(http_server.url + '/data/table.csv') as stream:
+        assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+        stream.reset()
+        assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+    assert http_server.requests == ['/data/table.csv']
+
+
+def test_stream_http_reset_after_sample(http_server):
+    http_server.files['/table.csv'] = LARGE_CSV
+    with Stream(http_server.url + '/table.csv', headers=1, bytes_sample_size=100) as stream:
+        assert len(stream.read()) == 1000
+        stream.reset()
+        assert len(stream.read()) == 1000
+    assert http_server.requests == ['/table.csv'] * 2
+
+
+def test_stream_http_spool(http_server):
+    http_server.files['/table.csv'] = LARGE_CSV
+    source = http_server.url + '/table.csv'
+    with Stream(source, headers=1, bytes_sample_size=100, http_spool=True) as stream:
+        rows = stream.read()
+        assert rows[-1] == ['1000', 'name1000']
+        stream.reset()
+        assert stream.read() == rows
+    assert http_server.requests == ['/table.csv']
+
+
+def test_loader_remote_seek(http_server):
+    http_server.files['/table.csv'] = LARGE_CSV
+    loader = RemoteLoader(bytes_sample_size=100)
+    bytes = loader.load(http_server.url + '/table.csv', mode='b')
+    assert bytes.read(50) == LARGE_CSV[:50]
+    assert bytes.seek(10) == 10
+    assert bytes.read(200) == LARGE_CSV[10:210]
+    assert bytes.seek(500) == 500
+    assert bytes.read(10) == LARGE_CSV[500:510]
+    assert bytes.seek(20) == 20
+    assert bytes.read() == LARGE_CSV[20:]
+    bytes.close()
+    assert http_server.requests == ['/table.csv'] * 2
+
+
+# Cache
+
+def test_stream_http_cache(http_server, tmpdir):
+    cache = HTTPCache(str(tmpdir))
+    source = http_server.url + '/data/table.csv'
+    for _ in range(3):
+        with Stream(source, http_cache=cache) as stream:
+            assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+    assert cache.stats == {'hits': 2, 'misses': 1}
+    assert http_server.requests == ['/data/table.csv'] * 3
+
+
+def test_stream_http_cache_modified(http_server, tmpdir):
+    http_server.files['/table.csv'] = b'id\n1\n'
+    source = http_server.url + '/table.csv'
+    with Stream(source, http_cache=str(tmpdir)) as stream:
+        assert stream.read() == [['id'], ['1']]
+    http_server.files['/table.csv'] = b'id\n2\n'
+    with Stream(source, http_cache=str(tmpdir)) as stream:
+        assert stream.read() == [['id'], ['2']]
+    with Stream(source, http_cache=str(tmpdir)) as stream:
+        assert stream.read() == [['id'], ['2']]
+
+
+def test_stream_http_cache_not_cacheable(http_server, tmpdir):
+    http_server.settings['etags'] = False
+    cache = HTTPCache(str(tmpdir))
+    for _ in range(2):
+        with Stream(http_server.url + '/data/table.csv', http_cache=cache) as stream:
+            assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+    assert cache.stats == {'hits': 0, 'misses': 2}
+    assert tmpdir.listdir() == []
+
+
+def test_http_cache_eviction(http_server, tmpdir):
+    cache = HTTPCache(str(tmpdir), max_size=30)
+    session = requests.Session()
+    for name in ['a', 'b', 'c']:
+        http_server.files['/%s.csv' % name] = b'id\n' + name.encode('utf-8') * 10
+    for name in ['a', 'b', 'a', 'c']:
+        with cache.open(http_server.url + '/%s.csv' % name, session) as file:
+            file.read()
+    assert cache.stats == {'hits': 1, 'misses': 3}
+    # Recently used "a" and "c" are kept
+    assert len(tmpdir.listdir()) == 4
+    for name in ['a', 'c']:
+        with cache.open(http_server.url + '/%s.csv' % name, session) as file:
+            file.read()
+    assert cache.stats == {'hits': 3, 'misses': 3}
+    cache.clear()
+    assert tmpdir.listdir() == []
+
+
+def test_http_cache_streaming(http_server, tmpdir):
+    http_server.files['/table.csv'] = LARGE_CSV
+    cache = HTTPCache(str(tmpdir))
+    session = requests.Session()
+    file = cache.open(http_server.url + '/table.csv', session)
+    # Nothing is stored before the response is read to the end
+    assert file.read(100) == LARGE_CSV[:100]
+    assert len(tmpdir.listdir()) == 1
+    assert file.seek(10) == 10
+    assert file.read(20) == LARGE_CSV[10:30]
+    assert file.read() == LARGE_CSV[30:]
+    assert len(tmpdir.listdir()) == 2
+    file.close()
+    with cache.open(http_server.url + '/table.csv', session) as file:
+        assert file.read() == LARGE_CSV
+    assert cache.stats == {'hits': 1, 'misses': 1}
+
+
+def test_http_cache_not_read_to_the_end(http_server, tmpdir):
+    http_server.files['/table.csv'] = LARGE_CSV
+    cache = HTTPCache(str(tmpdir))
+    with Stream(http_server.url + '/table.csv', headers=1, http_cache=cache) as stream:
+        assert stream.read(limit=1) == [['1', 'name1']]
+    assert tmpdir.listdir() == []
+
+
+def test_stream_http_cache_parallel_warning(http_server, tmpdir):
+    source = http_server.url + '/data/table.csv'
+    with pytest.warns(UserWarning, match='http_parallel'):
+        with Stream(source, http_cache=str(tmpdir), http_parallel=4) as stream:
+            assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+
+
+# Parallel
+
+def test_stream_http_parallel(http_server, monkeypatch):
+    monkeypatch.setattr(config, 'HTTP_PARALLEL_CHUNK_SIZE', 1000)
+    http_server.files['/table.csv'] = LARGE_CSV
+    source = http_server.url + '/table.csv'
+    with Stream(source, headers=1, http_parallel=4) as stream:
+        rows = stream.read()
+        assert rows[0] == ['1', 'name1']
+        assert rows[-1] == ['1000', 'name1000']
+        assert len(rows) == 1000
+        stream.reset()
+        assert stream.read() == rows
+    assert len(http_server.ranges) == len(range(0, len(LARGE_CSV), 1000))
+    assert 'bytes=0-999' in http_server.ranges
+
+
+def test_stream_http_parallel_not_supported(http_server, monkeypatch):
+    monkeypatch.setattr(config, 'HTTP_PARALLEL_CHUNK_SIZE', 1000)
+    http_server.settings['ranges'] = False
+    http_server.files['/table.csv'] = LARGE_CSV
+    with Stream(http_server.url + '/table.csv', headers=1, http_parallel=4) as stream:
+        assert len(stream.read()) == 1000
+    assert http_server.ranges == []
+    assert http_server.requests == ['/table.csv']
+
+
+def test_loader_remote_parallel_seek(http_server, monkeypatch):
+    monkeypatch.setattr(config, 'HTTP_PARALLEL_CHUNK_SIZE', 1000)
+    http_server.files['/table.csv'] = LARGE_CSV
+    loader = RemoteLoader(http_parallel=2)
+    bytes = loader.load(http_server.url + '/table.csv', mode='b')
+    assert bytes.read(1500) == LARGE_CSV[:1500]
+    assert bytes.seek(5000) == 5000
+    assert bytes.read(10) == LARGE_CSV[5000:5010]
+    assert bytes.seek(10) == 10
+    assert bytes.read() == LARGE_CSV[10:]
+    bytes.close()
+
+
+# Sessions
+
+def test_stream_http_shared_session(http_server):
+    remote.session_stats(reset=True)
+    for _ in range(3):
+        with Stream(http_server.url + '/data/table.csv') as stream:
+            assert stream.read() == [['id', 'name'], ['1', 'english'], ['2', '中国人']]
+    assert remote.session_stats() == {
+        'hits': 2, 'misses': 1, 'connections': 1, 'requests': 3}
+
+
+def test_stream_http_shared_session_no_keep_alive(http_server):
+    remote.configure_sessions(keep_alive=False)
+    try:
+        remote.session_stats(reset=True)
+        for _ in range(2):
+            with Stream(http_server.url + '/data/table.csv') as stream:
+                stream.read()
+        assert remote.session_stats()['requests'] == 2
+        assert remote.get_session(http_server.url).headers['Connection'] == 'close'
+    finally:
+        remote.configure_sessions(keep_alive=config.HTTP_KEEP_ALIVE)
+
+
+def test_loader_remote_get_session():
+    session = remote.get_session('https://example.com/data.csv')
+    assert remote.get_session('https://EXAMPLE.com/other.csv') is session
+    assert remote.get_session('http://example.com/data.csv') is not session
+    assert session.adapters['https://'].max_retries.total == config.HTTP_MAX_RETRIES
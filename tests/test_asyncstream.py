@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import asyncio
+import pytest
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from tabulator import AsyncStream, exceptions
+
+
+# Helpers
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+# Tests
+
+def test_async_stream():
+    async def main():
+        async with AsyncStream('data/table.csv', headers=1) as stream:
+            assert stream.headers == ['id', 'name']
+            assert stream.format == 'csv'
+            return [row async for row in stream]
+    assert run(main()) == [['1', 'english'], ['2', '中国人']]
+
+
+def test_async_stream_read_and_reset():
+    async def main():
+        async with AsyncStream('data/table.csv', headers=1, batch_size=1) as stream:
+            rows = await stream.read(extended=True)
+            await stream.reset()
+            assert await stream.read(keyed=True, limit=1) == [{'id': '1', 'name': 'english'}]
+            return rows
+    assert run(main()) == [(2, ['id', 'name'], ['1', 'english']), (3, ['id', 'name'], ['2', '中国人'])]
+
+
+def test_async_stream_iter_batches():
+    source = [['id']] + [[number] for number in range(1, 6)]
+    async def main():
+        async with AsyncStream(source, headers=1) as stream:
+            return [batch async for batch in stream.iter_batches(size=2)]
+    assert run(main()) == [[[1], [2]], [[3], [4]], [[5]]]
+
+
+def test_async_stream_concurrent(tmpdir):
+    sources = []
+    for number in range(10):
+        path = str(tmpdir.join('table%s.csv' % number))
+        with io.open(path, 'w', encoding='utf-8') as file:
+            file.write('id\n%s\n' % number)
+        sources.append(path)
+    async def read(source, executor):
+        async with AsyncStream(source, headers=1, executor=executor) as stream:
+            return await stream.read()
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            return await asyncio.gather(*[read(source, executor) for source in sources])
+    assert run(main()) == [[[str(number)]] for number in range(10)]
+
+
+def test_async_stream_sql(tmpdir):
+    path = str(tmpdir.join('database.db'))
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE data (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.executemany('INSERT INTO data VALUES (?, ?)', [(id, 'name') for id in range(3000)])
+    conn.commit()
+    conn.close()
+    async def main():
+        source = 'sqlite:///%s' % path
+        async with AsyncStream(source, table='data', order_by='id', headers=1,
+                               sample_size=10, batch_size=100) as stream:
+            rows = await stream.read()
+            await stream.reset()
+            return rows, await stream.read()
+    rows = [[id, 'name'] for id in range(3000)]
+    assert run(main()) == (rows, rows)
+
+
+def test_async_stream_concurrent_batches():
+    source = [['id']] + [[number] for number in range(1, 101)]
+    async def main():
+        async with AsyncStream(source, headers=1) as stream:
+            batches = stream.iter_batches(size=1)
+            return await asyncio.gather(*[batches.__anext__() for _ in range(100)])
+    assert sorted(run(main())) == [[[number]] for number in range(1, 101)]
+
+
+def test_async_stream_save(tmpdir):
+    target = str(tmpdir.join('table.csv'))
+    async def main():
+        async with AsyncStream('data/table.csv', headers=1) as stream:
+            return await stream.save(target)
+    assert run(main()) == 2
+    with io.open(target, encoding='utf-8') as file:
+        assert file.read() == 'id,name\n1,english\n2,中国人\n'
+
+
+def test_async_stream_errors():
+    async def main():
+        stream = AsyncStream('data/bad.csv')
+        with pytest.raises(exceptions.IOError):
+            await stream.open()
+        with pytest.raises(exceptions.TabulatorException):
+            await stream.read()
+    run(main())
@@ -5,6 +5,8 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import io
+import decimal
+import datetime
 import pytest
 from tabulator import helpers, config
 
@@ -69,6 +71,28 @@ def test_detect_encoding_unknown():
     assert helpers.detect_encoding(sample) == 'utf-8'
 
 
+def test_detect_encoding_utf_8_fast_path():
+    helpers.encoding_stats(reset=True)
+    sample = '中国人'.encode('utf-8')
+    assert helpers.detect_encoding(sample) == 'utf-8'
+    assert helpers.detect_encoding(sample[:-1]) == 'utf-8'
+    assert helpers.detect_encoding(b'\xef\xbb\xbfid,name') == 'utf-8-sig'
+    assert helpers.detect_encoding(sample, encoding='UTF-8') == 'utf-8'
+    assert helpers.encoding_stats() == {
+        'given': 1, 'fast_path': 3, 'cache': 0, 'detector': 0}
+
+
+def test_detect_encoding_cache():
+    helpers.encoding_stats(reset=True)
+    sample = b'B\n' * 300 + b'\xff\xfe\xff'
+    encoding = helpers.detect_encoding(sample)
+    assert helpers.detect_encoding(sample) == encoding
+    stats = helpers.encoding_stats(reset=True)
+    assert stats['detector'] == 1
+    assert stats['cache'] == 1
+    assert helpers.encoding_stats()['cache'] == 0
+
+
 def test_reset_stream_seekable():
     file = io.open(__file__)
     file.seek(1)
@@ -126,3 +150,36 @@ def test_stringify_value():
 def test_stringify_value_none():
     assert helpers.stringify_value(None) == ''
 
+
+def test_make_keyed_projection():
+    projection = helpers.make_keyed_projection(['name', 'id'], ['id', 'name'])
+    assert projection(['english', '1']) == ['1', 'english']
+    assert projection(['english']) == [None, 'english']
+    projection = helpers.make_keyed_projection(['id'], ['id', 'name'])
+    assert projection(['1']) == ['1', None]
+
+
+def test_get_json_encoder(json_backend):
+    encode = helpers.get_json_encoder()
+    assert helpers.get_json_encoder() is encode
+    assert encode(['1', '中国人', None]) == '["1","中国人",null]'.encode('utf-8')
+    assert encode({'id': 1}) == b'{"id":1}'
+    assert encode([
+        datetime.datetime(2026, 10, 18, 12, 30, 15, 500),
+        datetime.date(2026, 10, 18),
+        datetime.time(12, 30),
+        decimal.Decimal('1.5'),
+        float('nan'),
+        float('-inf'),
+        decimal.Decimal('NaN'),
+    ]) == (b'["2026-10-18T12:30:15.000500","2026-10-18","12:30:00",'
+        b'1.5,null,null,null]')
+    assert encode({'values': [1.5, float('inf')]}) == b'{"values":[1.5,null]}'
+    with pytest.raises(TypeError):
+        encode([object()])
+
+
+def test_get_json_encoder_indent():
+    encode = helpers.get_json_encoder(indent=2)
+    assert encode([datetime.date(2026, 10, 18), float('nan')]) == (
+        b'[\n  "2026-10-18",\n  null\n]')
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import sys
+import pytest
+import subprocess
+
+
+# Helpers
+
+def import_modules(statement):
+    code = 'import sys; sys.stderr.write("start\\n"); %s' % statement
+    command = [sys.executable, '-X', 'importtime', '-c', code]
+    output = subprocess.check_output(command, stderr=subprocess.STDOUT)
+    lines = output.decode('utf-8').splitlines()
+    lines = lines[lines.index('start') + 1:]
+    return set(line.split('|')[-1].strip() for line in lines if '|' in line)
+
+
+HEAVY_MODULES = [
+    'asyncio', 'click', 'gzip', 'zipfile', 'tempfile',
+    'requests', 'boto3', 'sqlalchemy', 'openpyxl', 'xlrd',
+    'ezodf', 'pyquery', 'ijson', 'jsonlines', 'chardet', 'cchardet',
+]
+
+
+# Tests
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Requires Python 3.7+')
+@pytest.mark.parametrize('statement', [
+    'import tabulator',
+    'from tabulator import Stream',
+    'from tabulator import Stream; Stream("text://id\\n1", format="csv").open().read()',
+])
+def test_import_time(statement):
+    modules = import_modules(statement)
+    assert 'tabulator' in modules
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Requires Python 3.7+')
+def test_import_lazy_attributes():
+    modules = import_modules('import tabulator; tabulator.cli')
+    assert 'click' in modules
+    assert 'tabulator.stream' not in modules
+
+
+def test_import_public_names():
+    import tabulator
+    assert tabulator.Stream.__name__ == 'Stream'
+    assert tabulator.validate('data/table.csv') is True
+    assert issubclass(tabulator.SourceError, tabulator.TabulatorException)
+    assert tabulator.exceptions.HTTPError is tabulator.HTTPError
+    assert 'Stream' in dir(tabulator)
+    with pytest.raises(AttributeError):
+        tabulator.bad_name
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import io
+import pytest
+from tabulator import MultiStream, exceptions
+
+
+# Helpers
+
+def write_sources(tmpdir, count=5, rows=3):
+    paths = []
+    for number in range(1, count + 1):
+        path = str(tmpdir.join('table%s.csv' % number))
+        with io.open(path, 'w', encoding='utf-8') as file:
+            file.write('id,name\n')
+            for index in range(1, rows + 1):
+                file.write('%s,中国人 %s\n' % (number * 10 + index, number))
+        paths.append(path)
+    return paths
+
+
+# Tests
+
+@pytest.mark.parametrize('prefetch', [0, 1, 2, 10])
+def test_multistream(tmpdir, prefetch):
+    sources = write_sources(tmpdir)
+    with MultiStream(sources, prefetch=prefetch, headers=1) as stream:
+        assert stream.headers == ['id', 'name']
+        rows = stream.read()
+    assert len(rows) == 15
+    assert rows[:4] == [['11', '中国人 1'], ['12', '中国人 1'], ['13', '中国人 1'], ['21', '中国人 2']]
+    assert rows[-1] == ['53', '中国人 5']
+
+
+def test_multistream_glob(tmpdir):
+    sources = write_sources(tmpdir, count=3)
+    with MultiStream(str(tmpdir.join('*.csv')), headers=1) as stream:
+        assert stream.sources == sources
+        assert len(stream.read()) == 9
+
+
+def test_multistream_extended_and_keyed(tmpdir):
+    sources = write_sources(tmpdir, count=2, rows=2)
+    with MultiStream(sources, headers=1) as stream:
+        assert stream.read(extended=True) == [
+            (sources[0], 2, ['id', 'name'], ['11', '中国人 1']),
+            (sources[0], 3, ['id', 'name'], ['12', '中国人 1']),
+            (sources[1], 2, ['id', 'name'], ['21', '中国人 2']),
+            (sources[1], 3, ['id', 'name'], ['22', '中国人 2']),
+        ]
+        stream.reset()
+        assert stream.read(keyed=True, limit=1) == [{'id': '11', 'name': '中国人 1'}]
+
+
+def test_multistream_headers_alignment():
+    sources = [
+        [['id', 'name'], [1, 'a']],
+        [['name', 'id'], ['b', 2]],
+        [['id'], [3]],
+    ]
+    with MultiStream(sources, headers=1) as stream:
+        assert stream.read() == [[1, 'a'], [2, 'b'], [3, None]]
+
+
+def test_multistream_reset_and_options(tmpdir):
+    sources = write_sources(tmpdir, count=3)
+    with MultiStream(sources, headers=1, limit_rows=1, force_strings=True) as stream:
+        assert stream.read() == [['11', '中国人 1'], ['21', '中国人 2'], ['31', '中国人 3']]
+        assert stream.read() == []
+        stream.reset()
+        assert len(stream.read()) == 3
+
+
+def test_multistream_source_error(tmpdir):
+    sources = write_sources(tmpdir, count=1) + [str(tmpdir.join('bad.csv'))]
+    with MultiStream(sources, headers=1) as stream:
+        rows = stream.iter()
+        assert next(rows) == ['11', '中国人 1']
+        with pytest.raises(exceptions.IOError):
+            list(rows)
+
+
+def test_multistream_no_sources(tmpdir):
+    with pytest.raises(exceptions.SourceError):
+        MultiStream(str(tmpdir.join('*.csv'))).open()
+
+
+def test_multistream_closed():
+    stream = MultiStream([[['id'], [1]]], headers=1)
+    with pytest.raises(exceptions.TabulatorException):
+        stream.read()
@@ -5,14 +5,20 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import io
+import os
 import ast
 import six
+import json
 import sys
+import mock
 import pytest
+import sqlite3
+import zipfile
 import datetime
 from tabulator import Stream, exceptions
 from tabulator.loaders.local import LocalLoader
 from tabulator.parsers.csv import CSVParser
+from tabulator.parsers.xlsx import XLSXParser
 from tabulator.writers.csv import CSVWriter
 BASE_URL = 'https://raw.githubusercontent.com/frictionlessdata/tabulator-py/master/%s'
 
@@ -582,6 +588,69 @@ def test_stream_matrix_limit_and_offset_fields():
         assert stream.read() == [['12', '13'], ['22', '23'], ['32', '33'], ['42', '43']]
 
 
+# Fields pushdown
+
+WIDE_HEADERS = ['c1', 'c2', 'c3', 'c4', 'c5', 'c6']
+WIDE_ROWS = [['r%02dc%s' % (number, index) for index in range(1, 7)] for number in range(1, 21)]
+
+
+def write_wide_source(tmpdir, format):
+    if format == 'ndjson':
+        path = str(tmpdir.join('wide.ndjson'))
+        with io.open(path, 'w', encoding='utf-8') as file:
+            for row in WIDE_ROWS:
+                file.write(json.dumps(dict(zip(WIDE_HEADERS, row))) + '\n')
+        return path, {}
+    if format == 'sql':
+        path = 'sqlite:///%s' % tmpdir.join('wide.db')
+        with Stream(WIDE_ROWS, headers=WIDE_HEADERS) as stream:
+            stream.save(path, table='data')
+        return path, {'table': 'data', 'order_by': 'c1'}
+    path = str(tmpdir.join('wide.%s' % format))
+    options = {'keyed': True} if format == 'json' else {}
+    with Stream(WIDE_ROWS, headers=WIDE_HEADERS) as stream:
+        stream.save(path, **options)
+    return path, {}
+
+
+@pytest.mark.parametrize('format', ['xlsx', 'json', 'ndjson', 'sql'])
+@pytest.mark.parametrize('sample_size', [1, 5, 100])
+@pytest.mark.parametrize('fields_options, indexes', [
+    ({'pick_fields': ['c2', 'c5']}, [1, 4]),
+    ({'skip_fields': ['c1', 'c6']}, [1, 2, 3, 4]),
+    ({'skip_fields': ['c3']}, [0, 1, 3, 4, 5]),
+    ({'offset_fields': 4}, [4, 5]),
+])
+def test_stream_pick_fields_pushdown(tmpdir, format, sample_size, fields_options, indexes):
+    source, options = write_wide_source(tmpdir, format)
+    headers = [WIDE_HEADERS[index] for index in indexes]
+    rows = [[row[index] for index in indexes] for row in WIDE_ROWS]
+    options.update(fields_options)
+    with Stream(source, headers=1, sample_size=sample_size, **options) as stream:
+        assert stream.headers == headers
+        assert stream.read() == rows
+        stream.reset()
+        assert stream.read(limit=3) == rows[:3]
+        stream.reset()
+        assert sum(stream.iter_batches(size=4), []) == rows
+
+
+def test_stream_pick_fields_pushdown_parser_calls(tmpdir):
+    calls = []
+    class CustomParser(XLSXParser):
+        def project(self, ignored_indexes, headers):
+            calls.append((ignored_indexes, headers))
+            return super(CustomParser, self).project(ignored_indexes, headers)
+    source, options = write_wide_source(tmpdir, 'xlsx')
+    options = {'headers': 1, 'custom_parsers': {'xlsx': CustomParser}}
+    with Stream(source, pick_fields=['c6'], **options) as stream:
+        assert stream.read(limit=1) == [['r01c6']]
+        assert stream.sample == [[row[5]] for row in WIDE_ROWS]
+    with Stream(source, **options) as stream:
+        assert stream.read(limit=1) == [WIDE_ROWS[0]]
+    assert calls == [([4, 3, 2, 1, 0], ['c6'])]
+
+
 # Pick/skip/limit/offset rows
 
 def test_stream_pick_rows():
@@ -663,6 +732,40 @@ def test_stream_skip_rows_preset():
         assert stream.read() == [['Ray', 0], ['John', 1], ['Alex', 2], ['', 3], [None, 4]]
 
 
+def test_stream_skip_rows_many_directives():
+    source = [[str(number)] for number in range(1, 1001)]
+    skip_rows = list(range(1, 998)) + [
+        {'type': 'regex', 'value': r'^99(8)$'},
+        {'type': 'regex', 'value': r'^(\d)\1\1$'},
+        {'type': 'regex', 'value': r'(?i)^X'}]
+    with Stream(source, skip_rows=skip_rows) as stream:
+        assert stream.read() == [['1000']]
+
+
+def test_stream_skip_rows_combined_regexes():
+    source = [['a'], ['B'], ['aa'], ['ab'], ['xy'], ['c']]
+    skip_rows = [
+        {'type': 'regex', 'value': r'^(a)\1$'},
+        {'type': 'regex', 'value': r'^b$|^x'},
+        {'type': 'regex', 'value': r'(?i)^b$'},
+        {'type': 'regex', 'value': r'^c'}]
+    with Stream(source, skip_rows=skip_rows) as stream:
+        assert stream.read() == [['a'], ['ab']]
+
+
+def test_stream_pick_rows_many_directives():
+    source = [[str(number)] for number in range(1, 101)] + [['# note'], [''], []]
+    pick_rows = [2, 50, '#', {'type': 'regex', 'value': '^9[89]$'}, {'type': 'preset', 'value': 'blank'}]
+    with Stream(source, pick_rows=pick_rows) as stream:
+        assert stream.read() == [['2'], ['50'], ['98'], ['99'], ['# note'], [''], []]
+
+
+def test_stream_skip_rows_not_supported():
+    with pytest.raises(ValueError) as excinfo:
+        Stream('data/table.csv', skip_rows=[{'type': 'bad'}])
+    assert 'Not supported skip rows' in str(excinfo.value)
+
+
 def test_stream_limit_rows():
     source = 'data/special/long.csv'
     with Stream(source, headers=1, limit_rows=1) as stream:
@@ -684,6 +787,83 @@ def test_stream_limit_offset_rows():
         assert stream.read() == [['3', 'c'], ['4', 'd']]
 
 
+@pytest.mark.parametrize('format', ['csv', 'tsv', 'ndjson'])
+@pytest.mark.parametrize('sample_size', [1, 2, 10])
+@pytest.mark.parametrize('offset_rows, limit_rows', [
+    (None, 3), (2, None), (5, 3), (8, 1), (4995, 10), (6000, 5)])
+def test_stream_limit_offset_rows_pushdown(tmpdir, format, sample_size, offset_rows, limit_rows):
+    source = write_long_source(tmpdir, format)
+    with Stream(source, headers=1) as stream:
+        rows = stream.read(extended=True)
+    start = offset_rows or 0
+    stop = start + limit_rows if limit_rows else None
+    options = {'headers': 1, 'sample_size': sample_size,
+        'offset_rows': offset_rows, 'limit_rows': limit_rows}
+    with Stream(source, **options) as stream:
+        assert stream.read(extended=True) == rows[start:stop]
+        stream.reset()
+        assert stream.read(extended=True) == rows[start:stop]
+        stream.reset()
+        assert sum(stream.iter_batches(size=2), []) == [row for _, _, row in rows[start:stop]]
+
+
+def test_stream_limit_offset_rows_pushdown_used(tmpdir):
+    source = write_long_source(tmpdir, 'csv')
+    with Stream(source, headers=1, offset_rows=4000, limit_rows=2, start_row=10) as stream:
+        assert stream.read() == [['4009', '中国人 4009'], ['4010', '中国人 4010']]
+    with Stream(source, headers=1, offset_rows=4000, skip_rows=['#']) as stream:
+        assert len(stream.read()) == 999
+
+
+def test_stream_limit_offset_rows_pushdown_parser_calls(tmpdir):
+    calls = []
+    class CustomParser(CSVParser):
+        def pushdown(self, skip=0, limit=None):
+            calls.append((skip, limit))
+            return super(CustomParser, self).pushdown(skip, limit)
+    source = write_long_source(tmpdir, 'csv')
+    options = {'headers': 1, 'custom_parsers': {'csv': CustomParser}}
+    with Stream(source, offset_rows=200, limit_rows=5, **options) as stream:
+        assert stream.read()[0] == ['201', '中国人 201']
+    with Stream(source, offset_rows=200, skip_rows=[-1], **options) as stream:
+        assert stream.read()[0] == ['201', '中国人 201']
+    assert calls == [(101, 5)]
+
+
+def test_stream_skip_fields_short_and_long_rows():
+    source = [['id', 'skip', 'name'], [1], [2, 'x'], [3, 'x', 'c'], [4, 'x', 'd', 'extra']]
+    with Stream(source, headers=1, skip_fields=['skip']) as stream:
+        assert stream.headers == ['id', 'name']
+        assert stream.read() == [[1], [2], [3, 'c'], [4, 'd', 'extra']]
+
+
+def test_stream_skip_fields_tuple_rows():
+    def tuples(extended_rows):
+        for row_number, headers, row in extended_rows:
+            yield (row_number, headers, tuple(row) if row_number > 1 else row)
+    class TupleParser(CSVParser):
+        @property
+        def extended_rows(self):
+            return tuples(super(TupleParser, self).extended_rows)
+    source = 'id,name,skip\n1,a,x\n2,b,x\n'
+    options = {'scheme': 'text', 'format': 'csv', 'custom_parsers': {'csv': TupleParser}}
+    with Stream(source, headers=1, skip_fields=['skip'], **options) as stream:
+        assert stream.read() == [['1', 'a'], ['2', 'b']]
+
+
+def test_stream_keyed_source_reordered_headers():
+    source = [{'id': 1, 'name': 'a'}, {'name': 'b', 'id': 2}, {'name': 'c'}]
+    with Stream(source, headers=1, skip_fields=['name']) as stream:
+        assert stream.headers == ['id']
+        assert stream.read(keyed=True) == [{'id': 1}, {'id': 2}, {'id': None}]
+
+
+def test_stream_headers_set_after_open():
+    with Stream([['id', 'name'], [1, 'a']], headers=1) as stream:
+        stream.headers = ['name', 'id']
+        assert stream.read(keyed=True) == [{'name': 1, 'id': 'a'}]
+
+
 # Post parse
 
 def test_stream_post_parse_headers():
@@ -753,6 +933,392 @@ def test_stream_post_parse_sample():
         assert stream.sample == [['id', 'name']]
 
 
+def test_stream_post_parse_batches():
+
+    # Processors
+    def drop_odd_rows(batches):
+        for batch in batches:
+            yield [item for item in batch if not item[0] % 2]
+
+    # Stream
+    source = 'data/special/long.csv'
+    with Stream(source, headers=1, post_parse_batches=[drop_odd_rows]) as stream:
+        assert stream.read() == [['1', 'a'], ['3', 'c'], ['5', 'e']]
+        stream.reset()
+        assert list(stream.iter_batches(size=2)) == [[['1', 'a']], [['3', 'c']], [['5', 'e']]]
+
+
+# Batches
+
+def test_stream_iter_batches():
+    with Stream('data/special/long.csv', headers=1) as stream:
+        assert list(stream.iter_batches(size=4)) == [
+            [['1', 'a'], ['2', 'b'], ['3', 'c'], ['4', 'd']],
+            [['5', 'e'], ['6', 'f']]]
+
+
+def test_stream_iter_batches_keyed_and_extended():
+    with Stream('data/table.csv', headers=1) as stream:
+        assert list(stream.iter_batches(keyed=True)) == [
+            [{'id': '1', 'name': 'english'}, {'id': '2', 'name': '中国人'}]]
+        stream.reset()
+        assert list(stream.iter_batches(extended=True)) == [
+            [(2, ['id', 'name'], ['1', 'english']), (3, ['id', 'name'], ['2', '中国人'])]]
+
+
+def test_stream_iter_batches_sample_size():
+    with Stream('data/special/long.csv', headers=1, sample_size=3) as stream:
+        assert stream.read(limit=1) == [['1', 'a']]
+        assert list(stream.iter_batches(size=2)) == [
+            [['2', 'b']], [['3', 'c'], ['4', 'd']], [['5', 'e'], ['6', 'f']]]
+
+
+def test_stream_iter_batches_limit_offset_rows():
+    source = 'data/special/long.csv'
+    for limit_rows, offset_rows in [(2, 2), (None, 3), (4, None), (1, 5), (3, 10)]:
+        options = {'headers': 1, 'limit_rows': limit_rows, 'offset_rows': offset_rows}
+        with Stream(source, **options) as stream:
+            rows = stream.read()
+        for size in [1, 2, 5]:
+            with Stream(source, **options) as stream:
+                batches = list(stream.iter_batches(size=size))
+                assert [row for batch in batches for row in batch] == rows
+                assert all(batches)
+
+
+def test_stream_iter_batches_skip_rows_and_post_parse():
+
+    # Processors
+    def skip_second_row(extended_rows):
+        for row_number, headers, row in extended_rows:
+            if row_number != 3:
+                yield (row_number, headers, row)
+
+    # Stream
+    source = 'data/special/long.csv'
+    options = {'headers': 1, 'skip_rows': [-1], 'post_parse': [skip_second_row], 'force_strings': True}
+    with Stream(source, **options) as stream:
+        assert list(stream.iter_batches(size=2)) == [
+            [['1', 'a'], ['3', 'c']], [['4', 'd'], ['5', 'e']]]
+
+
+def test_stream_iter_batches_closed():
+    stream = Stream('data/table.csv')
+    with pytest.raises(exceptions.TabulatorException) as excinfo:
+        list(stream.iter_batches())
+    assert 'stream.open()' in str(excinfo.value)
+
+
+# Index
+
+def write_long_source(tmpdir, format):
+    path = str(tmpdir.join('long.%s' % format))
+    with io.open(path, 'w', encoding='utf-8', newline='') as file:
+        if format == 'ndjson':
+            for number in range(1, 5001):
+                file.write('{"id": %s, "name": "中国人 %s"}\n' % (number, number))
+        else:
+            delimiter = ',' if format == 'csv' else '\t'
+            file.write('id%sname\n' % delimiter)
+            for number in range(1, 5000):
+                file.write('%s%s中国人 %s\n' % (number, delimiter, number))
+    return path
+
+
+@pytest.mark.skipif(six.PY2, reason='not supported for Python2')
+@pytest.mark.parametrize('format', ['csv', 'tsv', 'ndjson'])
+def test_stream_build_index(tmpdir, format):
+    source = write_long_source(tmpdir, format)
+    with Stream(source, headers=1, sample_size=10) as stream:
+        expected = stream.read(extended=True)
+        assert stream.build_index(every=100) == source + '.index.json'
+        assert stream.read(extended=True) == expected
+    with Stream(source, headers=1, sample_size=10, start_row=4950) as stream:
+        assert stream.headers == ['id', 'name']
+        assert stream.read(extended=True) == expected[-51:]
+        assert stream.size < os.path.getsize(source) / 2
+        stream.reset()
+        assert stream.read(extended=True, limit=1) == expected[-51:-50]
+
+
+def test_stream_start_row_without_index(tmpdir):
+    source = write_long_source(tmpdir, 'csv')
+    with Stream(source, headers=1, start_row=4996, limit_rows=2) as stream:
+        assert stream.read() == [['4995', '中国人 4995'], ['4996', '中国人 4996']]
+    with Stream('data/table.csv', start_row=3) as stream:
+        assert stream.read() == [['2', '中国人']]
+
+
+@pytest.mark.skipif(six.PY2, reason='not supported for Python2')
+def test_stream_build_index_outdated(tmpdir):
+    source = write_long_source(tmpdir, 'csv')
+    index_path = str(tmpdir.join('index.json'))
+    with Stream(source, headers=1, index_path=index_path) as stream:
+        stream.build_index(every=10)
+    with io.open(source, 'a', encoding='utf-8') as file:
+        file.write('5000,中国人 5000\n')
+    with pytest.warns(UserWarning) as record:
+        with Stream(source, headers=1, start_row=5000, index_path=index_path) as stream:
+            assert stream.read() == [['4999', '中国人 4999'], ['5000', '中国人 5000']]
+    assert 'outdated' in str(record[0].message)
+
+
+def test_stream_build_index_not_local():
+    with Stream([['id'], [1]]) as stream:
+        with pytest.raises(exceptions.TabulatorException) as excinfo:
+            stream.build_index()
+        assert 'local file' in str(excinfo.value)
+
+
+# Checkpoints
+
+@pytest.mark.skipif(six.PY2, reason='not supported for Python2')
+def test_stream_checkpoint_resume_from(tmpdir):
+    source = write_long_source(tmpdir, 'csv')
+    with Stream(source, headers=1) as stream:
+        expected = stream.read(extended=True)
+    with Stream(source, headers=1, resumable=True) as stream:
+        assert stream.read(extended=True, limit=3000) == expected[:3000]
+        checkpoint = json.loads(json.dumps(stream.checkpoint()))
+    assert checkpoint['row_number'] == 3001
+    assert checkpoint['position'] is not None
+    assert checkpoint['encoding'] == 'utf-8'
+    assert checkpoint['headers'] == ['id', 'name']
+    with Stream(source, headers=1, resume_from=checkpoint) as stream:
+        assert stream.read(extended=True) == expected[3000:]
+        assert stream.size < os.path.getsize(source) / 2
+
+
+@pytest.mark.skipif(six.PY2, reason='not supported for Python2')
+def test_stream_checkpoint_resume_from_batches(tmpdir):
+    source = write_long_source(tmpdir, 'ndjson')
+    with Stream(source) as stream:
+        expected = stream.read()
+    with Stream(source, resumable=True) as stream:
+        batches = stream.iter_batches(size=1000)
+        assert next(batches) == expected[:100]
+        assert next(batches) == expected[100:1100]
+        checkpoint = stream.checkpoint()
+    assert checkpoint['position'] is not None
+    with Stream(source, resume_from=checkpoint) as stream:
+        assert stream.read(limit=100) == expected[1100:1200]
+        checkpoint = stream.checkpoint()
+    assert checkpoint['position'] is not None
+    with Stream(source, resume_from=checkpoint) as stream:
+        assert stream.read() == expected[1200:]
+
+
+@pytest.mark.parametrize('format', ['csv', 'tsv', 'ndjson'])
+def test_stream_checkpoint_not_resumable(tmpdir, format):
+    source = write_long_source(tmpdir, format)
+    with Stream(source, headers=1) as stream:
+        expected = stream.read()
+    with Stream(source, headers=1) as stream:
+        assert stream.read(limit=3000) == expected[:3000]
+        checkpoint = stream.checkpoint()
+    assert checkpoint['position'] is None
+    with Stream(source, headers=1, resume_from=checkpoint) as stream:
+        assert stream.read() == expected[3000:]
+
+
+def test_stream_checkpoint_read_ahead():
+    def identity(extended_rows):
+        for extended_row in extended_rows:
+            yield extended_row
+    source = [[number] for number in range(1, 201)]
+    with Stream(source, post_parse=[identity]) as stream:
+        assert stream.read(limit=150) == source[:150]
+        checkpoint = stream.checkpoint()
+    assert checkpoint['position'] is None
+    with Stream(source, resume_from=checkpoint) as stream:
+        assert stream.read() == source[150:]
+
+
+@pytest.mark.skipif(six.PY2, reason='not supported for Python2')
+def test_stream_checkpoint_outdated(tmpdir):
+    source = write_long_source(tmpdir, 'csv')
+    with Stream(source, headers=1, resumable=True) as stream:
+        stream.read(limit=4000)
+        checkpoint = stream.checkpoint()
+    with io.open(source, 'a', encoding='utf-8') as file:
+        file.write('5000,中国人 5000\n')
+    with pytest.warns(UserWarning):
+        with Stream(source, headers=1, resume_from=checkpoint) as stream:
+            assert stream.read()[-2:] == [['4999', '中国人 4999'], ['5000', '中国人 5000']]
+
+
+# Read ahead
+
+@pytest.mark.parametrize('format', ['csv', 'ndjson'])
+def test_stream_read_ahead(tmpdir, format):
+    source = write_long_source(tmpdir, format)
+    with Stream(source, headers=1) as stream:
+        expected = stream.read(extended=True)
+    with Stream(source, headers=1, sample_size=10, read_ahead=2) as stream:
+        assert stream.read(extended=True) == expected
+        stream.reset()
+        assert stream.read(extended=True, limit=1500) == expected[:1500]
+        assert stream.read(extended=True, limit=10) == expected[1500:1510]
+        assert sum(stream.iter_batches(size=700, extended=True), []) == expected[1510:]
+        stream.reset()
+        assert sum(stream.iter_batches(size=700, extended=True), []) == expected
+
+
+def test_stream_read_ahead_compressed():
+    with Stream('data/table.csv.gz', headers=1, read_ahead=1) as stream:
+        assert stream.read() == [['1', 'english'], ['2', '中国人']]
+
+
+def test_stream_read_ahead_error(tmpdir):
+    path = str(tmpdir.join('table.csv'))
+    with io.open(path, 'wb') as file:
+        file.write(b'id\n' + b'1\n' * 5000 + b'\xff\n')
+    with Stream(path, headers=1, encoding='utf-8', sample_size=10, read_ahead=2) as stream:
+        with pytest.raises(exceptions.EncodingError):
+            stream.read()
+
+
+def test_stream_read_ahead_sql_not_thread_safe(tmpdir):
+    path = str(tmpdir.join('database.db'))
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE data (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.executemany('INSERT INTO data VALUES (?, ?)', [(id, 'name') for id in range(3000)])
+    conn.commit()
+    conn.close()
+    source = 'sqlite:///%s' % path
+    with pytest.warns(UserWarning, match='read_ahead'):
+        stream = Stream(source, table='data', headers=1, order_by='id', read_ahead=2)
+        stream.open()
+    with stream:
+        assert len(stream.read()) == 3000
+        stream.reset()
+        assert stream.read(limit=2) == [[0, 'name'], [1, 'name']]
+        assert len(stream.read()) == 2998
+
+
+def test_stream_read_ahead_close_and_checkpoint(tmpdir):
+    source = write_long_source(tmpdir, 'csv')
+    stream = Stream(source, headers=1, sample_size=10, read_ahead=1)
+    stream.open()
+    assert stream.read(limit=100)[-1] == ['100', '中国人 100']
+    assert stream.checkpoint()['position'] is None
+    stream.close()
+    assert stream.closed
+
+
+# Profile
+
+def write_profile_source(tmpdir, name, headers):
+    path = str(tmpdir.join(name))
+    with io.open(path, 'w', encoding='latin1') as file:
+        file.write('%s\n' % ';'.join(headers))
+        file.write('1;"café; crème"\n2;"naïve"\n')
+    return path
+
+
+def test_stream_profile(tmpdir):
+    source1 = write_profile_source(tmpdir, 'table1.csv', ['id', 'name'])
+    source2 = write_profile_source(tmpdir, 'table2.csv', ['id', 'name'])
+    with Stream(source1, headers=1) as stream:
+        expected = stream.read()
+        profile = json.loads(json.dumps(stream.profile()))
+    assert profile['scheme'] == 'file'
+    assert profile['format'] == 'csv'
+    assert profile['compression'] is None
+    assert profile['encoding'] == 'iso8859-1'
+    assert profile['dialect']['delimiter'] == ';'
+    assert profile['headers'] == ['id', 'name']
+    with mock.patch('csv.Sniffer', side_effect=RuntimeError('no sniffing')):
+        with Stream(source2, headers=1, profile=profile) as stream:
+            assert stream.encoding == 'iso8859-1'
+            assert stream.dialect['delimiter'] == ';'
+            assert stream.read() == expected
+
+
+def test_stream_profile_mismatch(tmpdir):
+    source1 = write_profile_source(tmpdir, 'table1.csv', ['id', 'name'])
+    source2 = write_profile_source(tmpdir, 'table2.csv', ['id', 'title'])
+    with Stream(source1, headers=1) as stream:
+        profile = stream.profile()
+    with pytest.warns(UserWarning) as record:
+        with Stream(source2, headers=1, profile=profile) as stream:
+            assert stream.headers == ['id', 'title']
+            assert stream.read() == [['1', 'café; crème'], ['2', 'naïve']]
+    assert 'profile' in str(record[0].message)
+
+
+# Columns
+
+def test_stream_read_columns():
+    source = [['id', 'score', 'name'], [1, 1.5, 'a'], [2, 2, 'b'], [3, 3.5, None]]
+    with Stream(source, headers=1) as stream:
+        id, score, name = [list(column) for column in stream.read_columns()]
+        assert id == [1, 2, 3]
+        assert score == [1.5, 2.0, 3.5]
+        assert name == ['a', 'b', None]
+
+
+def test_stream_read_columns_keyed():
+    with Stream('data/table.csv', headers=1) as stream:
+        assert stream.read_columns(keyed=True) == {
+            'id': ['1', '2'], 'name': ['english', '中国人']}
+        assert list(stream.read_columns(keyed=True)) == ['id', 'name']
+
+
+def test_stream_read_columns_pick_fields():
+    source = [['id', 'score', 'name'], [1, 1.5, 'a'], [2, 2.5, 'b']]
+    with Stream(source, headers=1, pick_fields=['name', 'id']) as stream:
+        columns = stream.read_columns(keyed=True)
+        assert stream.headers == ['id', 'name']
+        assert list(columns) == ['id', 'name']
+        assert list(columns['id']) == [1, 2]
+        assert columns['name'] == ['a', 'b']
+
+
+def test_stream_read_columns_ragged_rows():
+    source = [['id', 'name'], [1], [2, 'b', 'extra']]
+    with Stream(source, headers=1) as stream:
+        id, name = stream.read_columns()
+        assert list(id) == [1, 2]
+        assert name == [None, 'b']
+    with Stream([[1], [2, 'b']]) as stream:
+        id, name = stream.read_columns()
+        assert list(id) == [1, 2]
+        assert name == [None, 'b']
+
+
+def test_stream_read_columns_numeric_storage():
+    source = [[1, 2 ** 70], [2, 1]]
+    with Stream(source) as stream:
+        id, big = stream.read_columns()
+        assert type(id).__name__ in ['array', 'ndarray']
+        assert big == [2 ** 70, 1]
+
+
+def test_stream_read_columns_numpy():
+    numpy = pytest.importorskip('numpy')
+    with Stream([[1, 1.5], [2, 2.5]]) as stream:
+        id, score = stream.read_columns()
+        assert isinstance(id, numpy.ndarray)
+        assert id.tolist() == [1, 2]
+        assert score.tolist() == [1.5, 2.5]
+
+
+def test_stream_read_columns_keyed_without_headers():
+    with Stream('data/table.csv') as stream:
+        with pytest.raises(exceptions.TabulatorException) as excinfo:
+            stream.read_columns(keyed=True)
+        assert 'headers' in str(excinfo.value)
+
+
+def test_stream_iter_column_batches():
+    source = [['id', 'name'], [1, 'a'], [2, 'b'], [3, 'c']]
+    with Stream(source, headers=1) as stream:
+        batches = list(stream.iter_column_batches(size=2, keyed=True))
+        assert [list(batch['id']) for batch in batches] == [[1, 2], [3]]
+        assert [batch['name'] for batch in batches] == [['a', 'b'], ['c']]
+
+
 # Custom loaders
 
 
@@ -1054,6 +1620,28 @@ def test_stream_local_csv_zip_multiple_open():
     stream.close()
 
 
+@pytest.mark.skipif(six.PY2, reason='Support only for Python3')
+def test_stream_local_csv_zip_not_spooled():
+    with mock.patch('tempfile.NamedTemporaryFile') as spool:
+        with Stream('data/table.csv.zip', headers=1, sample_size=1) as stream:
+            assert stream.read() == [['1', 'english'], ['2', '中国人']]
+            stream.reset()
+            assert stream.read() == [['1', 'english'], ['2', '中国人']]
+    assert not spool.called
+
+
+@pytest.mark.skipif(six.PY2, reason='Support only for Python3')
+def test_stream_local_xlsx_zip_spooled(tmpdir):
+    source = str(tmpdir.join('table.xlsx.zip'))
+    with zipfile.ZipFile(source, 'w') as archive:
+        archive.write('data/table.xlsx', 'table.xlsx')
+    with Stream(source, headers=1) as stream:
+        assert stream.format == 'xlsx'
+        assert stream.read() == [[1, 'english'], [2, '中国人']]
+        stream.reset()
+        assert stream.read() == [[1, 'english'], [2, '中国人']]
+
+
 @pytest.mark.skipif(six.PY2, reason='Support only for Python3')
 def test_stream_local_csv_gz():
     with Stream('data/table.csv.gz') as stream: